@@ -1,40 +1,165 @@
-from aiopytesseract.commands import (
-    confidence,
-    deskew,
-    get_languages,
-    get_tesseract_version,
-    image_to_boxes,
-    image_to_data,
-    image_to_hocr,
-    image_to_osd,
-    image_to_pdf,
-    image_to_string,
-    languages,
-    run,
-    tesseract_parameters,
-    tesseract_version,
-)
-from aiopytesseract.models import OSD, Box, Data, Parameter
+import importlib
+
+# Not `from typing import TYPE_CHECKING`: importing `typing` alone would
+# blow the import time budget (tests/test_lazy_imports.py). Type checkers
+# treat a module-level `TYPE_CHECKING = False` the same way.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    # `name as name` marks the re-exports, `__all__` is derived below
+    from aiopytesseract.accounting import (
+        UsageTracker as UsageTracker,
+        accounted as accounted,
+    )
+    from aiopytesseract.cascade import Cascade as Cascade
+    from aiopytesseract.commands import (
+        confidence as confidence,
+        deskew as deskew,
+        get_languages as get_languages,
+        get_tesseract_version as get_tesseract_version,
+        image_to_alto as image_to_alto,
+        image_to_alto_lines as image_to_alto_lines,
+        image_to_alto_stream as image_to_alto_stream,
+        image_to_boxes as image_to_boxes,
+        image_to_data as image_to_data,
+        image_to_hocr as image_to_hocr,
+        image_to_osd as image_to_osd,
+        image_to_pdf as image_to_pdf,
+        image_to_regions as image_to_regions,
+        image_to_string as image_to_string,
+        languages as languages,
+        run as run,
+        tesseract_parameters as tesseract_parameters,
+        tesseract_version as tesseract_version,
+    )
+    from aiopytesseract.dedup import FrameDeduplicator as FrameDeduplicator
+    from aiopytesseract.degradation import DegradationPolicy as DegradationPolicy
+    from aiopytesseract.hedging import Hedger as Hedger
+    from aiopytesseract.index import WordIndex as WordIndex
+    from aiopytesseract.language_routing import (
+        LanguageRouter as LanguageRouter,
+        language_router as language_router,
+    )
+    from aiopytesseract.models import (
+        OSD as OSD,
+        Accounted as Accounted,
+        Box as Box,
+        CascadeLine as CascadeLine,
+        CascadeResult as CascadeResult,
+        Data as Data,
+        HedgeStats as HedgeStats,
+        ImageInfo as ImageInfo,
+        LanguageRun as LanguageRun,
+        Parameter as Parameter,
+        Posting as Posting,
+        Region as Region,
+        SpeculativeResult as SpeculativeResult,
+        String as String,
+        TextLine as TextLine,
+        Tier as Tier,
+        TieredResult as TieredResult,
+        Usage as Usage,
+        UsageStats as UsageStats,
+        WarmupReport as WarmupReport,
+    )
+    from aiopytesseract.parsing import (
+        ParsePolicy as ParsePolicy,
+        parse_policy as parse_policy,
+    )
+    from aiopytesseract.pipeline import ocr_stream as ocr_stream
+    from aiopytesseract.profile import OCRProfile as OCRProfile
+    from aiopytesseract.scheduler import (
+        Scheduler as Scheduler,
+        ThroughputModel as ThroughputModel,
+    )
+    from aiopytesseract.server import OCRClient as OCRClient, OCRServer as OCRServer
+    from aiopytesseract.speculative import speculate as speculate
+    from aiopytesseract.sync import SyncClient as SyncClient
+    from aiopytesseract.tessdata import warm_tessdata as warm_tessdata
 
 __version__ = "1.1.0"
-__all__ = [
-    "OSD",
-    "Box",
-    "Data",
-    "Parameter",
-    "__version__",
-    "confidence",
-    "deskew",
-    "get_languages",
-    "get_tesseract_version",
-    "image_to_boxes",
-    "image_to_data",
-    "image_to_hocr",
-    "image_to_osd",
-    "image_to_pdf",
-    "image_to_string",
-    "languages",
-    "run",
-    "tesseract_parameters",
-    "tesseract_version",
-]
+
+# public name -> module that defines it, imported on first attribute access
+# (PEP 562) so `import aiopytesseract` stays cheap for short-lived processes.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "OSD": "aiopytesseract.models",
+    "Accounted": "aiopytesseract.models",
+    "Box": "aiopytesseract.models",
+    "Cascade": "aiopytesseract.cascade",
+    "CascadeLine": "aiopytesseract.models",
+    "CascadeResult": "aiopytesseract.models",
+    "Data": "aiopytesseract.models",
+    "DegradationPolicy": "aiopytesseract.degradation",
+    "FrameDeduplicator": "aiopytesseract.dedup",
+    "HedgeStats": "aiopytesseract.models",
+    "Hedger": "aiopytesseract.hedging",
+    "ImageInfo": "aiopytesseract.models",
+    "LanguageRouter": "aiopytesseract.language_routing",
+    "LanguageRun": "aiopytesseract.models",
+    "OCRClient": "aiopytesseract.server",
+    "OCRProfile": "aiopytesseract.profile",
+    "OCRServer": "aiopytesseract.server",
+    "Parameter": "aiopytesseract.models",
+    "ParsePolicy": "aiopytesseract.parsing",
+    "Posting": "aiopytesseract.models",
+    "Region": "aiopytesseract.models",
+    "Scheduler": "aiopytesseract.scheduler",
+    "SpeculativeResult": "aiopytesseract.models",
+    "String": "aiopytesseract.models",
+    "SyncClient": "aiopytesseract.sync",
+    "TextLine": "aiopytesseract.models",
+    "ThroughputModel": "aiopytesseract.scheduler",
+    "Tier": "aiopytesseract.models",
+    "TieredResult": "aiopytesseract.models",
+    "Usage": "aiopytesseract.models",
+    "UsageStats": "aiopytesseract.models",
+    "UsageTracker": "aiopytesseract.accounting",
+    "WarmupReport": "aiopytesseract.models",
+    "WordIndex": "aiopytesseract.index",
+    "accounted": "aiopytesseract.accounting",
+    "confidence": "aiopytesseract.commands",
+    "deskew": "aiopytesseract.commands",
+    "get_languages": "aiopytesseract.commands",
+    "get_tesseract_version": "aiopytesseract.commands",
+    "image_to_alto": "aiopytesseract.commands",
+    "image_to_alto_lines": "aiopytesseract.commands",
+    "image_to_alto_stream": "aiopytesseract.commands",
+    "image_to_boxes": "aiopytesseract.commands",
+    "image_to_data": "aiopytesseract.commands",
+    "image_to_hocr": "aiopytesseract.commands",
+    "image_to_osd": "aiopytesseract.commands",
+    "image_to_pdf": "aiopytesseract.commands",
+    "image_to_regions": "aiopytesseract.commands",
+    "image_to_string": "aiopytesseract.commands",
+    "language_router": "aiopytesseract.language_routing",
+    "languages": "aiopytesseract.commands",
+    "ocr_stream": "aiopytesseract.pipeline",
+    "parse_policy": "aiopytesseract.parsing",
+    "run": "aiopytesseract.commands",
+    "speculate": "aiopytesseract.speculative",
+    "tesseract_parameters": "aiopytesseract.commands",
+    "tesseract_version": "aiopytesseract.commands",
+    "warm_tessdata": "aiopytesseract.tessdata",
+}
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        value: object = getattr(importlib.import_module(module_name), name)
+    else:
+        # keep `aiopytesseract.<submodule>` working without an explicit import.
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
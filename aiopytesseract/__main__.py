@@ -0,0 +1,3 @@
+from aiopytesseract.cli import main
+
+raise SystemExit(main())
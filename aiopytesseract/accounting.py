@@ -0,0 +1,284 @@
+"""Per-call resource usage of tesseract processes, from `os.wait4`.
+
+asyncio reaps its child processes with `waitpid`, which discards their
+resource usage. Calls run under `accounted` or `UsageTracker.run` spawn
+tesseract through `AccountedProcess` instead, which reaps it with
+`os.wait4` and records the child's CPU time and peak RSS.
+"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import threading
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar
+
+from aiopytesseract.models import Accounted, Usage, UsageStats
+from aiopytesseract.profile import call_options
+
+if TYPE_CHECKING:
+    from resource import struct_rusage
+
+P = ParamSpec("P")
+ResultT = TypeVar("ResultT")
+# command, lang, psm, oem
+UsageKey = tuple[str, str, int, int]
+
+_usage: ContextVar[list[Usage] | None] = ContextVar(
+    "aiopytesseract_usage", default=None
+)
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+_MAX_RSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def current_usage_collector() -> list[Usage] | None:
+    """Usage list of the accounted call running in the current context."""
+    return _usage.get()
+
+
+async def accounted(
+    func: Callable[Concatenate[bytes, P], Awaitable[ResultT]],
+    image: str | bytes,
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> Accounted[ResultT]:
+    """Run `func(image, *args, **kwargs)` and return its result with its usage.
+
+    The usage sums every tesseract process the call ran, e.g. the OSD pass
+    of `lang="auto"`. Where `os.wait4` is missing (Windows) it stays zero.
+
+    :param func: OCR command, e.g. `aiopytesseract.image_to_string`.
+    :param image: image input to tesseract. (valid values: str, bytes)
+    """
+    collected: list[Usage] = []
+    token = _usage.set(collected)
+    try:
+        result = await func(image, *args, **kwargs)  # type: ignore[arg-type]
+    finally:
+        _usage.reset(token)
+    return Accounted(result, Usage.total(collected))
+
+
+class UsageTracker:
+    """Aggregate the usage of calls per (command, lang, psm, oem).
+
+    The command is the function name; `lang`, `psm` and `oem` are bound
+    from the call's positional or keyword arguments, falling back to the
+    command's defaults, or taken from a `profile`.
+    """
+
+    def __init__(self) -> None:
+        self._stats: dict[UsageKey, UsageStats] = {}
+
+    @property
+    def stats(self) -> dict[UsageKey, UsageStats]:
+        """Aggregated usage so far, per (command, lang, psm, oem)."""
+        return dict(self._stats)
+
+    async def run(
+        self,
+        func: Callable[Concatenate[bytes, P], Awaitable[ResultT]],
+        image: str | bytes,
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Accounted[ResultT]:
+        """Run `func(image, *args, **kwargs)` with `accounted` and record its usage.
+
+        :param func: OCR command, e.g. `aiopytesseract.image_to_string`.
+        :param image: image input to tesseract. (valid values: str, bytes)
+        """
+        result = await accounted(func, image, *args, **kwargs)
+        self.record(_usage_key(func, image, args, kwargs), result.usage)
+        return result
+
+    def record(self, key: UsageKey, usage: Usage) -> None:
+        """Add the usage of one call to `key`."""
+        self._stats[key] = self._stats.get(key, UsageStats()).add(usage)
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+def _usage_key(
+    func: object,
+    image: object,
+    args: tuple[object, ...],
+    kwargs: dict[str, object],
+) -> UsageKey:
+    name = getattr(func, "__name__", type(func).__name__)
+    return (name, *call_options(func, image, args, kwargs))
+
+
+class AccountedProcess:
+    """`asyncio.subprocess.Process` look-alike reaped with `os.wait4`.
+
+    Use `spawn_accounted` to create one. The exit is watched with a pidfd
+    where available, or else by a thread blocked in `os.wait4`.
+    """
+
+    def __init__(
+        self,
+        popen: "subprocess.Popen[bytes]",
+        stdin: asyncio.StreamWriter,
+        stdout: asyncio.StreamReader,
+        stderr: asyncio.StreamReader,
+        collector: list[Usage],
+        started: float,
+    ) -> None:
+        self._popen = popen
+        self.pid = popen.pid
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: int | None = None
+        self.usage: Usage | None = None
+        self._collector = collector
+        self._started = started
+        self._loop = asyncio.get_running_loop()
+        self._exited: asyncio.Future[int] = self._loop.create_future()
+        self._watch()
+
+    def _watch(self) -> None:
+        if sys.platform == "linux":
+            with suppress(OSError):  # kernel older than 5.3
+                pidfd = os.pidfd_open(self.pid)
+                self._loop.add_reader(pidfd, self._reap_pidfd, pidfd)
+                return
+        threading.Thread(
+            target=self._reap_blocking,
+            name=f"aiopytesseract-wait4-{self.pid}",
+            daemon=True,
+        ).start()
+
+    def _reap_pidfd(self, pidfd: int) -> None:
+        pid, status, rusage = os.wait4(self.pid, os.WNOHANG)
+        if pid == 0:
+            return
+        self._loop.remove_reader(pidfd)
+        os.close(pidfd)
+        self._exit(status, rusage)
+
+    def _reap_blocking(self) -> None:
+        _, status, rusage = os.wait4(self.pid, 0)
+        self._loop.call_soon_threadsafe(self._exit, status, rusage)
+
+    def _exit(self, status: int, rusage: "struct_rusage") -> None:
+        self.returncode = os.waitstatus_to_exitcode(status)
+        # keeps Popen from waiting for, or warning about, a reaped child
+        self._popen.returncode = self.returncode
+        self.usage = Usage(
+            user=rusage.ru_utime,
+            system=rusage.ru_stime,
+            max_rss=rusage.ru_maxrss * _MAX_RSS_UNIT,
+            wall=self._loop.time() - self._started,
+            processes=1,
+        )
+        self._collector.append(self.usage)
+        if not self.stdin.is_closing():
+            self.stdin.close()
+        self._exited.set_result(self.returncode)
+
+    async def wait(self) -> int:
+        return await asyncio.shield(self._exited)
+
+    def send_signal(self, signum: int) -> None:
+        # not Popen.send_signal, its poll() would reap the child without usage
+        if self.returncode is not None:
+            raise ProcessLookupError()
+        os.kill(self.pid, signum)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    async def communicate(self, data: bytes | None = None) -> tuple[bytes, bytes]:
+        async def feed() -> None:
+            if data:
+                self.stdin.write(data)
+                # tesseract may exit before reading all of it
+                with suppress(BrokenPipeError, ConnectionResetError):
+                    await self.stdin.drain()
+            self.stdin.close()
+
+        _, stdout, stderr = await asyncio.gather(
+            feed(), self.stdout.read(), self.stderr.read()
+        )
+        await self.wait()
+        return stdout, stderr
+
+
+async def spawn_accounted(
+    argv: list[str],
+    env: dict[str, str],
+    collector: list[Usage],
+    preexec_fn: Callable[[], None] | None = None,
+) -> AccountedProcess:
+    """Start `argv` with pipes wired to asyncio streams and reap it with `os.wait4`.
+
+    :param argv: executable path and arguments.
+    :param env: process environment.
+    :param collector: list the usage is appended to once the process exits.
+    :param preexec_fn: child setup run before exec. (default: None)
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    def start() -> "subprocess.Popen[bytes]":
+        return subprocess.Popen(  # noqa: S603
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            close_fds=False,
+            preexec_fn=preexec_fn,
+        )
+
+    # fork + exec blocks for milliseconds, longer with a large parent
+    spawning = loop.run_in_executor(None, start)
+    try:
+        popen = await asyncio.shield(spawning)
+    except asyncio.CancelledError:
+        # the process may still start after the cancellation
+        spawning.add_done_callback(_discard_spawned)
+        raise
+    try:
+        stdout = asyncio.StreamReader(loop=loop)
+        stderr = asyncio.StreamReader(loop=loop)
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(stdout, loop=loop), popen.stdout
+        )
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(stderr, loop=loop), popen.stderr
+        )
+        transport, protocol = await loop.connect_write_pipe(
+            lambda: asyncio.StreamReaderProtocol(asyncio.StreamReader(), loop=loop),
+            popen.stdin,
+        )
+    except BaseException:
+        _discard(popen)
+        raise
+    stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+    return AccountedProcess(popen, stdin, stdout, stderr, collector, started)
+
+
+def _discard(popen: "subprocess.Popen[bytes]") -> None:
+    # kill a process nobody will wait for, reaped off the event loop
+    with suppress(ProcessLookupError):
+        popen.kill()
+    threading.Thread(
+        target=popen.wait, name=f"aiopytesseract-wait-{popen.pid}", daemon=True
+    ).start()
+
+
+def _discard_spawned(spawning: "asyncio.Future[subprocess.Popen[bytes]]") -> None:
+    if not spawning.cancelled() and spawning.exception() is None:
+        _discard(spawning.result())
@@ -0,0 +1,73 @@
+from typing import Protocol
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from aiopytesseract.models import String, TextLine
+
+
+class AltoSink(Protocol):
+    """Anything with a `write(bytes)` method, sync or async."""
+
+    def write(self, data: bytes, /) -> object: ...
+
+
+class AltoParser:
+    """Incremental ALTO XML parser.
+
+    Chunks are fed as they arrive and every `TextLine` is returned as soon
+    as its closing tag is parsed. Parsed lines are detached from the tree,
+    so memory use is bounded by the largest line instead of the whole page.
+    """
+
+    def __init__(self) -> None:
+        self._parser: XMLPullParser[Element] = XMLPullParser(events=("start", "end"))
+        self._stack: list[Element] = []
+
+    def feed(self, data: bytes) -> list[TextLine]:
+        self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> list[TextLine]:
+        self._parser.close()
+        return self._read_events()
+
+    def _read_events(self) -> list[TextLine]:
+        lines = []
+        for event in self._parser.read_events():
+            element = event[-1]
+            if not isinstance(element, Element):
+                continue
+            if event[0] == "start":
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            if _local_name(element.tag) == "TextLine":
+                lines.append(_text_line(element))
+                if self._stack:
+                    self._stack[-1].remove(element)
+        return lines
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text_line(element: Element) -> TextLine:
+    return TextLine(
+        id=element.get("ID", ""),
+        hpos=int(float(element.get("HPOS", 0))),
+        vpos=int(float(element.get("VPOS", 0))),
+        width=int(float(element.get("WIDTH", 0))),
+        height=int(float(element.get("HEIGHT", 0))),
+        strings=tuple(
+            String(
+                content=child.get("CONTENT", ""),
+                hpos=int(float(child.get("HPOS", 0))),
+                vpos=int(float(child.get("VPOS", 0))),
+                width=int(float(child.get("WIDTH", 0))),
+                height=int(float(child.get("HEIGHT", 0))),
+                wc=float(child.get("WC", 0)),
+            )
+            for child in element
+            if _local_name(child.tag) == "String"
+        ),
+    )
@@ -1,51 +1,148 @@
 import asyncio
+import logging
+import os
 import shlex
+import shutil
 import subprocess
 import sys
 from asyncio.subprocess import Process
 from collections import deque
-from functools import singledispatch
+from collections.abc import AsyncGenerator
+from contextlib import aclosing, suppress
+from functools import lru_cache, singledispatch
 from pathlib import Path
+from typing import cast
+
+from attrs import evolve
 
 from aiopytesseract._logger import logger
+from aiopytesseract.accounting import current_usage_collector, spawn_accounted
 from aiopytesseract.constants import (
+    AIOPYTESSERACT_AUTO_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
     AIOPYTESSERACT_DEFAULT_ENCODING,
     AIOPYTESSERACT_DEFAULT_TIMEOUT,
     OUTPUT_FILE_EXTENSIONS,
     TESSERACT_CMD,
+    TESSERACT_ENVIRONMENT,
+)
+from aiopytesseract.exceptions import (
+    TesseractNotFoundError,
+    TesseractRuntimeError,
+    TesseractTimeoutError,
 )
-from aiopytesseract.exceptions import TesseractRuntimeError, TesseractTimeoutError
+from aiopytesseract.language_routing import resolve_language
+from aiopytesseract.preprocessing import Preprocess
+from aiopytesseract.profile import OCRProfile
+from aiopytesseract.resources import current_resource_policy
 from aiopytesseract.returncode import ReturnCode
+from aiopytesseract.tessdata import staged_tessdata_dir
 from aiopytesseract.validators import (
     file_exists,
+    image_is_valid,
     language_is_valid,
     oem_is_valid,
     psm_is_valid,
 )
+from aiopytesseract.wordlists import WordList, wordlist_files
 
 
 async def execute_cmd(
     cmd_args: str, timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT
 ) -> Process:
-    logger.debug(
-        f"aiopytesseract command: '{TESSERACT_CMD} {shlex.join(shlex.split(cmd_args))}'"
-    )
-    proc = await asyncio.wait_for(
-        asyncio.create_subprocess_exec(
-            TESSERACT_CMD,
-            *shlex.split(cmd_args),
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            creationflags=_get_subprocess_creation_flags(),
-        ),
-        timeout=timeout,
-    )
+    args = shlex.split(cmd_args)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"aiopytesseract command: '{TESSERACT_CMD} {shlex.join(args)}'")
+    return await spawn(args, timeout)
+
+
+async def spawn(cmd_args: list[str], timeout: float) -> Process:
+    """Start tesseract under the current resource policy.
+
+    The binary path is resolved once and the environment trimmed to what
+    tesseract reads. With an absolute path and `close_fds=False` (Python
+    fds are not inheritable anyway) `subprocess` can use `posix_spawn`
+    instead of fork + exec, unless the policy sets limits in the child.
+    Inside `accounted` the process is reaped with `os.wait4` to record its
+    resource usage.
+    """
+    policy = current_resource_policy()
+    env = _environment()
+    cpu_set = preexec_fn = None
+    if policy is not None:
+        cpu_set = policy.reserve()
+        env.update(policy.environment(cpu_set))
+        preexec_fn = policy.preexec(cpu_set)
+    collector = current_usage_collector()
+    try:
+        if collector is not None and hasattr(os, "wait4"):
+            # asyncio reaps with waitpid, which drops the child's rusage
+            accounted = await asyncio.wait_for(
+                spawn_accounted(
+                    [_which(TESSERACT_CMD), *cmd_args], env, collector, preexec_fn
+                ),
+                timeout=timeout,
+            )
+            proc = cast(Process, accounted)
+        else:
+            proc = await asyncio.wait_for(
+                asyncio.create_subprocess_exec(
+                    _which(TESSERACT_CMD),
+                    *cmd_args,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=env,
+                    close_fds=False,
+                    preexec_fn=preexec_fn,
+                    creationflags=_get_subprocess_creation_flags(),
+                ),
+                timeout=timeout,
+            )
+    except BaseException:
+        if policy is not None:
+            policy.release(cpu_set)
+        raise
     if proc is None:
         raise TesseractRuntimeError() from None
+    if policy is not None:
+        policy.watch(proc, cpu_set)
     return proc
 
 
+@lru_cache(maxsize=8)
+def _which(cmd: str) -> str:
+    path = shutil.which(cmd)
+    if path is None:
+        raise TesseractNotFoundError()
+    return path
+
+
+def _environment() -> dict[str, str]:
+    # named lookups, scanning the whole os.environ costs more than the spawn
+    environ = os.environ
+    return {name: environ[name] for name in TESSERACT_ENVIRONMENT if name in environ}
+
+
+async def communicate(
+    proc: Process, image: bytes, timeout: float
+) -> tuple[bytes, bytes]:
+    """Feed `image` to tesseract, the process is killed on timeout or cancellation."""
+    try:
+        return await asyncio.wait_for(proc.communicate(image), timeout=timeout)
+    except asyncio.TimeoutError:
+        kill(proc)
+        raise TesseractTimeoutError(timeout) from None
+    except asyncio.CancelledError:
+        kill(proc)
+        raise
+
+
+def kill(proc: Process) -> None:
+    with suppress(ProcessLookupError):
+        proc.kill()
+
+
 @singledispatch
 async def execute(
     image: str | bytes,
@@ -55,11 +152,13 @@ async def execute(
     oem: int,
     timeout: float,
     lang: str | None = None,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> bytes:
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -73,11 +172,13 @@ async def _(
     oem: int,
     timeout: float,
     lang: str | None = None,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> bytes:
     await file_exists(image)
     response: bytes = await execute(
@@ -93,6 +194,8 @@ async def _(
         tessdata_dir=tessdata_dir,
         config=config,
         encoding=encoding,
+        preprocess=preprocess,
+        profile=profile,
     )
     return response
 
@@ -106,48 +209,220 @@ async def _(
     oem: int,
     timeout: float,
     lang: str | None = None,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> bytes:
+    await image_is_valid(image)
+    if profile is not None:
+        dpi = profile.dpi
+    if preprocess is not None:
+        image, dpi = await preprocess.apply(image, dpi)
+    with wordlist_files(user_words, user_patterns) as (words_file, patterns_file):
+        if profile is not None:
+            cmd_args = await profile_cmd_args(
+                image, profile, output_format, timeout, dpi=dpi
+            )
+        else:
+            if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+                lang = await resolve_language(image, timeout, tessdata_dir)
+            cmd_args = await _build_cmd_args(
+                output_extension=output_format,
+                dpi=dpi,
+                psm=psm,
+                oem=oem,
+                lang=lang,
+                user_words=words_file,
+                user_patterns=patterns_file,
+                tessdata_dir=tessdata_dir,
+                config=config,
+            )
+        return await _run(cmd_args, image, timeout, encoding)
+
+
+async def execute_source(
+    source: str,
+    profile: OCRProfile,
+    timeout: float,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+) -> bytes:
+    """Run tesseract on `source`, an image path or a list file of images.
+
+    Tesseract reads the input itself, e.g. every image of a list file in
+    one process; `profile.lang` must not be "auto".
+    """
+    cmd_args = await profile_cmd_args(b"", profile, "", timeout, source=source)
+    return await _run(cmd_args, b"", timeout, encoding)
+
+
+async def _run(
+    cmd_args: list[str], image: bytes, timeout: float, encoding: str
 ) -> bytes:
-    cmd_args = await _build_cmd_args(
-        output_extension=output_format,
-        dpi=dpi,
-        psm=psm,
-        oem=oem,
-        lang=lang,
-        user_words=user_words,
-        user_patterns=user_patterns,
-        tessdata_dir=tessdata_dir,
-        config=config,
-    )
-    proc = None
     try:
-        proc = await asyncio.wait_for(
-            asyncio.create_subprocess_exec(
-                TESSERACT_CMD,
-                *cmd_args,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                creationflags=_get_subprocess_creation_flags(),
-            ),
-            timeout=timeout,
-        )
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(image), timeout=timeout
-        )
+        proc = await spawn(cmd_args, timeout)
     except asyncio.TimeoutError:
-        if proc is not None:
-            proc.kill()
         raise TesseractTimeoutError(timeout) from None
+    stdout, stderr = await communicate(proc, image, timeout)
     if proc.returncode != ReturnCode.SUCCESS:
         raise TesseractRuntimeError(stderr.decode(encoding))
     return stdout
 
 
+@singledispatch
+def execute_stream(
+    image: str | bytes,
+    output_format: str,
+    dpi: int,
+    psm: int,
+    oem: int,
+    timeout: float,
+    lang: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    chunk_size: int = AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> AsyncGenerator[bytes, None]:
+    raise NotImplementedError(f"Type {type(image)} not supported.")
+
+
+@execute_stream.register(str)
+async def _(
+    image: str,
+    output_format: str,
+    dpi: int,
+    psm: int,
+    oem: int,
+    timeout: float,
+    lang: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    chunk_size: int = AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> AsyncGenerator[bytes, None]:
+    await file_exists(image)
+    async with aclosing(
+        execute_stream(
+            Path(image).read_bytes(),
+            output_format=output_format,
+            dpi=dpi,
+            psm=psm,
+            oem=oem,
+            timeout=timeout,
+            lang=lang,
+            user_words=user_words,
+            user_patterns=user_patterns,
+            tessdata_dir=tessdata_dir,
+            config=config,
+            encoding=encoding,
+            chunk_size=chunk_size,
+            preprocess=preprocess,
+            profile=profile,
+        )
+    ) as chunks:
+        async for chunk in chunks:
+            yield chunk
+
+
+@execute_stream.register(bytes)
+async def _(
+    image: bytes,
+    output_format: str,
+    dpi: int,
+    psm: int,
+    oem: int,
+    timeout: float,
+    lang: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    chunk_size: int = AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Yield tesseract stdout as it is produced instead of buffering it.
+
+    The whole command shares a single deadline of `timeout` seconds, stdin
+    is fed and stderr drained in background tasks so neither pipe can fill
+    up while the caller consumes stdout.
+    """
+    await image_is_valid(image)
+    if profile is not None:
+        dpi = profile.dpi
+    if preprocess is not None:
+        image, dpi = await preprocess.apply(image, dpi)
+    with wordlist_files(user_words, user_patterns) as (words_file, patterns_file):
+        if profile is not None:
+            cmd_args = await profile_cmd_args(
+                image, profile, output_format, timeout, dpi=dpi
+            )
+        else:
+            if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+                lang = await resolve_language(image, timeout, tessdata_dir)
+            cmd_args = await _build_cmd_args(
+                output_extension=output_format,
+                dpi=dpi,
+                psm=psm,
+                oem=oem,
+                lang=lang,
+                user_words=words_file,
+                user_patterns=patterns_file,
+                tessdata_dir=tessdata_dir,
+                config=config,
+            )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            proc = await spawn(cmd_args, timeout)
+        except asyncio.TimeoutError:
+            raise TesseractTimeoutError(timeout) from None
+        writer = asyncio.create_task(_feed_stdin(proc, image))
+        stderr = asyncio.create_task(proc.stderr.read())  # type: ignore
+        try:
+            while True:
+                chunk = await asyncio.wait_for(
+                    proc.stdout.read(chunk_size),  # type: ignore
+                    timeout=deadline - loop.time(),
+                )
+                if not chunk:
+                    break
+                yield chunk
+            await asyncio.wait_for(proc.wait(), timeout=deadline - loop.time())
+            await writer
+            if proc.returncode != ReturnCode.SUCCESS:
+                raise TesseractRuntimeError((await stderr).decode(encoding))
+        except asyncio.TimeoutError:
+            raise TesseractTimeoutError(timeout) from None
+        finally:
+            if proc.returncode is None:
+                kill(proc)
+                await proc.wait()
+            writer.cancel()
+            stderr.cancel()
+
+
+async def _feed_stdin(proc: Process, image: bytes) -> None:
+    # tesseract may exit before reading the whole image, its return code
+    # and stderr carry the real error.
+    with suppress(BrokenPipeError, ConnectionResetError):
+        proc.stdin.write(image)  # type: ignore
+        await proc.stdin.drain()  # type: ignore
+    proc.stdin.close()  # type: ignore
+
+
 async def execute_multi_output_cmd(
     image: bytes,
     output_file: str,
@@ -157,42 +432,39 @@ async def execute_multi_output_cmd(
     psm: int,
     oem: int,
     timeout: float,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> tuple[str, ...]:
-    cmd_args = await _build_cmd_args(
-        output_extension=output_format,
-        dpi=dpi,
-        psm=psm,
-        oem=oem,
-        user_words=user_words,
-        user_patterns=user_patterns,
-        tessdata_dir=tessdata_dir,
-        lang=lang,
-        output=output_file,
-        config=config,
-    )
-    proc = None
-    try:
-        proc = await asyncio.wait_for(
-            asyncio.create_subprocess_exec(
-                TESSERACT_CMD,
-                *cmd_args,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                creationflags=_get_subprocess_creation_flags(),
-            ),
-            timeout=timeout,
-        )
-        _, stderr = await asyncio.wait_for(proc.communicate(image), timeout=timeout)
-    except asyncio.TimeoutError:
-        if proc is not None:
-            proc.kill()
-        raise TesseractTimeoutError(timeout) from None
+    await image_is_valid(image)
+    with wordlist_files(user_words, user_patterns) as (words_file, patterns_file):
+        if profile is not None:
+            cmd_args = await profile_cmd_args(
+                image, profile, output_format, timeout, output=output_file
+            )
+        else:
+            if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+                lang = await resolve_language(image, timeout, tessdata_dir)
+            cmd_args = await _build_cmd_args(
+                output_extension=output_format,
+                dpi=dpi,
+                psm=psm,
+                oem=oem,
+                user_words=words_file,
+                user_patterns=patterns_file,
+                tessdata_dir=tessdata_dir,
+                lang=lang,
+                output=output_file,
+                config=config,
+            )
+        try:
+            proc = await spawn(cmd_args, timeout)
+        except asyncio.TimeoutError:
+            raise TesseractTimeoutError(timeout) from None
+        _, stderr = await communicate(proc, image, timeout)
     if proc.returncode != ReturnCode.SUCCESS:
         raise TesseractRuntimeError(stderr.decode(encoding))
     return tuple(
@@ -212,7 +484,8 @@ async def _build_cmd_args(
     output: str = "stdout",
     config: list[tuple[str, str]] | None = None,
 ) -> list[str]:
-    await asyncio.gather(psm_is_valid(psm), oem_is_valid(oem))
+    await psm_is_valid(psm)
+    await oem_is_valid(oem)
     # OCR options must occur before any configfile.
     # for details type: tesseract --help-extra
 
@@ -227,6 +500,7 @@ async def _build_cmd_args(
         cmd_args.appendleft(user_words)
         cmd_args.appendleft("--user-words")
 
+    tessdata_dir = staged_tessdata_dir(tessdata_dir, lang, psm)
     if tessdata_dir:
         cmd_args.appendleft(tessdata_dir)
         cmd_args.appendleft("--tessdata-dir")
@@ -245,8 +519,47 @@ async def _build_cmd_args(
     for ext in extension:
         cmd_args.append(ext)
 
-    logger.debug(f"aiopytesseract command: 'tesseract {shlex.join(cmd_args)}'")
-    return shlex.split(shlex.join(cmd_args))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"aiopytesseract command: 'tesseract {shlex.join(cmd_args)}'")
+    return list(cmd_args)
+
+
+async def profile_cmd_args(
+    image: bytes,
+    profile: OCRProfile,
+    output_extension: str,
+    timeout: float,
+    dpi: int | None = None,
+    output: str = "stdout",
+    source: str = "stdin",
+    psm: int | None = None,
+) -> list[str]:
+    """Tesseract arguments of `profile`, resolving lang="auto" against `image`.
+
+    `dpi` and `psm` replace the profile's, e.g. for commands that need a
+    fixed page segmentation mode.
+    """
+    # options were validated when the profile was built, only the parts
+    # that depend on the image are resolved per call.
+    lang = profile.lang
+    if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+        lang = await resolve_language(image, timeout, profile.tessdata_dir)
+    if dpi is None:
+        dpi = profile.dpi
+    if psm is None:
+        psm = profile.psm
+    if (lang, dpi, psm) != (profile.lang, profile.dpi, profile.psm):
+        profile = _derived_profile(profile, lang, dpi, psm)
+    cmd_args = profile.cmd_args(output_extension, output, source)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"aiopytesseract command: 'tesseract {shlex.join(cmd_args)}'")
+    return cmd_args
+
+
+@lru_cache(maxsize=64)
+def _derived_profile(profile: OCRProfile, lang: str, dpi: int, psm: int) -> OCRProfile:
+    # evolve validates and rebuilds the arguments, once per variant
+    return evolve(profile, lang=lang, dpi=dpi, psm=psm)
 
 
 def _get_subprocess_creation_flags() -> int:
@@ -0,0 +1,254 @@
+"""Recognize with a cheap tier first and escalate only what it is unsure of.
+
+Most pages recognise well with fast models and a simple segmentation, a
+few need the best models and full layout analysis. A cascade runs the
+first tier over the page and re-recognises, tier by tier, the lines (or
+the whole page) whose mean word confidence stays below a threshold.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from pathlib import Path
+
+from attrs import evolve
+
+from aiopytesseract._logger import logger
+from aiopytesseract.base_command import execute, execute_source
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_AUTO_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_CASCADE_THRESHOLD,
+    AIOPYTESSERACT_DEFAULT_DPI,
+    AIOPYTESSERACT_DEFAULT_ENCODING,
+    AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_OEM,
+    AIOPYTESSERACT_DEFAULT_PSM,
+    AIOPYTESSERACT_DEFAULT_TIMEOUT,
+)
+from aiopytesseract.language_routing import resolve_language
+from aiopytesseract.models import CascadeLine, CascadeResult, Data, Region, Tier
+from aiopytesseract.parsing import parse, parse_data
+from aiopytesseract.profile import OCRProfile
+from aiopytesseract.validators import file_exists, image_is_valid
+
+# page segmentation mode of line crops when the tier sets none
+_LINE_PSM = 7
+_WORD_LEVEL = 5
+_ESCALATIONS = ("line", "page")
+
+
+class Cascade:
+    """Escalate low-confidence lines, or pages, through increasingly costly tiers.
+
+    Every tier sets any of `tessdata_dir`, `oem`, `psm` and `dpi`. With
+    `escalate="line"` the lines below `threshold` are cropped and
+    recognised again together in one tesseract run per tier (requires
+    Pillow), a line keeps the result with the higher confidence. With
+    `escalate="page"`, or when a tier found no words at all, the whole page
+    runs again while its mean confidence stays below `threshold`; with
+    `escalate="page"` tiers may also `preprocess` the image.
+    Every line of the result records the tier that produced it.
+
+    :param tiers: tiers from cheapest to most accurate.
+    :param threshold: escalate below this mean word confidence. (default: 70)
+    :param escalate: what to recognise again, "line" or "page". (default: line)
+    :param padding: pixels added around each line crop. (default: 4)
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[Tier],
+        threshold: float = AIOPYTESSERACT_DEFAULT_CASCADE_THRESHOLD,
+        escalate: str = "line",
+        padding: int = 4,
+    ) -> None:
+        if not tiers:
+            raise ValueError("at least one tier is required")
+        if escalate not in _ESCALATIONS:
+            raise ValueError(f"escalate must be one of {_ESCALATIONS}, got: {escalate}")
+        if escalate == "line" and any(tier.preprocess for tier in tiers):
+            raise ValueError(
+                "preprocess changes the page coordinates, use escalate='page'"
+            )
+        if padding < 0:
+            raise ValueError(f"padding must not be negative, got: {padding}")
+        self.tiers = tuple(tiers)
+        self.threshold = threshold
+        self.escalate = escalate
+        self.padding = padding
+        # validates every tier once per language
+        self._profiles: dict[tuple[Tier, str, int], OCRProfile] = {}
+
+    async def run(
+        self,
+        image: str | bytes,
+        lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+        timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+        encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    ) -> CascadeResult:
+        """Recognize `image`, escalating through the tiers as needed.
+
+        :param image: image input to tesseract. (valid values: str, bytes)
+        :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
+        :param timeout: command timeout of each tesseract run. (default: 30)
+        :param encoding: decode bytes to string. (default: utf-8)
+        """
+        if isinstance(image, str):
+            await file_exists(image)
+            image = Path(image).read_bytes()
+        await image_is_valid(image)
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(image, timeout, self.tiers[0].tessdata_dir)
+        lines = await self._page(image, self.tiers[0], lang, timeout, encoding)
+        for tier in self.tiers[1:]:
+            # without a confident word there are no lines to crop, the
+            # whole page is retried instead
+            if self.escalate == "page" or not lines:
+                if _conf(lines) >= self.threshold:
+                    break
+                page = await self._page(image, tier, lang, timeout, encoding)
+                logger.debug(
+                    f"Cascade page retry with {tier}: {_conf(lines)} -> {_conf(page)}"
+                )
+                if _conf(page) > _conf(lines):
+                    lines = page
+                continue
+            failing = [
+                number
+                for number, line in enumerate(lines)
+                if line.conf < self.threshold
+            ]
+            if not failing:
+                break
+            retries = await self._lines(
+                image,
+                [lines[number] for number in failing],
+                tier,
+                lang,
+                timeout,
+                encoding,
+            )
+            logger.debug(f"Cascade retried {len(failing)} lines with {tier}")
+            for number, retry in zip(failing, retries, strict=True):
+                if retry is not None and retry.conf > lines[number].conf:
+                    lines[number] = retry
+        return CascadeResult(tuple(lines))
+
+    async def _page(
+        self, image: bytes, tier: Tier, lang: str, timeout: float, encoding: str
+    ) -> list[CascadeLine]:
+        profile = self._profile(tier, lang, AIOPYTESSERACT_DEFAULT_PSM)
+        if tier.preprocess is not None:
+            image, dpi = await tier.preprocess.apply(image, profile.dpi)
+            profile = evolve(profile, dpi=dpi)
+        rows = await _recognize("stdin", image, profile, timeout, encoding)
+        return [
+            CascadeLine(tuple(words), tier) for words in _group_lines(rows).values()
+        ]
+
+    async def _lines(
+        self,
+        image: bytes,
+        lines: list[CascadeLine],
+        tier: Tier,
+        lang: str,
+        timeout: float,
+        encoding: str,
+    ) -> list[CascadeLine | None]:
+        from aiofiles import tempfile
+
+        from aiopytesseract.regions import write_crops
+
+        profile = self._profile(tier, lang, _LINE_PSM)
+        regions = []
+        for line in lines:
+            left, top, right, bottom = line.bbox
+            x, y = max(left - self.padding, 0), max(top - self.padding, 0)
+            regions.append(
+                Region(x, y, right + self.padding - x, bottom + self.padding - y)
+            )
+        loop = asyncio.get_running_loop()
+        async with tempfile.TemporaryDirectory(prefix="aiopytesseract-") as tmpdir:
+            paths = await loop.run_in_executor(
+                None, write_crops, image, regions, tmpdir
+            )
+            listfile = Path(tmpdir) / "lines.txt"
+            listfile.write_text("".join(f"{path}\n" for path in paths))
+            rows = await _recognize(str(listfile), b"", profile, timeout, encoding)
+        # one page per crop, in list order
+        crops: dict[int, list[Data]] = {}
+        for line_words in _group_lines(rows).values():
+            crops.setdefault(line_words[0].page_num, []).extend(line_words)
+        retries: list[CascadeLine | None] = []
+        for page_num, (line, region) in enumerate(zip(lines, regions, strict=True), 1):
+            words = crops.get(page_num)
+            if not words:
+                retries.append(None)
+                continue
+            first = line.words[0]
+            retries.append(
+                CascadeLine(
+                    tuple(
+                        evolve(
+                            word,
+                            page_num=first.page_num,
+                            block_num=first.block_num,
+                            par_num=first.par_num,
+                            line_num=first.line_num,
+                            word_num=word_num,
+                            left=word.left + region.x,
+                            top=word.top + region.y,
+                        )
+                        for word_num, word in enumerate(words, 1)
+                    ),
+                    tier,
+                )
+            )
+        return retries
+
+    def _profile(self, tier: Tier, lang: str, psm: int) -> OCRProfile:
+        key = (tier, lang, psm)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = OCRProfile(
+                dpi=AIOPYTESSERACT_DEFAULT_DPI if tier.dpi is None else tier.dpi,
+                lang=lang,
+                psm=psm if tier.psm is None else tier.psm,
+                oem=AIOPYTESSERACT_DEFAULT_OEM if tier.oem is None else tier.oem,
+                tessdata_dir=tier.tessdata_dir,
+                config=[("tessedit_create_tsv", "1")],
+            )
+            self._profiles[key] = profile
+        return profile
+
+
+async def _recognize(
+    source: str, image: bytes, profile: OCRProfile, timeout: float, encoding: str
+) -> list[Data]:
+    # `source` is "stdin" (the image is fed) or a list file of crops
+    if source == "stdin":
+        stdout = await execute(
+            image,
+            "",
+            profile.dpi,
+            profile.psm,
+            profile.oem,
+            timeout,
+            encoding=encoding,
+            profile=profile,
+        )
+    else:
+        stdout = await execute_source(source, profile, timeout, encoding)
+    return await parse(parse_data, stdout, encoding)
+
+
+def _group_lines(rows: list[Data]) -> dict[tuple[int, int, int, int], list[Data]]:
+    lines: dict[tuple[int, int, int, int], list[Data]] = {}
+    for row in rows:
+        if row.level == _WORD_LEVEL and row.conf >= 0 and row.text.strip():
+            key = (row.page_num, row.block_num, row.par_num, row.line_num)
+            lines.setdefault(key, []).append(row)
+    return lines
+
+
+def _conf(lines: list[CascadeLine]) -> float:
+    return CascadeResult(tuple(lines)).conf
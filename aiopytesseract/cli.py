@@ -0,0 +1,341 @@
+"""Batch runner for `python -m aiopytesseract`."""
+
+import argparse
+import asyncio
+import glob
+import json
+import os
+import sys
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from pathlib import Path
+from typing import TextIO
+
+from aiopytesseract.base_command import execute
+from aiopytesseract.commands import image_to_string
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_DEFAULT_DPI,
+    AIOPYTESSERACT_DEFAULT_ENCODING,
+    AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_OEM,
+    AIOPYTESSERACT_DEFAULT_PSM,
+    AIOPYTESSERACT_DEFAULT_TIMEOUT,
+)
+from aiopytesseract.file_format import FileFormat
+from aiopytesseract.resources import (
+    ResourcePolicy,
+    current_resource_policy,
+    resource_policy,
+)
+
+IMAGE_EXTENSIONS: frozenset[str] = frozenset(
+    {
+        ".bmp",
+        ".gif",
+        ".jp2",
+        ".jpeg",
+        ".jpg",
+        ".pbm",
+        ".pgm",
+        ".png",
+        ".pnm",
+        ".ppm",
+        ".tif",
+        ".tiff",
+        ".webp",
+    }
+)
+OUTPUT_FORMATS: tuple[str, ...] = ("txt", "tsv", "jsonl")
+_SCAN_BATCH_SIZE = 256
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _walk(path: Path, extensions: frozenset[str]) -> Iterator[list[Path]]:
+    """Blocking directory walk that yields sorted batches of image files."""
+    batch = []
+    pending = [path]
+    # symlinked directories are followed, each directory is scanned once
+    visited: set[tuple[int, int]] = set()
+    while pending:
+        directory = pending.pop()
+        try:
+            stat = directory.stat()
+            if (stat.st_dev, stat.st_ino) in visited:
+                continue
+            visited.add((stat.st_dev, stat.st_ino))
+            entries = sorted(os.scandir(directory), key=lambda e: e.name)
+        except OSError as exc:
+            print(f"aiopytesseract: cannot scan {directory}: {exc}", file=sys.stderr)
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(Path(entry.path))
+            elif Path(entry.name).suffix.lower() in extensions:
+                batch.append(Path(entry.path))
+                if len(batch) >= _SCAN_BATCH_SIZE:
+                    yield batch
+                    batch = []
+        pending.extend(reversed(subdirs))
+    if batch:
+        yield batch
+
+
+def _expand(target: str, extensions: frozenset[str]) -> Iterator[list[Path]]:
+    if _GLOB_CHARS.intersection(target):
+        # Path.glob() does not accept absolute patterns.
+        matches = (Path(p) for p in sorted(glob.iglob(target, recursive=True)))  # noqa: PTH207
+        for match in matches:
+            if match.is_dir():
+                yield from _walk(match, extensions)
+            else:
+                yield [match]
+    elif Path(target).is_dir():
+        yield from _walk(Path(target), extensions)
+    else:
+        yield [Path(target)]
+
+
+async def scan(
+    targets: Iterable[str], extensions: frozenset[str] = IMAGE_EXTENSIONS
+) -> AsyncIterator[Path]:
+    """Yield image files from directories, glob patterns or plain file paths.
+
+    The filesystem is walked in a worker thread, one batch at a time, so
+    huge trees neither block the event loop nor get listed up front.
+    """
+    for target in targets:
+        batches = _expand(target, extensions)
+        while batch := await asyncio.to_thread(next, batches, None):
+            for path in batch:
+                yield path
+
+
+class Manifest:
+    """Append-only record of finished files, used to resume a batch."""
+
+    def __init__(self, path: Path | None) -> None:
+        self.done: set[str] = set()
+        self._file: TextIO | None = None
+        if path is None:
+            return
+        if path.exists():
+            with path.open(encoding=AIOPYTESSERACT_DEFAULT_ENCODING) as manifest:
+                self.done = {line.rstrip("\n") for line in manifest if line.strip()}
+        self._file = path.open("a", encoding=AIOPYTESSERACT_DEFAULT_ENCODING)
+
+    @staticmethod
+    def key(path: Path) -> str:
+        return str(path.absolute())
+
+    def __contains__(self, path: Path) -> bool:
+        return self.key(path) in self.done
+
+    def add(self, path: Path) -> None:
+        key = self.key(path)
+        self.done.add(key)
+        if self._file is not None:
+            self._file.write(f"{key}\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class Progress:
+    """Throughput and ETA reporting on stderr."""
+
+    def __init__(self, stream: TextIO | None = sys.stderr) -> None:
+        self.stream = stream
+        self.found = 0
+        self.done = 0
+        self.skipped = 0
+        self.failed = 0
+        self.scanning = True
+        self._started = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        elapsed = time.monotonic() - self._started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def status(self) -> str:
+        pending = self.found - self.done - self.failed
+        if self.scanning:
+            eta = "scanning"
+        elif self.rate > 0:
+            eta = f"ETA {time.strftime('%H:%M:%S', time.gmtime(pending / self.rate))}"
+        else:
+            eta = "ETA --:--:--"
+        return (
+            f"{self.done}/{self.found} done, {self.skipped} skipped, "
+            f"{self.failed} failed, {self.rate:.1f} files/s, {eta}"
+        )
+
+    def report(self, final: bool = False) -> None:
+        if self.stream is None:
+            return
+        self.stream.write(f"\r{self.status()}" + ("\n" if final else ""))
+        self.stream.flush()
+
+    async def run(self, interval: float = 1.0) -> None:
+        while True:
+            self.report()
+            await asyncio.sleep(interval)
+
+
+async def _recognize(path: Path, options: argparse.Namespace) -> str:
+    image = await asyncio.to_thread(path.read_bytes)
+    if options.format == FileFormat.TSV:
+        output: bytes = await execute(
+            image,
+            output_format=FileFormat.TSV,
+            dpi=options.dpi,
+            psm=options.psm,
+            oem=options.oem,
+            timeout=options.timeout,
+            lang=options.lang,
+            tessdata_dir=options.tessdata_dir,
+        )
+        return output.decode(AIOPYTESSERACT_DEFAULT_ENCODING)
+    text: str = await image_to_string(
+        image,
+        dpi=options.dpi,
+        lang=options.lang,
+        psm=options.psm,
+        oem=options.oem,
+        timeout=options.timeout,
+        tessdata_dir=options.tessdata_dir,
+    )
+    return text
+
+
+def _write_sidecar(path: Path, extension: str, content: str) -> None:
+    path.with_suffix(f"{path.suffix}.{extension}").write_text(
+        content, encoding=AIOPYTESSERACT_DEFAULT_ENCODING
+    )
+
+
+async def batch(
+    options: argparse.Namespace, progress_stream: TextIO | None = sys.stderr
+) -> Progress:
+    """Run OCR over every image found in `options.paths`."""
+    manifest = Manifest(options.manifest)
+    progress = Progress(progress_stream)
+    queue: asyncio.Queue[Path | None] = asyncio.Queue(maxsize=options.prefetch)
+    jsonl: TextIO = sys.stdout
+    if options.format == "jsonl" and options.output is not None:
+        jsonl = options.output.open("a", encoding=AIOPYTESSERACT_DEFAULT_ENCODING)
+
+    async def producer() -> None:
+        async for path in scan(options.paths):
+            if path in manifest:
+                progress.skipped += 1
+                continue
+            progress.found += 1
+            await queue.put(path)
+        progress.scanning = False
+        for _ in range(options.concurrency):
+            await queue.put(None)
+
+    async def worker() -> None:
+        while (path := await queue.get()) is not None:
+            try:
+                content = await _recognize(path, options)
+                if options.format != "jsonl":
+                    await asyncio.to_thread(
+                        _write_sidecar, path, options.format, content
+                    )
+            except Exception as exc:
+                progress.failed += 1
+                print(f"\naiopytesseract: {path}: {exc}", file=sys.stderr)
+                if options.format == "jsonl":
+                    jsonl.write(json.dumps({"path": str(path), "error": str(exc)}))
+                    jsonl.write("\n")
+                    jsonl.flush()
+                continue
+            if options.format == "jsonl":
+                jsonl.write(json.dumps({"path": str(path), "text": content}))
+                jsonl.write("\n")
+                jsonl.flush()
+            manifest.add(path)
+            progress.done += 1
+
+    reporter = asyncio.create_task(progress.run())
+    policy = current_resource_policy() or ResourcePolicy.for_pool(options.concurrency)
+    try:
+        with resource_policy(policy):
+            await asyncio.gather(
+                producer(), *(worker() for _ in range(options.concurrency))
+            )
+    finally:
+        reporter.cancel()
+        manifest.close()
+        if jsonl is not sys.stdout:
+            jsonl.close()
+    progress.report(final=True)
+    return progress
+
+
+def parser() -> argparse.ArgumentParser:
+    cli = argparse.ArgumentParser(
+        prog="python -m aiopytesseract",
+        description="OCR every image found in the given directories, globs or files.",
+    )
+    cli.add_argument("paths", nargs="+", help="directories, glob patterns or files.")
+    cli.add_argument(
+        "-f",
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="txt",
+        help="txt/tsv write a sidecar next to each image (e.g. scan.png.txt), "
+        "jsonl writes one line per image. (default: txt)",
+    )
+    cli.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="jsonl output file. (default: stdout)",
+    )
+    cli.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="maximum tesseract processes running at once. (default: number of CPUs)",
+    )
+    cli.add_argument(
+        "--prefetch",
+        type=int,
+        default=1024,
+        help="paths scanned ahead of the workers. (default: 1024)",
+    )
+    cli.add_argument(
+        "-m",
+        "--manifest",
+        type=Path,
+        default=None,
+        help="file recording finished images; already listed images are skipped.",
+    )
+    cli.add_argument("-l", "--lang", default=AIOPYTESSERACT_DEFAULT_LANGUAGE)
+    cli.add_argument("--dpi", type=int, default=AIOPYTESSERACT_DEFAULT_DPI)
+    cli.add_argument("--psm", type=int, default=AIOPYTESSERACT_DEFAULT_PSM)
+    cli.add_argument("--oem", type=int, default=AIOPYTESSERACT_DEFAULT_OEM)
+    cli.add_argument("--timeout", type=float, default=AIOPYTESSERACT_DEFAULT_TIMEOUT)
+    cli.add_argument("--tessdata-dir", default=None)
+    cli.add_argument(
+        "-q", "--quiet", action="store_true", help="do not report progress."
+    )
+    return cli
+
+
+def main(argv: list[str] | None = None) -> int:
+    options = parser().parse_args(argv)
+    if options.concurrency < 1:
+        parser().error("--concurrency must be at least 1")
+    if options.prefetch < 1:
+        parser().error("--prefetch must be at least 1")
+    progress = asyncio.run(batch(options, None if options.quiet else sys.stderr))
+    return 1 if progress.failed else 0
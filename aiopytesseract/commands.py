@@ -1,16 +1,27 @@
 import asyncio
+import inspect
 import re
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+import shlex
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import aclosing, asynccontextmanager
 from functools import singledispatch
 from pathlib import Path
 
-import cattr
-from aiofiles import tempfile
-
 from aiopytesseract._logger import logger
-from aiopytesseract.base_command import execute, execute_cmd, execute_multi_output_cmd
+from aiopytesseract.alto import AltoParser, AltoSink
+from aiopytesseract.base_command import (
+    communicate,
+    execute,
+    execute_cmd,
+    execute_multi_output_cmd,
+    execute_stream,
+    kill,
+    profile_cmd_args,
+    spawn,
+)
 from aiopytesseract.constants import (
+    AIOPYTESSERACT_AUTO_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
     AIOPYTESSERACT_DEFAULT_DPI,
     AIOPYTESSERACT_DEFAULT_ENCODING,
     AIOPYTESSERACT_DEFAULT_LANGUAGE,
@@ -21,20 +32,45 @@ from aiopytesseract.constants import (
 )
 from aiopytesseract.exceptions import TesseractRuntimeError, TesseractTimeoutError
 from aiopytesseract.file_format import FileFormat
-from aiopytesseract.models import OSD, Box, Data, Parameter
+from aiopytesseract.language_routing import resolve_language
+from aiopytesseract.models import OSD, Box, Data, Parameter, Region, TextLine
+from aiopytesseract.parsing import (
+    decode,
+    parse,
+    parse_boxes,
+    parse_data,
+    parse_osd,
+    parse_parameters,
+)
+from aiopytesseract.preprocessing import Preprocess
+from aiopytesseract.profile import OCRProfile
 from aiopytesseract.returncode import ReturnCode
-from aiopytesseract.validators import file_exists
+from aiopytesseract.tessdata import staged_tessdata_dir
+from aiopytesseract.validators import (
+    file_exists,
+    image_is_valid,
+    language_is_valid,
+    oem_is_valid,
+    psm_is_valid,
+)
+from aiopytesseract.wordlists import WordList
 
 
 async def languages(
-    config: str = "", encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING
+    config: str = "",
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    tessdata_dir: str | None = None,
 ) -> list[str]:
     """Tesseract available languages.
 
     :param config: config. (valid values: str, default: "")
     :param encoding: decode bytes to string. (default: utf-8)
+    :param tessdata_dir: location of tessdata path. (default: None)
     """
-    proc = await execute_cmd(f"--list-langs {config}")
+    cmdline = f"--list-langs {config}"
+    if tessdata_dir:
+        cmdline = f"--tessdata-dir {shlex.quote(tessdata_dir)} {cmdline}"
+    proc = await execute_cmd(cmdline)
     data = await proc.stdout.read()  # type: ignore
     langs = []
     for line in data.decode(encoding).split():
@@ -45,14 +81,17 @@ async def languages(
 
 
 async def get_languages(
-    config: str = "", encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING
+    config: str = "",
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    tessdata_dir: str | None = None,
 ) -> list[str]:
     """Tesseract available languages.
 
     :param config: config. (valid values: str, default: "")
     :param encoding: decode bytes to string. (default: utf-8)
+    :param tessdata_dir: location of tessdata path. (default: None)
     """
-    return await languages(config, encoding=encoding)
+    return await languages(config, encoding=encoding, tessdata_dir=tessdata_dir)
 
 
 async def tesseract_version(encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING) -> str:
@@ -81,36 +120,52 @@ async def confidence(
     tessdata_dir: str | None = None,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> float:
     """Get script confidence.
 
     :param image: image input to tesseract. (valid values: str)
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param oem: ocr engine modes. (default: 3)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param timeout: command timeout. (default: 30)
     :param encoding: decode bytes to string. (default: utf-8)
+    :param profile: prevalidated options, replaces dpi, lang, oem, user_words, user_patterns, tessdata_dir and config, psm stays 0. (default: None)
     """
-    cmdline = f"stdin stdout -l {lang} --dpi {dpi} --psm 0 --oem {oem}"
-    proc = None
-    if tessdata_dir:
-        cmdline = f"--tessdata-dir {tessdata_dir} {cmdline}"
+    image_bytes = Path(image).read_bytes()
+    if profile is not None:
+        cmd_args = await profile_cmd_args(image_bytes, profile, "", timeout, psm=0)
+    else:
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(image_bytes, timeout, tessdata_dir)
+        await language_is_valid(lang)
+        await oem_is_valid(oem)
+        cmd_args = [
+            *_tessdata_args(tessdata_dir, lang, 0),
+            "stdin",
+            "stdout",
+            "-l",
+            lang,
+            "--dpi",
+            f"{dpi}",
+            "--psm",
+            "0",
+            "--oem",
+            f"{oem}",
+        ]
+    try:
+        proc = await spawn(cmd_args, timeout)
+    except asyncio.TimeoutError:
+        raise TesseractTimeoutError(timeout) from None
+    stdout, _ = await communicate(proc, image_bytes, timeout)
     try:
-        proc = await execute_cmd(cmdline)
-        stdout, _ = await asyncio.wait_for(
-            proc.communicate(Path(image).read_bytes()), timeout=timeout
-        )
         confidence_value = float(
             re.search(  # type: ignore
                 r"(Script.confidence:.(\d{1,10}.\d{1,10})$)",
                 stdout.decode(encoding),
             ).group(2)
         )
-    except asyncio.TimeoutError:
-        if proc is not None:
-            proc.kill()
-        raise TesseractTimeoutError(timeout) from None
     except AttributeError:
         confidence_value = 0.0
     return confidence_value
@@ -124,23 +179,52 @@ async def deskew(
     tessdata_dir: str | None = None,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> float:
     """Get Deskew angle.
 
     :param image: image input to tesseract. (valid values: str)
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param oem: ocr engine modes. (default: 3)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param timeout: command timeout. (default: 30)
     :param encoding: decode bytes to string. (default: utf-8)
+    :param profile: prevalidated options, replaces dpi, lang, oem, user_words, user_patterns, tessdata_dir and config, psm stays 2. (default: None)
     """
-    cmdline = f"{image} stdout -l {lang} --dpi {dpi} --psm 2 --oem {oem}"
+    if profile is not None:
+        # the image is only read to resolve lang="auto"
+        image_bytes = (
+            Path(image).read_bytes()
+            if profile.lang == AIOPYTESSERACT_AUTO_LANGUAGE
+            else b""
+        )
+        cmd_args = await profile_cmd_args(
+            image_bytes, profile, "", timeout, source=image, psm=2
+        )
+    else:
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(
+                Path(image).read_bytes(), timeout, tessdata_dir
+            )
+        await language_is_valid(lang)
+        await oem_is_valid(oem)
+        cmd_args = [
+            *_tessdata_args(tessdata_dir, lang, 2),
+            image,
+            "stdout",
+            "-l",
+            lang,
+            "--dpi",
+            f"{dpi}",
+            "--psm",
+            "2",
+            "--oem",
+            f"{oem}",
+        ]
     proc = None
-    if tessdata_dir:
-        cmdline = f"--tessdata-dir {tessdata_dir} {cmdline}"
     try:
-        proc = await execute_cmd(cmdline)
+        proc = await spawn(cmd_args, timeout)
         data = await asyncio.wait_for(proc.stderr.read(), timeout=timeout)  # type: ignore
         deskew_value = float(
             re.search(  # type: ignore
@@ -150,8 +234,12 @@ async def deskew(
         )
     except asyncio.TimeoutError:
         if proc is not None:
-            proc.kill()
+            kill(proc)
         raise TesseractTimeoutError(timeout) from None
+    except asyncio.CancelledError:
+        if proc is not None:
+            kill(proc)
+        raise
     except AttributeError:
         deskew_value = 0.0
     return deskew_value
@@ -167,29 +255,8 @@ async def tesseract_parameters(
     :param encoding: decode bytes to string. (default: utf-8)
     """
     proc = await execute_cmd("--print-parameters")
-    raw_data: bytes = await proc.stdout.read()  # type: ignore
-    data = raw_data.decode(encoding)
-    params = []
-    # [1:] - skip first line with text: "Tesseract parameters:\n"
-    for line in data.split("\n")[1:]:
-        param = re.search(r"(\w+)\s+(-?\d+.?\d*)\s+(.*)[^\n]$", line)
-        if param:
-            params.append(
-                cattr.structure_attrs_fromtuple(
-                    (param.group(1), param.group(3), param.group(2)),
-                    Parameter,
-                )
-            )
-        else:
-            param = re.search(r"(\w+)\s+(.*)[^\n]$", line)
-            if param:
-                params.append(
-                    cattr.structure_attrs_fromtuple(
-                        (param.group(1), param.group(2)),
-                        Parameter,
-                    )
-                )
-    return sorted(params, key=lambda p: p.name)
+    data: bytes = await proc.stdout.read()  # type: ignore
+    return await parse(parse_parameters, data, encoding)
 
 
 @singledispatch
@@ -201,24 +268,28 @@ async def image_to_string(
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> str:
     """Extract string from an image.
 
     :param image: image input to tesseract. (valid values: str, bytes)
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param psm: page segmentation modes. (default: 3)
     :param oem: ocr engine modes. (default: 3)
     :param encoding: encoding. (default: UTF-8)
     :param timeout: command timeout. (default: 30)
-    :param user_words: location of user words file. (default: None)
-    :param user_patterns: location of user patterns file. (default: None)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param config: set value for config variables. (default: None)
+    :param preprocess: image preprocessing stage, requires Pillow. (default: None)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
     """
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -232,10 +303,12 @@ async def _(
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> str:
     image_text: bytes = await execute(
         image,
@@ -249,8 +322,10 @@ async def _(
         user_patterns=user_patterns,
         tessdata_dir=tessdata_dir,
         config=config,
+        preprocess=preprocess,
+        profile=profile,
     )
-    return image_text.decode(encoding)
+    return await parse(decode, image_text, encoding)
 
 
 @image_to_string.register(bytes)
@@ -262,10 +337,12 @@ async def _(
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> str:
     image_text: bytes = await execute(
         image,
@@ -279,33 +356,39 @@ async def _(
         user_patterns=user_patterns,
         tessdata_dir=tessdata_dir,
         config=config,
+        preprocess=preprocess,
+        profile=profile,
     )
-    return image_text.decode(encoding)
+    return await parse(decode, image_text, encoding)
 
 
 @singledispatch
 async def image_to_hocr(
     image: str | bytes,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
     lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> str:
     """HOCR
 
     :param image: image input to tesseract. (valid values: str, bytes)
-    :param user_words: location of user words file. (default: None)
-    :param user_patterns: location of user patterns file. (default: None)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param psm: page segmentation modes (default: 3)
     :param oem: ocr engine modes (default: 3)
     :param timeout: command timeout (default: 30)
+    :param preprocess: image preprocessing stage, requires Pillow. (default: None)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
     """
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -313,8 +396,8 @@ async def image_to_hocr(
 @image_to_hocr.register(str)
 async def _(
     image: str,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
     lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
@@ -322,6 +405,8 @@ async def _(
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> str:
     output: bytes = await execute(
         image,
@@ -334,8 +419,10 @@ async def _(
         user_words=user_words,
         user_patterns=user_patterns,
         tessdata_dir=tessdata_dir,
+        preprocess=preprocess,
+        profile=profile,
     )
-    return output.decode(encoding)
+    return await parse(decode, output, encoding)
 
 
 @image_to_hocr.register(bytes)
@@ -346,10 +433,12 @@ async def _(
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> str:
     output: bytes = await execute(
         image,
@@ -362,8 +451,232 @@ async def _(
         user_words=user_words,
         user_patterns=user_patterns,
         tessdata_dir=tessdata_dir,
+        preprocess=preprocess,
+        profile=profile,
+    )
+    return await parse(decode, output, encoding)
+
+
+@singledispatch
+async def image_to_alto(
+    image: str | bytes,
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> bytes:
+    """ALTO XML.
+
+    :param image: image input to tesseract. (valid values: str, bytes)
+    :param dpi: image dots per inch (DPI). (default: 300)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
+    :param psm: page segmentation modes. (default: 3)
+    :param oem: ocr engine modes. (default: 3)
+    :param timeout: command timeout. (default: 30)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
+    :param tessdata_dir: location of tessdata path. (default: None)
+    :param config: set value for config variables. (default: None)
+    :param preprocess: image preprocessing stage, requires Pillow. (default: None)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
+    """
+    raise NotImplementedError(f"Type {type(image)} not supported.")
+
+
+@image_to_alto.register(str)
+async def _(
+    image: str,
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> bytes:
+    output: bytes = await execute(
+        image,
+        output_format=FileFormat.ALTO,
+        dpi=dpi,
+        lang=lang,
+        psm=psm,
+        oem=oem,
+        timeout=timeout,
+        user_words=user_words,
+        user_patterns=user_patterns,
+        tessdata_dir=tessdata_dir,
+        config=config,
+        preprocess=preprocess,
+        profile=profile,
+    )
+    return output
+
+
+@image_to_alto.register(bytes)
+async def _(
+    image: bytes,
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> bytes:
+    output: bytes = await execute(
+        image,
+        output_format=FileFormat.ALTO,
+        dpi=dpi,
+        lang=lang,
+        psm=psm,
+        oem=oem,
+        timeout=timeout,
+        user_words=user_words,
+        user_patterns=user_patterns,
+        tessdata_dir=tessdata_dir,
+        config=config,
+        preprocess=preprocess,
+        profile=profile,
     )
-    return output.decode(encoding)
+    return output
+
+
+async def image_to_alto_stream(
+    image: str | bytes,
+    sink: AltoSink,
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    chunk_size: int = AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> int:
+    """Write ALTO XML to `sink` as tesseract produces it.
+
+    Returns the number of bytes written. If tesseract fails midway the
+    sink may already hold a partial document.
+
+    :param image: image input to tesseract. (valid values: str, bytes)
+    :param sink: object with a sync or async `write(bytes)` method.
+    :param dpi: image dots per inch (DPI). (default: 300)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
+    :param psm: page segmentation modes. (default: 3)
+    :param oem: ocr engine modes. (default: 3)
+    :param timeout: command timeout. (default: 30)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
+    :param tessdata_dir: location of tessdata path. (default: None)
+    :param config: set value for config variables. (default: None)
+    :param chunk_size: maximum size of each chunk read from tesseract. (default: 65536)
+    :param preprocess: image preprocessing stage, requires Pillow. (default: None)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
+    """
+    written = 0
+    async with aclosing(
+        execute_stream(
+            image,
+            output_format=FileFormat.ALTO,
+            dpi=dpi,
+            lang=lang,
+            psm=psm,
+            oem=oem,
+            timeout=timeout,
+            user_words=user_words,
+            user_patterns=user_patterns,
+            tessdata_dir=tessdata_dir,
+            config=config,
+            chunk_size=chunk_size,
+            preprocess=preprocess,
+            profile=profile,
+        )
+    ) as chunks:
+        async for chunk in chunks:
+            result = sink.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            written += len(chunk)
+    return written
+
+
+async def image_to_alto_lines(
+    image: str | bytes,
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
+    tessdata_dir: str | None = None,
+    config: list[tuple[str, str]] | None = None,
+    chunk_size: int = AIOPYTESSERACT_DEFAULT_CHUNK_SIZE,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
+) -> AsyncGenerator[TextLine, None]:
+    """Yield ALTO text lines while tesseract output is still being read.
+
+    No DOM for the whole page is built, each `TextLine` is parsed and
+    released as soon as its closing tag arrives.
+
+    :param image: image input to tesseract. (valid values: str, bytes)
+    :param dpi: image dots per inch (DPI). (default: 300)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
+    :param psm: page segmentation modes. (default: 3)
+    :param oem: ocr engine modes. (default: 3)
+    :param timeout: command timeout. (default: 30)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
+    :param tessdata_dir: location of tessdata path. (default: None)
+    :param config: set value for config variables. (default: None)
+    :param chunk_size: maximum size of each chunk read from tesseract. (default: 65536)
+    :param preprocess: image preprocessing stage, requires Pillow. (default: None)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
+    """
+    parser = AltoParser()
+    async with aclosing(
+        execute_stream(
+            image,
+            output_format=FileFormat.ALTO,
+            dpi=dpi,
+            lang=lang,
+            psm=psm,
+            oem=oem,
+            timeout=timeout,
+            user_words=user_words,
+            user_patterns=user_patterns,
+            tessdata_dir=tessdata_dir,
+            config=config,
+            chunk_size=chunk_size,
+            preprocess=preprocess,
+            profile=profile,
+        )
+    ) as chunks:
+        async for chunk in chunks:
+            for line in parser.feed(chunk):
+                yield line
+    for line in parser.close():
+        yield line
 
 
 @singledispatch
@@ -374,21 +687,25 @@ async def image_to_pdf(
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> bytes:
     """Generate a searchable PDF from an image.
 
     :param image: image input to tesseract. (valid values: str, bytes)
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param psm: page segmentation modes (default: 3)
     :param oem: ocr engine modes (default: 3)
     :param timeout: command timeout (default: 30)
-    :param user_words: location of user words file. (default: None)
-    :param user_patterns: location of user patterns file. (default: None)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
     :param tessdata_dir: location of tessdata path. (default: None)
+    :param preprocess: image preprocessing stage, requires Pillow. (default: None)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
     """
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -401,9 +718,11 @@ async def _(
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> bytes:
     output: bytes = await execute(
         image,
@@ -416,6 +735,8 @@ async def _(
         user_words=user_words,
         user_patterns=user_patterns,
         tessdata_dir=tessdata_dir,
+        preprocess=preprocess,
+        profile=profile,
     )
     return output
 
@@ -428,9 +749,11 @@ async def _(
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
+    preprocess: Preprocess | None = None,
+    profile: OCRProfile | None = None,
 ) -> bytes:
     output: bytes = await execute(
         image,
@@ -443,6 +766,8 @@ async def _(
         user_words=user_words,
         user_patterns=user_patterns,
         tessdata_dir=tessdata_dir,
+        preprocess=preprocess,
+        profile=profile,
     )
     return output
 
@@ -454,14 +779,16 @@ async def image_to_boxes(
     tessdata_dir: str | None = None,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> list[Box]:
     """Bounding box estimates.
 
     :param image: image input to tesseract. (valid values: str, bytes)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param timeout: command timeout (default: 30)
     :param encoding: decode bytes to string. (default: utf-8)
+    :param profile: prevalidated options, replaces lang, user_words, user_patterns, tessdata_dir and config, and adds its dpi, psm and oem. (default: None)
     """
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -473,10 +800,11 @@ async def _(
     tessdata_dir: str | None = None,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> list[Box]:
     await file_exists(image)
     return await image_to_boxes(
-        Path(image).read_bytes(), lang, tessdata_dir, timeout, encoding
+        Path(image).read_bytes(), lang, tessdata_dir, timeout, encoding, profile
     )
 
 
@@ -487,30 +815,36 @@ async def _(
     tessdata_dir: str | None = None,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> list[Box]:
-    cmdline = f"-l {lang} stdin stdout batch.nochop makebox"
-    proc = None
-    if tessdata_dir:
-        cmdline = f"--tessdata-dir {tessdata_dir} {cmdline}"
-    logger.debug(f"Executing tesseract command: {cmdline}")
-    try:
-        proc = await execute_cmd(cmdline)
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(image),
-            timeout=timeout,
+    await image_is_valid(image)
+    if profile is not None:
+        # cmd_args() reverses the config files
+        cmd_args = await profile_cmd_args(
+            image, profile, "makebox batch.nochop", timeout
         )
+    else:
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(image, timeout, tessdata_dir)
+        await language_is_valid(lang)
+        cmd_args = [
+            *_tessdata_args(tessdata_dir, lang, None),
+            "-l",
+            lang,
+            "stdin",
+            "stdout",
+            "batch.nochop",
+            "makebox",
+        ]
+        logger.debug(f"Executing tesseract command: {shlex.join(cmd_args)}")
+    try:
+        proc = await spawn(cmd_args, timeout)
     except asyncio.TimeoutError:
-        if proc is not None:
-            proc.kill()
         raise TesseractTimeoutError(timeout) from None
+    stdout, stderr = await communicate(proc, image, timeout)
     if proc.returncode != ReturnCode.SUCCESS:
         raise TesseractRuntimeError(stderr.decode(encoding))
-    data = stdout.decode(encoding)
-    datalen = len(data.split("\n")) - 1
-    return [
-        cattr.structure_attrs_fromtuple(tuple(line.split()), Box)
-        for line in data.split("\n")[:datalen]
-    ]
+    return await parse(parse_boxes, stdout, encoding)
 
 
 @singledispatch
@@ -522,16 +856,18 @@ async def image_to_data(
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     tessdata_dir: str | None = None,
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    profile: OCRProfile | None = None,
 ) -> list[Data]:
     """Information about boxes, confidences, line and page numbers.
 
     :param image: image input to tesseract. (valid values: str, bytes)
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param timeout: command timeout (default: 30)
     :param encoding: decode bytes to string. (default: utf-8)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param psm: page segmentation modes. (default: 3)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
     """
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -545,10 +881,18 @@ async def _(
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     tessdata_dir: str | None = None,
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    profile: OCRProfile | None = None,
 ) -> list[Data]:
     await file_exists(image)
     return await image_to_data(
-        Path(image).read_bytes(), dpi, lang, timeout, encoding, tessdata_dir, psm
+        Path(image).read_bytes(),
+        dpi,
+        lang,
+        timeout,
+        encoding,
+        tessdata_dir,
+        psm,
+        profile,
     )
 
 
@@ -561,29 +905,41 @@ async def _(
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     tessdata_dir: str | None = None,
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+    profile: OCRProfile | None = None,
 ) -> list[Data]:
-    cmdline = f"stdin stdout -c tessedit_create_tsv=1 --dpi {dpi} -l {lang} --psm {psm}"
-    proc = None
-    if tessdata_dir:
-        cmdline = f"--tessdata-dir {tessdata_dir} {cmdline}"
+    await image_is_valid(image)
+    if profile is not None:
+        cmd_args = [
+            *await profile_cmd_args(image, profile, "", timeout),
+            "-c",
+            "tessedit_create_tsv=1",
+        ]
+    else:
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(image, timeout, tessdata_dir)
+        await language_is_valid(lang)
+        await psm_is_valid(psm)
+        cmd_args = [
+            *_tessdata_args(tessdata_dir, lang, psm),
+            "stdin",
+            "stdout",
+            "-c",
+            "tessedit_create_tsv=1",
+            "--dpi",
+            f"{dpi}",
+            "-l",
+            lang,
+            "--psm",
+            f"{psm}",
+        ]
     try:
-        proc = await execute_cmd(cmdline)
-        stdout, stderr = await asyncio.wait_for(
-            proc.communicate(image), timeout=timeout
-        )
+        proc = await spawn(cmd_args, timeout)
     except asyncio.TimeoutError:
-        if proc is not None:
-            proc.kill()
         raise TesseractTimeoutError(timeout) from None
+    stdout, stderr = await communicate(proc, image, timeout)
     if proc.returncode != ReturnCode.SUCCESS:
         raise TesseractRuntimeError(stderr.decode(encoding))
-    data: str = stdout.decode(encoding)
-    datalen = len(data.split("\n")) - 1
-    params = []
-    for line in data.split("\n")[1:datalen]:
-        param = line.split()
-        params.append(cattr.structure_attrs_fromtuple(param, Data))  # type: ignore
-    return params
+    return await parse(parse_data, stdout, encoding)
 
 
 @singledispatch
@@ -595,16 +951,18 @@ async def image_to_osd(
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     tessdata_dir: str | None = None,
+    profile: OCRProfile | None = None,
 ) -> OSD:
     """Information about orientation and script detection.
 
     :param image: image input to tesseract. (valid values: str, bytes)
     :param dpi: image dots per inch (DPI). (default: 300)
     :param oem: ocr engine modes. (default: 3)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param timeout: command timeout. (default: 30)
     :param encoding: decode bytes to string. (default: utf-8)
     :param tessdata_dir: location of tessdata path. (default: None)
+    :param profile: prevalidated options, replaces dpi, oem, lang and tessdata_dir. (default: None)
     """
     raise NotImplementedError(f"Type {type(image)} not supported.")
 
@@ -618,10 +976,18 @@ async def _(
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     tessdata_dir: str | None = None,
+    profile: OCRProfile | None = None,
 ) -> OSD:
     await file_exists(image)
     return await image_to_osd(
-        Path(image).read_bytes(), dpi, oem, lang, timeout, encoding, tessdata_dir
+        Path(image).read_bytes(),
+        dpi,
+        oem,
+        lang,
+        timeout,
+        encoding,
+        tessdata_dir,
+        profile,
     )
 
 
@@ -634,7 +1000,11 @@ async def _(
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
     tessdata_dir: str | None = None,
+    profile: OCRProfile | None = None,
 ) -> OSD:
+    if profile is not None:
+        dpi, oem, lang = profile.dpi, profile.oem, profile.lang
+        tessdata_dir = profile.tessdata_dir
     # OSD requires legacy engine, force OEM to 0 (legacy only) if default is used
     osd_oem = 0 if oem == AIOPYTESSERACT_DEFAULT_OEM else oem
     try:
@@ -657,13 +1027,187 @@ async def _(
                 "Please ensure your Tesseract installation includes legacy trained data files."
             ) from e
         raise
-    return cattr.structure_attrs_fromtuple(
-        re.findall(  # type: ignore
-            r"\w+\s?:\s*(\d+.?\d*|\w+)",
-            data.decode(encoding),
-        ),
-        OSD,
+    return await parse(parse_osd, data, encoding)
+
+
+RegionSpec = (
+    Region | tuple[int, int, int, int] | tuple[int, int, int, int, int, str | None]
+)
+
+
+@singledispatch
+async def image_to_regions(
+    image: str | bytes,
+    regions: Sequence[RegionSpec],
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    tessdata_dir: str | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
+) -> dict[Region, str]:
+    """Recognize only the given regions of an image.
+
+    Regions sharing a psm and whitelist are recognized together in a
+    single tesseract run over a list file of their crops, skipping the
+    full-page layout analysis. Requires Pillow.
+
+    :param image: image input to tesseract. (valid values: str, bytes)
+    :param regions: Region or (x, y, w, h[, psm, whitelist]) tuples. (default psm: 7)
+    :param dpi: image dots per inch (DPI). (default: 300)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
+    :param oem: ocr engine modes. (default: 3)
+    :param timeout: command timeout per group. (default: 30)
+    :param tessdata_dir: location of tessdata path. (default: None)
+    :param encoding: decode bytes to string. (default: utf-8)
+    :param profile: prevalidated options, replaces dpi, lang, oem and tessdata_dir. (default: None)
+    """
+    raise NotImplementedError(f"Type {type(image)} not supported.")
+
+
+@image_to_regions.register(str)
+async def _(
+    image: str,
+    regions: Sequence[RegionSpec],
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    tessdata_dir: str | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
+) -> dict[Region, str]:
+    await file_exists(image)
+    return await image_to_regions(
+        Path(image).read_bytes(),
+        regions,
+        dpi=dpi,
+        lang=lang,
+        oem=oem,
+        timeout=timeout,
+        tessdata_dir=tessdata_dir,
+        encoding=encoding,
+        profile=profile,
+    )
+
+
+@image_to_regions.register(bytes)
+async def _(
+    image: bytes,
+    regions: Sequence[RegionSpec],
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    lang: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    oem: int = AIOPYTESSERACT_DEFAULT_OEM,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    tessdata_dir: str | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
+) -> dict[Region, str]:
+    await image_is_valid(image)
+    if profile is not None:
+        dpi, lang, oem = profile.dpi, profile.lang, profile.oem
+        tessdata_dir = profile.tessdata_dir
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(image, timeout, tessdata_dir)
+    else:
+        if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            lang = await resolve_language(image, timeout, tessdata_dir)
+        await oem_is_valid(oem)
+        await language_is_valid(lang)
+    unique = list(
+        dict.fromkeys(
+            region if isinstance(region, Region) else Region(*region)
+            for region in regions
+        )
     )
+    groups: dict[tuple[int, str | None], list[int]] = {}
+    for index, region in enumerate(unique):
+        await psm_is_valid(region.psm)
+        groups.setdefault((region.psm, region.whitelist), []).append(index)
+    from aiofiles import tempfile
+
+    from aiopytesseract.regions import write_crops
+
+    loop = asyncio.get_running_loop()
+    async with tempfile.TemporaryDirectory(prefix="aiopytesseract-") as tmpdir:
+        paths = await loop.run_in_executor(None, write_crops, image, unique, tmpdir)
+        batches = []
+        for number, ((psm, whitelist), indexes) in enumerate(groups.items()):
+            listfile = Path(tmpdir) / f"group-{number}.txt"
+            listfile.write_text("".join(f"{paths[index]}\n" for index in indexes))
+            batches.append(
+                _recognize_list(
+                    str(listfile),
+                    len(indexes),
+                    psm,
+                    whitelist,
+                    dpi,
+                    lang,
+                    oem,
+                    timeout,
+                    tessdata_dir,
+                    encoding,
+                )
+            )
+        texts = await asyncio.gather(*batches)
+    results: dict[Region, str] = {}
+    for indexes, group_texts in zip(groups.values(), texts, strict=True):
+        for index, text in zip(indexes, group_texts, strict=True):
+            results[unique[index]] = text
+    return results
+
+
+def _tessdata_args(tessdata_dir: str | None, lang: str, psm: int | None) -> list[str]:
+    tessdata_dir = staged_tessdata_dir(tessdata_dir, lang, psm)
+    return ["--tessdata-dir", tessdata_dir] if tessdata_dir else []
+
+
+async def _recognize_list(
+    listfile: str,
+    count: int,
+    psm: int,
+    whitelist: str | None,
+    dpi: int,
+    lang: str,
+    oem: int,
+    timeout: float,
+    tessdata_dir: str | None,
+    encoding: str,
+) -> list[str]:
+    cmd_args = [
+        listfile,
+        "stdout",
+        "--dpi",
+        f"{dpi}",
+        "--psm",
+        f"{psm}",
+        "--oem",
+        f"{oem}",
+    ]
+    tessdata_dir = staged_tessdata_dir(tessdata_dir, lang, psm)
+    if tessdata_dir:
+        cmd_args = ["--tessdata-dir", tessdata_dir, *cmd_args]
+    cmd_args += ["-l", lang]
+    if whitelist is not None:
+        cmd_args += ["-c", f"tessedit_char_whitelist={whitelist}"]
+    try:
+        proc = await spawn(cmd_args, timeout)
+    except asyncio.TimeoutError:
+        raise TesseractTimeoutError(timeout) from None
+    stdout, stderr = await communicate(proc, b"", timeout)
+    if proc.returncode != ReturnCode.SUCCESS:
+        raise TesseractRuntimeError(stderr.decode(encoding))
+    # pages are separated by `page_separator`, a form feed, which tesseract
+    # also writes after the last page.
+    pages = stdout.decode(encoding).split("\f")
+    if len(pages) == count + 1 and not pages[-1].strip():
+        pages.pop()
+    if len(pages) != count:
+        raise TesseractRuntimeError(
+            f"expected {count} pages from {listfile}, got {len(pages)}"
+        )
+    return [page.strip() for page in pages]
 
 
 @asynccontextmanager
@@ -676,11 +1220,12 @@ async def run(
     psm: int = AIOPYTESSERACT_DEFAULT_PSM,
     oem: int = AIOPYTESSERACT_DEFAULT_OEM,
     timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
-    user_words: str | None = None,
-    user_patterns: str | None = None,
+    user_words: WordList | None = None,
+    user_patterns: WordList | None = None,
     tessdata_dir: str | None = None,
     config: list[tuple[str, str]] | None = None,
     encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    profile: OCRProfile | None = None,
 ) -> AsyncGenerator[tuple[str, ...], None]:
     """Run Tesseract-OCR with multiple analysis.
 
@@ -693,18 +1238,21 @@ async def run(
     :param output_filename: base filename.
     :param output_format: output file extensions.
     :param dpi: image dots per inch (DPI). (default: 300)
-    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
     :param psm: page segmentation modes. (default: 3)
     :param oem: ocr engine modes. (default: 3)
     :param timeout: command timeout. (default: 30)
-    :param user_words: location of user words file. (default: None)
-    :param user_patterns: location of user patterns file. (default: None)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
     :param tessdata_dir: location of tessdata path. (default: None)
     :param config: set value for config variables. (default: None)
     :param encoding: decode bytes to string. (default: utf-8)
+    :param profile: prevalidated options, replaces dpi, lang, psm, oem, user_words, user_patterns, tessdata_dir and config. (default: None)
     """
     if not isinstance(image, bytes):
         raise NotImplementedError(f"Type {type(image)} not supported.")
+    from aiofiles import tempfile
+
     async with tempfile.TemporaryDirectory(prefix="aiopytesseract-") as tmpdir:
         resp = await execute_multi_output_cmd(
             image,
@@ -720,5 +1268,6 @@ async def run(
             tessdata_dir=tessdata_dir,
             config=config,
             encoding=encoding,
+            profile=profile,
         )
         yield resp
@@ -1,6 +1,33 @@
+import os
+
 from aiopytesseract.file_format import FileFormat
 
-TESSERACT_CMD: str = "tesseract"
+# `TESSERACT_CMD=/path/to/tesseract` selects another binary, e.g. the
+# stand-in of scripts/fake_tesseract.py in load tests
+TESSERACT_CMD: str = os.environ.get("TESSERACT_CMD", "tesseract")
+# environment passed to tesseract, everything else is dropped at spawn time
+TESSERACT_ENVIRONMENT: tuple[str, ...] = (
+    "DYLD_FALLBACK_LIBRARY_PATH",
+    "DYLD_LIBRARY_PATH",
+    "HOME",
+    "LANG",
+    "LC_ALL",
+    "LC_CTYPE",
+    "LC_MESSAGES",
+    "LC_NUMERIC",
+    "LD_LIBRARY_PATH",
+    "OMP_NUM_THREADS",
+    "OMP_PROC_BIND",
+    "OMP_THREAD_LIMIT",
+    "OMP_WAIT_POLICY",
+    "PATH",
+    "PATHEXT",
+    "SYSTEMROOT",
+    "TEMP",
+    "TESSDATA_PREFIX",
+    "TMP",
+    "TMPDIR",
+)
 
 AIOPYTESSERACT_DEFAULT_ENCODING: str = "utf-8"
 AIOPYTESSERACT_DEFAULT_TIMEOUT: float = 30
@@ -9,6 +36,58 @@ AIOPYTESSERACT_DEFAULT_LANGUAGE: str = "eng"
 AIOPYTESSERACT_DEFAULT_DPI: int = 300
 AIOPYTESSERACT_DEFAULT_PSM: int = 3
 AIOPYTESSERACT_DEFAULT_OEM: int = 3
+AIOPYTESSERACT_DEFAULT_CHUNK_SIZE: int = 64 * 1024
+# cost-aware timeouts: prior throughput until measured, then bounds on the
+# derived timeout (seconds)
+AIOPYTESSERACT_DEFAULT_PIXELS_PER_SECOND: float = 500_000
+AIOPYTESSERACT_MIN_TIMEOUT: float = 5
+AIOPYTESSERACT_MAX_TIMEOUT: float = 600
+# tmpfs root for `warm_tessdata` and in-memory word lists, the system temp
+# dir is used when missing
+AIOPYTESSERACT_TESSDATA_STAGING_ROOT: str = "/dev/shm"  # noqa: S108
+# unreferenced in-memory word list files kept for reuse
+AIOPYTESSERACT_MAX_IDLE_WORDLISTS: int = 32
+# `python -m aiopytesseract.server`
+AIOPYTESSERACT_DEFAULT_SERVER_PORT: int = 8884
+AIOPYTESSERACT_DEFAULT_CACHE_SIZE: int = 256
+# total size of the cached results, and the largest single result cached
+AIOPYTESSERACT_DEFAULT_CACHE_BYTES: int = 256 * 1024 * 1024
+AIOPYTESSERACT_MAX_CACHED_PAYLOAD: int = 16 * 1024 * 1024
+# config variables server clients may set; the others include file paths
+# tesseract reads or writes, e.g. `debug_file`
+AIOPYTESSERACT_SERVER_CONFIG_VARIABLES: frozenset[str] = frozenset(
+    {
+        "classify_bln_numeric_mode",
+        "hocr_char_boxes",
+        "hocr_font_info",
+        "lstm_choice_mode",
+        "preserve_interword_spaces",
+        "tessedit_char_blacklist",
+        "tessedit_char_whitelist",
+        "tessedit_do_invert",
+        "textord_heavy_nr",
+        "textord_min_linesize",
+        "thresholding_method",
+        "user_defined_dpi",
+    }
+)
+AIOPYTESSERACT_MAX_REQUEST_SIZE: int = 64 * 1024 * 1024
+AIOPYTESSERACT_KEEP_ALIVE_TIMEOUT: float = 60
+# outputs from this size (bytes) are parsed in an executor, off the event loop
+AIOPYTESSERACT_DEFAULT_PARSE_THRESHOLD: int = 64 * 1024
+# side (pixels) of the spatial grid cells of a `WordIndex`
+AIOPYTESSERACT_DEFAULT_INDEX_CELL_SIZE: int = 256
+# speculative runs: a language finishing with this mean word confidence wins
+# without waiting for the others
+AIOPYTESSERACT_DEFAULT_SPECULATIVE_CONFIDENCE: float = 85
+# `Cascade`: lines (or pages) below this mean word confidence go to the next tier
+AIOPYTESSERACT_DEFAULT_CASCADE_THRESHOLD: float = 70
+# `Hedger`: hedge calls slower than this percentile of the recent latencies,
+# starting at most this fraction of extra processes
+AIOPYTESSERACT_DEFAULT_HEDGE_PERCENTILE: float = 95
+AIOPYTESSERACT_DEFAULT_HEDGE_BUDGET: float = 0.05
+# tesseract stores coordinates as int16 and rejects larger images
+TESSERACT_MAX_IMAGE_SIDE: int = 32767
 
 # https://tesseract-ocr.github.io/tessdoc/Data-Files-in-different-versions.html
 TESSERACT_LANGUAGES: set[str] = {
@@ -138,6 +217,44 @@ TESSERACT_LANGUAGES: set[str] = {
     "yor",
 }
 
+# lang="auto" runs OSD first and recognises with the detected script's languages.
+AIOPYTESSERACT_AUTO_LANGUAGE: str = "auto"
+# OSD script name -> candidate languages, most likely first; only the
+# installed ones are used. Latin is left out on purpose: OSD cannot tell
+# its many languages apart, so Latin pages use the router's `fallback`,
+# the caller's usual languages.
+AIOPYTESSERACT_SCRIPT_LANGUAGES: dict[str, tuple[str, ...]] = {
+    "Arabic": ("ara", "fas", "urd"),
+    "Armenian": ("hye",),
+    "Bengali": ("ben", "asm"),
+    "Canadian_Aboriginal": ("iku",),
+    "Cherokee": ("chr",),
+    "Cyrillic": ("rus", "ukr"),
+    "Devanagari": ("hin", "mar", "nep", "san"),
+    "Ethiopic": ("amh", "tir"),
+    "Fraktur": ("deu_frak",),
+    "Georgian": ("kat",),
+    "Greek": ("ell",),
+    "Gujarati": ("guj",),
+    "Gurmukhi": ("pan",),
+    "Han": ("chi_sim", "chi_tra"),
+    "Hangul": ("kor",),
+    "Hebrew": ("heb", "yid"),
+    "Japanese": ("jpn",),
+    "Kannada": ("kan",),
+    "Khmer": ("khm",),
+    "Korean": ("kor",),
+    "Lao": ("lao",),
+    "Malayalam": ("mal",),
+    "Myanmar": ("mya",),
+    "Sinhala": ("sin",),
+    "Syriac": ("syr",),
+    "Tamil": ("tam",),
+    "Telugu": ("tel",),
+    "Thai": ("tha",),
+    "Tibetan": ("bod",),
+}
+
 PAGE_SEGMENTATION_MODES: dict[int, str] = {
     0: "Orientation and script detection (OSD) only.",
     1: "Automatic page segmentation with OSD.",
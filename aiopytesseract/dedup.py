@@ -0,0 +1,192 @@
+"""Skip OCR of frames that look like one recently recognised.
+
+Consecutive video frames and screen captures rarely differ in content,
+but encoder noise makes their bytes differ, so an exact cache never
+hits. A difference hash (dHash) of a small grayscale thumbnail is stable
+under that noise: near-duplicate frames hash a few bits apart at most.
+The hash only sees coarse gradients, so a changed line of text can keep
+it intact; a hash match is confirmed against a larger thumbnail before
+a result is reused.
+"""
+
+import asyncio
+import io
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import TYPE_CHECKING, Concatenate, ParamSpec, TypeVar, cast
+
+if TYPE_CHECKING:
+    from PIL.Image import Image as PILImage
+
+P = ParamSpec("P")
+ResultT = TypeVar("ResultT")
+
+
+def dhash(image: bytes, size: int = 8) -> int:
+    """Difference hash of `image`, `size * size` bits.
+
+    Each bit tells whether a pixel of a `(size + 1) x size` grayscale
+    thumbnail is brighter than its right neighbour. Blocking, requires
+    Pillow (`pip install aiopytesseract[pillow]`).
+
+    :param image: encoded image.
+    :param size: thumbnail rows. (default: 8)
+    """
+    with _open_grayscale(image, size * 8) as grayscale:
+        return _difference_hash(grayscale, size)
+
+
+def _open_grayscale(image: bytes, draft: int) -> "PILImage":
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError(
+            "frame hashing requires Pillow: pip install aiopytesseract[pillow]"
+        ) from None
+
+    with Image.open(io.BytesIO(image)) as source:
+        # JPEG decoders can downscale by up to 8 while decoding.
+        source.draft("L", (draft, draft))
+        return source.convert("L")
+
+
+def _difference_hash(grayscale: "PILImage", size: int) -> int:
+    from PIL import Image
+
+    pixels = grayscale.resize((size + 1, size), Image.Resampling.BOX).tobytes()
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for column in range(size):
+            value = (value << 1) | (
+                pixels[offset + column] > pixels[offset + column + 1]
+            )
+    return value
+
+
+def _fingerprint(
+    image: bytes, hash_size: int, thumbnail_width: int
+) -> tuple[int, tuple[int, int], bytes]:
+    """dHash plus a `thumbnail_width` wide grayscale thumbnail, one decode."""
+    from PIL import Image
+
+    with _open_grayscale(image, max(hash_size * 8, thumbnail_width * 4)) as grayscale:
+        height = max(1, round(thumbnail_width * grayscale.height / grayscale.width))
+        thumbnail = grayscale.resize((thumbnail_width, height), Image.Resampling.BOX)
+        return (
+            _difference_hash(grayscale, hash_size),
+            thumbnail.size,
+            thumbnail.tobytes(),
+        )
+
+
+class FrameDeduplicator:
+    """Reuse the result of a near-identical recent frame of the same stream.
+
+    Each stream keeps the hashes and results of its last `window` OCRed
+    frames; a frame within `threshold` bits of one of them, OCRed by the
+    same command with the same options, gets that result back instead of
+    running tesseract. Text can change without moving the hash, so a match
+    also needs every pixel of a `thumbnail_width` wide grayscale thumbnail
+    within `pixel_threshold` levels of the remembered frame's.
+
+    :param threshold: largest Hamming distance counted as a duplicate. (default: 4)
+    :param pixel_threshold: largest thumbnail pixel difference, 0-255. (default: 12)
+    :param thumbnail_width: width of the confirming thumbnail. (default: 64)
+    :param window: recent frames remembered per stream. (default: 8)
+    :param hash_size: thumbnail rows, the hash has `hash_size ** 2` bits. (default: 8)
+    :param executor: executor used to hash frames. (default: event loop default)
+    """
+
+    def __init__(
+        self,
+        threshold: int = 4,
+        window: int = 8,
+        hash_size: int = 8,
+        pixel_threshold: int = 12,
+        thumbnail_width: int = 64,
+        executor: Executor | None = None,
+    ) -> None:
+        if threshold < 0:
+            raise ValueError(f"threshold must not be negative, got: {threshold}")
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got: {window}")
+        if pixel_threshold < 0:
+            raise ValueError(
+                f"pixel_threshold must not be negative, got: {pixel_threshold}"
+            )
+        if thumbnail_width < 1:
+            raise ValueError(
+                f"thumbnail_width must be at least 1, got: {thumbnail_width}"
+            )
+        self.threshold = threshold
+        self.window = window
+        self.hash_size = hash_size
+        self.pixel_threshold = pixel_threshold
+        self.thumbnail_width = thumbnail_width
+        self.executor = executor
+        self.calls: Counter[str] = Counter()
+        self.skipped: Counter[str] = Counter()
+        self._recent: dict[
+            str, deque[tuple[int, tuple[int, int], bytes, object, object]]
+        ] = {}
+
+    async def run(
+        self,
+        stream: str,
+        func: Callable[Concatenate[bytes, P], Awaitable[ResultT]],
+        image: str | bytes,
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> ResultT:
+        """Run `func(image, *args, **kwargs)` unless `stream` saw a near-duplicate.
+
+        :param stream: stream the frame belongs to, e.g. a camera or session id.
+        :param func: OCR command, e.g. `aiopytesseract.image_to_string`.
+        :param image: image input to tesseract. (valid values: str, bytes)
+        """
+        if isinstance(image, str):
+            image = Path(image).read_bytes()
+        self.calls[stream] += 1
+        loop = asyncio.get_running_loop()
+        try:
+            frame_hash, size, thumbnail = await loop.run_in_executor(
+                self.executor,
+                _fingerprint,
+                image,
+                self.hash_size,
+                self.thumbnail_width,
+            )
+        except (OSError, ValueError):
+            # undecodable, let the command report it the usual way
+            return await func(image, *args, **kwargs)
+        options = (func, args, tuple(sorted(kwargs.items())))
+        recent = self._recent.setdefault(stream, deque(maxlen=self.window))
+        for (
+            previous_hash,
+            previous_size,
+            previous,
+            previous_options,
+            result,
+        ) in reversed(recent):
+            if (
+                previous_options == options
+                and (frame_hash ^ previous_hash).bit_count() <= self.threshold
+                and previous_size == size
+                and max(abs(a - b) for a, b in zip(thumbnail, previous, strict=True))
+                <= self.pixel_threshold
+            ):
+                self.skipped[stream] += 1
+                return cast(ResultT, result)
+        result = await func(image, *args, **kwargs)
+        recent.append((frame_hash, size, thumbnail, options, result))
+        return result
+
+    def forget(self, stream: str) -> None:
+        """Drop the recent frames and counters of a finished stream."""
+        self._recent.pop(stream, None)
+        self.calls.pop(stream, None)
+        self.skipped.pop(stream, None)
@@ -0,0 +1,190 @@
+"""Trade accuracy for throughput while a `Scheduler` is overloaded."""
+
+import inspect
+import math
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache
+from typing import Concatenate, ParamSpec, TypeVar
+
+from attrs import evolve
+
+from aiopytesseract._logger import logger
+from aiopytesseract.models import Tier, TieredResult
+from aiopytesseract.preprocessing import Preprocess
+from aiopytesseract.profile import OCRProfile
+from aiopytesseract.scheduler import Scheduler
+
+P = ParamSpec("P")
+ResultT = TypeVar("ResultT")
+# tier options a profile carries itself
+_PROFILE_OPTIONS = ("tessdata_dir", "dpi", "oem", "psm")
+
+
+class DegradationPolicy:
+    """Step down to cheaper tiers under load and back up once it drops.
+
+    Before each job the policy compares the scheduler queue depth and the
+    smoothed end-to-end latency (queue wait included) with its thresholds.
+    Overload moves new jobs one tier down, e.g. to `tessdata_fast` models,
+    a downscaling `Preprocess` or the LSTM-only engine; recovery needs the
+    load to fall below `recover_ratio` of the thresholds, and tiers change
+    at most once per `hold` seconds, so the policy does not flap around a
+    threshold. Every result is tagged with the tier that produced it.
+
+    :param tiers: tiers from full quality to cheapest, the first is used under normal load.
+    :param scheduler: runs the jobs and provides the queue depth. (default: new Scheduler)
+    :param max_queued: degrade above this many queued jobs. (default: 2 * scheduler concurrency)
+    :param latency_slo: degrade above this smoothed latency in seconds. (default: None)
+    :param recover_ratio: fraction of the thresholds to fall below before recovering. (default: 0.5)
+    :param hold: minimum seconds between tier changes. (default: 5)
+    :param alpha: weight of each new latency observation. (default: 0.2)
+    """
+
+    def __init__(
+        self,
+        tiers: Sequence[Tier],
+        scheduler: Scheduler | None = None,
+        max_queued: int | None = None,
+        latency_slo: float | None = None,
+        recover_ratio: float = 0.5,
+        hold: float = 5,
+        alpha: float = 0.2,
+    ) -> None:
+        if not tiers:
+            raise ValueError("at least one tier is required")
+        if not 0 <= recover_ratio < 1:
+            raise ValueError(
+                f"recover_ratio must be in the range [0-1), got: {recover_ratio}"
+            )
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in the range (0-1], got: {alpha}")
+        self.tiers = tuple(tiers)
+        self.scheduler = scheduler or Scheduler()
+        self.max_queued = (
+            2 * self.scheduler.concurrency if max_queued is None else max_queued
+        )
+        self.latency_slo = latency_slo
+        self.recover_ratio = recover_ratio
+        self.hold = hold
+        self.alpha = alpha
+        self._level = 0
+        self._changed = -math.inf
+        self._latency: float | None = None
+        self._parameters: dict[object, frozenset[str]] = {}
+
+    @property
+    def tier(self) -> Tier:
+        """Tier new jobs currently run with."""
+        return self.tiers[self._level]
+
+    @property
+    def latency(self) -> float | None:
+        """Smoothed end-to-end latency in seconds, None before the first job."""
+        return self._latency
+
+    def select(self) -> Tier:
+        """Re-evaluate the load and return the tier for the next job."""
+        now = time.monotonic()
+        if now - self._changed < self.hold:
+            return self.tier
+        queued = self.scheduler.queued
+        latency = self._latency
+        slo = self.latency_slo
+        overloaded = queued > self.max_queued or (
+            slo is not None and latency is not None and latency > slo
+        )
+        relaxed = queued <= self.max_queued * self.recover_ratio and (
+            slo is None or latency is None or latency <= slo * self.recover_ratio
+        )
+        if overloaded and self._level < len(self.tiers) - 1:
+            self._switch(self._level + 1, now, queued)
+        elif relaxed and not overloaded and self._level > 0:
+            self._switch(self._level - 1, now, queued)
+        return self.tier
+
+    def observe(self, seconds: float) -> None:
+        """Record the end-to-end latency of a finished job."""
+        self._latency = (
+            seconds
+            if self._latency is None
+            else self.alpha * seconds + (1 - self.alpha) * self._latency
+        )
+
+    async def run(
+        self,
+        func: Callable[Concatenate[bytes, P], Awaitable[ResultT]],
+        image: str | bytes,
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> TieredResult[ResultT]:
+        """Run `func(image, *args, **kwargs)` through the scheduler at the current tier.
+
+        The tier overrides the `tessdata_dir`, `dpi`, `oem`, `psm` and
+        `preprocess` keyword arguments that `func` accepts, or the options
+        of a `profile`. A tier setting `dpi` without `preprocess` downscales
+        the image to that resolution (requires Pillow), a bare `--dpi`
+        would only relabel it.
+
+        :param func: OCR command, e.g. `aiopytesseract.image_to_string`.
+        :param image: image input to tesseract. (valid values: str, bytes)
+        """
+        tier = self.select()
+        options = _tier_options(tier)
+        profile = kwargs.get("profile")
+        if isinstance(profile, OCRProfile):
+            kwargs["profile"] = _tiered_profile(profile, tier)
+            options = {
+                name: value
+                for name, value in options.items()
+                if name not in _PROFILE_OPTIONS
+            }
+        parameters = self._accepted(func)
+        kwargs.update(
+            {name: value for name, value in options.items() if name in parameters}
+        )
+        started = time.monotonic()
+        result = await self.scheduler.run(func, image, *args, **kwargs)
+        self.observe(time.monotonic() - started)
+        return TieredResult(result, tier)
+
+    def _accepted(
+        self, func: Callable[Concatenate[bytes, P], Awaitable[ResultT]]
+    ) -> frozenset[str]:
+        parameters = self._parameters.get(func)
+        if parameters is None:
+            parameters = frozenset(inspect.signature(func).parameters)
+            self._parameters[func] = parameters
+        return parameters
+
+    def _switch(self, level: int, now: float, queued: int) -> None:
+        logger.info(
+            f"Degradation tier {self.tier} -> {self.tiers[level]} "
+            f"(queued: {queued}, latency: {self._latency})"
+        )
+        self._level = level
+        self._changed = now
+
+
+def _tier_options(tier: Tier) -> dict[str, object]:
+    options = tier.options()
+    if tier.dpi is not None and tier.preprocess is None:
+        del options["dpi"]
+        options["preprocess"] = Preprocess(grayscale=False, target_dpi=tier.dpi)
+    return options
+
+
+@lru_cache(maxsize=64)
+def _tiered_profile(profile: OCRProfile, tier: Tier) -> OCRProfile:
+    # validated once per (profile, tier); a dpi without preprocess is
+    # applied by downscaling, see _tier_options
+    return evolve(
+        profile,
+        tessdata_dir=(
+            profile.tessdata_dir if tier.tessdata_dir is None else tier.tessdata_dir
+        ),
+        dpi=profile.dpi if tier.dpi is None or tier.preprocess is None else tier.dpi,
+        oem=profile.oem if tier.oem is None else tier.oem,
+        psm=profile.psm if tier.psm is None else tier.psm,
+    )
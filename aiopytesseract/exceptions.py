@@ -69,3 +69,21 @@ class ImageFormatError(TesseractError):
             f"Image type '{image_type.__name__}' is not supported. Use str or bytes"
         )
         super().__init__(message)
+
+
+class InvalidImageError(TesseractRuntimeError):
+    def __init__(self, reason: str) -> None:
+        # raised before tesseract runs, so skip the process failure wording
+        TesseractError.__init__(self, f"Invalid image: {reason}")
+
+
+class TessdataStagingError(TesseractError):
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Tessdata staging failed: {reason}")
+
+
+class OCRServerError(TesseractError):
+    def __init__(self, status: int, error: str, message: str) -> None:
+        self.status = status
+        self.error = error
+        super().__init__(f"OCR server error {status} ({error}): {message}")
@@ -0,0 +1,147 @@
+"""Cut tail latency by racing a second process against slow calls.
+
+A tesseract process occasionally stalls for seconds (a noisy neighbour,
+swapping, a pathological image) and that single call sets the p99. A
+`Hedger` starts an identical second call once the first has run longer
+than a percentile of the recent latencies; the first result wins and the
+other call is cancelled, which kills its process.
+"""
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Concatenate, ParamSpec, TypeVar
+
+from aiopytesseract._logger import logger
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_DEFAULT_HEDGE_BUDGET,
+    AIOPYTESSERACT_DEFAULT_HEDGE_PERCENTILE,
+)
+from aiopytesseract.models import HedgeStats
+
+P = ParamSpec("P")
+ResultT = TypeVar("ResultT")
+
+
+class Hedger:
+    """Hedge calls that run longer than `percentile` of the recent latencies.
+
+    Only hedge idempotent calls, e.g. the `image_to_*` commands; a call
+    writing output files would run twice. Hedging starts once `min_samples`
+    latencies were observed, and at most `budget` extra calls (0.05: 5% of
+    the calls) are hedged, so a slow backend is not overloaded further.
+    Errors are not hedged: a call failing before the delay raises, after it
+    the other call may still win.
+
+    :param percentile: hedge calls slower than this percentile of the recent latencies. (default: 95)
+    :param budget: maximum extra calls, as a fraction of the calls. (default: 0.05)
+    :param window: number of recent latencies the percentile is taken from. (default: 256)
+    :param min_samples: latencies observed before hedging starts. (default: 20)
+    """
+
+    def __init__(
+        self,
+        percentile: float = AIOPYTESSERACT_DEFAULT_HEDGE_PERCENTILE,
+        budget: float = AIOPYTESSERACT_DEFAULT_HEDGE_BUDGET,
+        window: int = 256,
+        min_samples: int = 20,
+    ) -> None:
+        if not 0 < percentile <= 100:
+            raise ValueError(
+                f"percentile must be in the range (0-100], got: {percentile}"
+            )
+        if not 0 <= budget <= 1:
+            raise ValueError(f"budget must be in the range [0-1], got: {budget}")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError(
+                f"window ({window}) must hold at least min_samples ({min_samples}) >= 1"
+            )
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._calls = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+        self._denied = 0
+
+    @property
+    def delay(self) -> float | None:
+        """Seconds after which a call is hedged, None before `min_samples` latencies."""
+        if len(self._latencies) < self.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        # nearest rank
+        rank = math.ceil(self.percentile / 100 * len(latencies))
+        return latencies[max(rank, 1) - 1]
+
+    @property
+    def stats(self) -> HedgeStats:
+        """Counters so far, with the current delay."""
+        return HedgeStats(
+            self._calls, self._hedged, self._hedge_wins, self._denied, self.delay
+        )
+
+    def observe(self, seconds: float) -> None:
+        """Record the latency of a finished call."""
+        self._latencies.append(seconds)
+
+    def reset(self) -> None:
+        self._latencies.clear()
+        self._calls = self._hedged = self._hedge_wins = self._denied = 0
+
+    async def run(
+        self,
+        func: Callable[Concatenate[str | bytes, P], Awaitable[ResultT]],
+        image: str | bytes,
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> ResultT:
+        """Run `func(image, *args, **kwargs)`, hedged if it is slow.
+
+        :param func: OCR command, e.g. `aiopytesseract.image_to_string`.
+        :param image: image input to tesseract. (valid values: str, bytes)
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        delay = self.delay
+        self._calls += 1
+        primary = asyncio.ensure_future(func(image, *args, **kwargs))
+        tasks = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._hedged + 1 > self.budget * self._calls:
+                    self._denied += 1
+                elif not done:
+                    logger.debug(f"Hedging {func} after {delay:.3f}s")
+                    self._hedged += 1
+                    tasks.append(asyncio.ensure_future(func(image, *args, **kwargs)))
+            winner = await _first_success(tasks)
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                # the command kills its process on cancellation
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        result = winner.result()
+        if winner is not primary:
+            self._hedge_wins += 1
+        self.observe(loop.time() - started)
+        return result
+
+
+async def _first_success(
+    tasks: Sequence["asyncio.Future[ResultT]"],
+) -> "asyncio.Future[ResultT]":
+    # the first call to succeed, or the first error once every call failed
+    pending = set(tasks)
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            if task in done and task.exception() is None:
+                return task
+    return tasks[0]
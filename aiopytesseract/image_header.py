@@ -0,0 +1,297 @@
+"""Pure-Python image header sniffing.
+
+Reads format, dimensions, bit depth and embedded DPI from the first bytes of
+an image so junk input is rejected before a tesseract process is spawned.
+"""
+
+import re
+import struct
+from collections.abc import Callable
+
+from aiopytesseract.exceptions import InvalidImageError
+from aiopytesseract.models import ImageInfo
+
+_INCH_PER_METER = 0.0254
+_PNG_CHANNELS: dict[int, int] = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# SOF markers carry the frame size, C4 (DHT), C8 (JPG) and CC (DAC) do not.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# StripOffsets and StripByteCounts, read in full to detect truncated data
+_TIFF_STRIP_TAGS = frozenset((273, 279))
+_PNM_TOKEN = re.compile(rb"(?:\s|#[^\n]*\n)*(\S+)")
+
+
+def sniff(image: bytes) -> ImageInfo:
+    """Identify an image from its header.
+
+    Supported formats: PNG, JPEG, TIFF, BMP, PNM (P1-P7), GIF, WebP and JPEG 2000.
+
+    :param image: encoded image.
+    :raises InvalidImageError: empty, truncated or unsupported input.
+    """
+    if not image:
+        raise InvalidImageError("empty image")
+    for signature, reader in _READERS:
+        if image.startswith(signature):
+            try:
+                info = reader(image)
+            except (struct.error, IndexError, ValueError):
+                raise InvalidImageError("truncated or corrupt image header") from None
+            if info.width <= 0 or info.height <= 0:
+                raise InvalidImageError(f"invalid {info.format} image size")
+            return info
+    raise InvalidImageError("unsupported image format")
+
+
+def _png(image: bytes) -> ImageInfo:
+    if image[12:16] != b"IHDR":
+        raise ValueError("missing IHDR")
+    width, height, depth, color_type = struct.unpack_from(">IIBB", image, 16)
+    # decoders ignore bytes after IEND and tolerate some chunk damage, only
+    # an image cut before IEND is rejected
+    if image.rfind(b"IEND", 33) < 0:
+        raise InvalidImageError("truncated png image")
+    dpi = None
+    offset = 8
+    while offset + 8 <= len(image):
+        length, chunk = struct.unpack_from(">I4s", image, offset)
+        if chunk == b"pHYs":
+            x, y, unit = struct.unpack_from(">IIB", image, offset + 8)
+            if unit == 1:
+                dpi = (x * _INCH_PER_METER, y * _INCH_PER_METER)
+            break
+        if chunk in (b"IDAT", b"IEND"):
+            break
+        offset += length + 12
+    return ImageInfo(
+        "png", width, height, depth * _PNG_CHANNELS.get(color_type, 1), dpi
+    )
+
+
+def _jpeg(image: bytes) -> ImageInfo:
+    dpi = None
+    offset = 2
+    while offset + 4 <= len(image):
+        if image[offset] != 0xFF:
+            raise ValueError("invalid marker")
+        marker = image[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        (length,) = struct.unpack_from(">H", image, offset + 2)
+        if marker == 0xE0 and image[offset + 4 : offset + 9] == b"JFIF\x00":
+            unit, x, y = struct.unpack_from(">BHH", image, offset + 11)
+            if unit == 1:
+                dpi = (float(x), float(y))
+            elif unit == 2:
+                dpi = (x * 2.54, y * 2.54)
+        elif marker in _JPEG_SOF_MARKERS:
+            precision, height, width, components = struct.unpack_from(
+                ">BHHB", image, offset + 4
+            )
+            return ImageInfo("jpeg", width, height, precision * components, dpi)
+        offset += length + 2
+    raise InvalidImageError("truncated jpeg image")
+
+
+def _tiff(image: bytes) -> ImageInfo:
+    order = "<" if image[:2] == b"II" else ">"
+    (ifd,) = struct.unpack_from(f"{order}I", image, 4)
+    (count,) = struct.unpack_from(f"{order}H", image, ifd)
+    if ifd + 2 + count * 12 > len(image):
+        raise InvalidImageError("truncated tiff image")
+    tags: dict[int, tuple[float, ...]] = {}
+    for index in range(count):
+        entry = ifd + 2 + index * 12
+        tag, kind, values = struct.unpack_from(f"{order}HHI", image, entry)
+        if kind == 3:  # SHORT
+            fmt, size = "H", 2
+        elif kind == 4:  # LONG
+            fmt, size = "I", 4
+        elif kind == 5:  # RATIONAL
+            fmt, size = "II", 8
+        else:
+            continue
+        data = entry + 8
+        if size * values > 4:
+            (data,) = struct.unpack_from(f"{order}I", image, entry + 8)
+        if tag not in _TIFF_STRIP_TAGS:
+            values = min(values, 4)
+        numbers = struct.unpack_from(f"{order}{fmt * values}", image, data)
+        if kind == 5:
+            numbers = tuple(
+                num / den if den else 0.0
+                for num, den in zip(numbers[::2], numbers[1::2], strict=True)
+            )
+        tags[tag] = numbers
+    strips = zip(tags.get(273, ()), tags.get(279, ()), strict=False)
+    if any(offset + size > len(image) for offset, size in strips):
+        raise InvalidImageError("truncated tiff image")
+    bits = tags.get(258, (1,))
+    samples = int(tags.get(277, (len(bits),))[0])
+    dpi = None
+    if 282 in tags and 283 in tags and tags.get(296, (2,))[0] != 1:
+        scale = 2.54 if tags.get(296, (2,))[0] == 3 else 1.0
+        dpi = (tags[282][0] * scale, tags[283][0] * scale)
+    return ImageInfo(
+        "tiff",
+        int(tags.get(256, (0,))[0]),
+        int(tags.get(257, (0,))[0]),
+        int(bits[0]) * samples,
+        dpi,
+    )
+
+
+def _bmp(image: bytes) -> ImageInfo:
+    (size,) = struct.unpack_from("<I", image, 2)
+    if size > len(image):
+        raise InvalidImageError("truncated bmp image")
+    (header,) = struct.unpack_from("<I", image, 14)
+    dpi = None
+    if header == 12:
+        width, height, _, depth = struct.unpack_from("<HHHH", image, 18)
+    else:
+        width, height, _, depth = struct.unpack_from("<iiHH", image, 18)
+        x, y = struct.unpack_from("<ii", image, 38)
+        if x > 0 and y > 0:
+            dpi = (x * _INCH_PER_METER, y * _INCH_PER_METER)
+    return ImageInfo("bmp", width, abs(height), depth, dpi)
+
+
+def _pnm(image: bytes) -> ImageInfo:
+    kind = image[1:2]
+    if kind == b"7":
+        header_end = image.index(b"ENDHDR")
+        fields = dict(
+            line.split(maxsplit=1)
+            for line in image[3:header_end].splitlines()
+            if line.strip() and not line.startswith(b"#")
+        )
+        width, height = int(fields[b"WIDTH"]), int(fields[b"HEIGHT"])
+        depth, maxval = int(fields[b"DEPTH"]), int(fields[b"MAXVAL"])
+        payload = len(image) - image.index(b"\n", header_end) - 1
+        return _pnm_info(kind, width, height, depth, maxval, payload)
+    offset = 2
+    values = []
+    for _ in range(2 if kind in (b"1", b"4") else 3):
+        match = _PNM_TOKEN.match(image, offset)
+        if match is None:
+            raise ValueError("truncated pnm header")
+        values.append(int(match.group(1)))
+        offset = match.end()
+    width, height = values[0], values[1]
+    maxval = values[2] if len(values) == 3 else 1
+    depth = 3 if kind in (b"3", b"6") else 1
+    # a single whitespace byte separates the header from the raster
+    return _pnm_info(kind, width, height, depth, maxval, len(image) - offset - 1)
+
+
+def _pnm_info(
+    kind: bytes, width: int, height: int, depth: int, maxval: int, payload: int
+) -> ImageInfo:
+    sample_bytes = 2 if maxval > 255 else 1
+    if kind == b"4":
+        expected = (width + 7) // 8 * height
+    elif kind in (b"5", b"6", b"7"):
+        expected = width * height * depth * sample_bytes
+    else:
+        expected = 0  # plain (ASCII) formats have no fixed raster size
+    if payload < expected:
+        raise InvalidImageError("truncated pnm image")
+    bit_depth = 1 if maxval == 1 else 8 * sample_bytes
+    return ImageInfo("pnm", width, height, bit_depth * depth)
+
+
+def _gif(image: bytes) -> ImageInfo:
+    width, height, packed = struct.unpack_from("<HHB", image, 6)
+    offset = 13
+    if packed & 0x80:  # global color table
+        offset += 3 << ((packed & 0x07) + 1)
+    # block by block up to the trailer, bytes after it are ignored as decoders do
+    while True:
+        if offset >= len(image):
+            raise InvalidImageError("truncated gif image")
+        block = image[offset]
+        if block == 0x3B:  # trailer
+            break
+        if block == 0x2C:  # image descriptor, then the LZW minimum code size
+            (flags,) = struct.unpack_from("<B", image, offset + 9)
+            offset += 10
+            if flags & 0x80:  # local color table
+                offset += 3 << ((flags & 0x07) + 1)
+            offset += 1
+        elif block == 0x21:  # extension label
+            offset += 2
+        else:
+            raise ValueError("invalid gif block")
+        offset = _gif_sub_blocks(image, offset)
+    return ImageInfo("gif", width, height, (packed & 0x07) + 1)
+
+
+def _gif_sub_blocks(image: bytes, offset: int) -> int:
+    # data sub-blocks end with an empty one
+    while True:
+        if offset >= len(image):
+            raise InvalidImageError("truncated gif image")
+        size = image[offset]
+        offset += size + 1
+        if not size:
+            return offset
+
+
+def _webp(image: bytes) -> ImageInfo:
+    if image[8:12] != b"WEBP":
+        raise InvalidImageError("unsupported image format")
+    (size,) = struct.unpack_from("<I", image, 4)
+    if size + 8 > len(image):
+        raise InvalidImageError("truncated webp image")
+    chunk = image[12:16]
+    if chunk == b"VP8X":
+        width = int.from_bytes(image[24:27], "little") + 1
+        height = int.from_bytes(image[27:30], "little") + 1
+        alpha = image[20] & 0x10
+    elif chunk == b"VP8L":
+        (bits,) = struct.unpack_from("<I", image, 21)
+        width = (bits & 0x3FFF) + 1
+        height = ((bits >> 14) & 0x3FFF) + 1
+        alpha = (bits >> 28) & 1
+    elif chunk == b"VP8 ":
+        if image[23:26] != b"\x9d\x01\x2a":
+            raise ValueError("invalid VP8 frame")
+        width, height = struct.unpack_from("<HH", image, 26)
+        width, height, alpha = width & 0x3FFF, height & 0x3FFF, 0
+    else:
+        raise ValueError("unknown webp chunk")
+    return ImageInfo("webp", width, height, 32 if alpha else 24)
+
+
+def _jp2(image: bytes) -> ImageInfo:
+    if image.startswith(b"\xff\x4f\xff\x51"):  # raw J2K codestream, SIZ marker
+        width, height, x_offset, y_offset = struct.unpack_from(">IIII", image, 8)
+        (components,) = struct.unpack_from(">H", image, 40)
+        (precision,) = struct.unpack_from(">B", image, 42)
+        return ImageInfo(
+            "jp2",
+            width - x_offset,
+            height - y_offset,
+            ((precision & 0x7F) + 1) * components,
+        )
+    offset = image.find(b"ihdr")
+    if offset < 0:
+        raise InvalidImageError("truncated jp2 image")
+    height, width, components, bits = struct.unpack_from(">IIHB", image, offset + 4)
+    return ImageInfo("jp2", width, height, ((bits & 0x7F) + 1) * components)
+
+
+_READERS: tuple[tuple[bytes, Callable[[bytes], ImageInfo]], ...] = (
+    (b"\x89PNG\r\n\x1a\n", _png),
+    (b"\xff\xd8\xff", _jpeg),
+    (b"II*\x00", _tiff),
+    (b"MM\x00*", _tiff),
+    (b"BM", _bmp),
+    (b"GIF87a", _gif),
+    (b"GIF89a", _gif),
+    (b"RIFF", _webp),
+    (b"\x00\x00\x00\x0cjP  \r\n\x87\n", _jp2),
+    (b"\xff\x4f\xff\x51", _jp2),
+    *((f"P{kind}".encode(), _pnm) for kind in range(1, 8)),
+)
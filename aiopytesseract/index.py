@@ -0,0 +1,434 @@
+"""Inverted index of the words of `image_to_data` results.
+
+Normalized tokens map to their postings (page, block, line, box and
+confidence), a grid of fixed-size cells maps page areas to the words
+overlapping them. The whole index is one flat little-endian buffer, so an
+index saved with `WordIndex.save` is memory-mapped by `WordIndex.load`
+and queried without being read or unpacked up front.
+
+Layout: header, token offsets and posting ranges (uint32, token order),
+postings (token order), grid cell keys (page, row, column, sorted), cell
+posting ranges and posting ids (uint32), then the UTF-8 tokens.
+"""
+
+import mmap
+import struct
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+
+from aiopytesseract.constants import AIOPYTESSERACT_DEFAULT_INDEX_CELL_SIZE
+from aiopytesseract.models import Data, Posting
+
+_MAGIC = b"AIOPWIX1"
+# magic, cell size, tokens, postings, cells, cell references, token bytes
+_HEADER = struct.Struct("<8sIIIIII")
+_UINT = struct.Struct("<I")
+# page, block, par, line, word, left, top, width, height, conf
+_POSTING = struct.Struct("<IIIIIiiiif")
+# page, row, column
+_CELL = struct.Struct("<Iii")
+_WORD_LEVEL = 5
+
+
+def normalize(text: str) -> str:
+    """Index form of a word: NFKC, case folded, without surrounding punctuation.
+
+    :param text: word as recognised, e.g. `"Invoice:"`.
+    """
+    token = unicodedata.normalize("NFKC", text).casefold()
+    start, end = 0, len(token)
+    while start < end and not token[start].isalnum():
+        start += 1
+    while end > start and not token[end - 1].isalnum():
+        end -= 1
+    return token[start:end]
+
+
+class _Array:
+    # uint32 array view of the buffer, usable with bisect
+    def __init__(self, buffer: bytes | mmap.mmap, offset: int, length: int) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return int(_UINT.unpack_from(self._buffer, self._offset + 4 * index)[0])
+
+
+class _Tokens:
+    """Sorted tokens of a `WordIndex`, decoded on access."""
+
+    def __init__(self, index: "WordIndex") -> None:
+        self._index = index
+
+    def __len__(self) -> int:
+        return self._index._token_count
+
+    def __getitem__(self, index: int) -> str:
+        return self._index._token(index)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._index._token(number) for number in range(len(self)))
+
+
+class _Cells:
+    def __init__(self, buffer: bytes | mmap.mmap, offset: int, length: int) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> tuple[int, int, int]:
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        page, row, column = _CELL.unpack_from(
+            self._buffer, self._offset + _CELL.size * index
+        )
+        return page, row, column
+
+
+class WordIndex:
+    """Token and spatial lookups over the words of one or more pages.
+
+    Build it with `from_data` or `from_pages`, or `load` a saved one.
+
+    >>> index = WordIndex.from_data(await image_to_data("scan.png"))
+    >>> [posting.bbox for posting in index.lookup("Invoice")]
+    """
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        if len(buffer) < _HEADER.size or buffer[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("not a word index")
+        _, cell_size, tokens, postings, cells, references, token_bytes = (
+            _HEADER.unpack_from(buffer)
+        )
+        self._buffer = buffer
+        self.cell_size: int = cell_size
+        self._token_count: int = tokens
+        self._posting_count: int = postings
+        offset = _HEADER.size
+        self._token_offsets = _Array(buffer, offset, tokens + 1)
+        offset += 4 * (tokens + 1)
+        self._token_postings = _Array(buffer, offset, tokens + 1)
+        offset += 4 * (tokens + 1)
+        self._postings_offset = offset
+        offset += _POSTING.size * postings
+        self._cells = _Cells(buffer, offset, cells)
+        offset += _CELL.size * cells
+        self._cell_postings = _Array(buffer, offset, cells + 1)
+        offset += 4 * (cells + 1)
+        self._references = _Array(buffer, offset, references)
+        offset += 4 * references
+        self._tokens_offset = offset
+        if len(buffer) != offset + token_bytes:
+            raise ValueError("truncated word index")
+        self.tokens = _Tokens(self)
+
+    @classmethod
+    def from_data(
+        cls,
+        rows: Iterable[Data],
+        cell_size: int = AIOPYTESSERACT_DEFAULT_INDEX_CELL_SIZE,
+    ) -> "WordIndex":
+        """Index the words of `image_to_data` rows, pages by `page_num`.
+
+        :param rows: `image_to_data` output, other levels than words are skipped.
+        :param cell_size: side of the spatial grid cells in pixels. (default: 256)
+        """
+        return cls._build(((row.page_num, row) for row in rows), cell_size)
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Iterable[Iterable[Data]],
+        cell_size: int = AIOPYTESSERACT_DEFAULT_INDEX_CELL_SIZE,
+    ) -> "WordIndex":
+        """Index a batch of `image_to_data` results, numbering pages from 1.
+
+        :param pages: `image_to_data` output of each page, in order.
+        :param cell_size: side of the spatial grid cells in pixels. (default: 256)
+        """
+        return cls._build(
+            ((page, row) for page, rows in enumerate(pages, 1) for row in rows),
+            cell_size,
+        )
+
+    @classmethod
+    def _build(cls, rows: Iterable[tuple[int, Data]], cell_size: int) -> "WordIndex":
+        if cell_size < 1:
+            raise ValueError(f"cell_size must be at least 1, got: {cell_size}")
+        words = sorted(
+            (
+                (token, page, row)
+                for page, row in rows
+                if row.level == _WORD_LEVEL and (token := normalize(row.text))
+            ),
+            key=lambda word: (
+                word[0],
+                word[1],
+                word[2].block_num,
+                word[2].par_num,
+                word[2].line_num,
+                word[2].word_num,
+            ),
+        )
+        tokens: list[bytes] = []
+        token_offsets = [0]
+        token_postings = [0]
+        postings = bytearray()
+        grid: defaultdict[tuple[int, int, int], list[int]] = defaultdict(list)
+        for number, (token, page, row) in enumerate(words):
+            if not tokens or words[number - 1][0] != token:
+                if tokens:
+                    token_postings.append(number)
+                tokens.append(token.encode())
+                token_offsets.append(token_offsets[-1] + len(tokens[-1]))
+            postings += _POSTING.pack(
+                page,
+                row.block_num,
+                row.par_num,
+                row.line_num,
+                row.word_num,
+                row.left,
+                row.top,
+                row.width,
+                row.height,
+                row.conf,
+            )
+            right = row.left + max(row.width, 1) - 1
+            bottom = row.top + max(row.height, 1) - 1
+            for cell_row in range(row.top // cell_size, bottom // cell_size + 1):
+                for column in range(row.left // cell_size, right // cell_size + 1):
+                    grid[page, cell_row, column].append(number)
+        if words:
+            token_postings.append(len(words))
+        cells = sorted(grid)
+        references = [number for cell in cells for number in grid[cell]]
+        cell_postings = [0]
+        for cell in cells:
+            cell_postings.append(cell_postings[-1] + len(grid[cell]))
+        blob = b"".join(tokens)
+        buffer = b"".join(
+            (
+                _HEADER.pack(
+                    _MAGIC,
+                    cell_size,
+                    len(tokens),
+                    len(words),
+                    len(cells),
+                    len(references),
+                    len(blob),
+                ),
+                struct.pack(f"<{len(token_offsets)}I", *token_offsets),
+                struct.pack(f"<{len(token_postings)}I", *token_postings),
+                postings,
+                b"".join(_CELL.pack(*cell) for cell in cells),
+                struct.pack(f"<{len(cell_postings)}I", *cell_postings),
+                struct.pack(f"<{len(references)}I", *references),
+                blob,
+            )
+        )
+        return cls(buffer)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "WordIndex":
+        """Memory-map an index written by `save`, pages are read as queried.
+
+        :param path: index file.
+        """
+        with Path(path).open("rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except Exception:
+            buffer.close()
+            raise
+
+    def save(self, path: str | Path) -> None:
+        """Write the index to `path` for `load`.
+
+        :param path: index file, replaced if it exists.
+        """
+        Path(path).write_bytes(self._buffer)
+
+    def close(self) -> None:
+        """Unmap an index opened with `load`."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "WordIndex":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._posting_count
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._find(normalize(word)) is not None
+
+    def lookup(self, word: str, page: int | None = None) -> list[Posting]:
+        """Occurrences of `word` after normalization.
+
+        :param word: word to look up, e.g. `"invoice"`.
+        :param page: only occurrences on this page. (default: every page)
+        """
+        number = self._find(normalize(word))
+        if number is None:
+            return []
+        return self._token_postings_of(number, page)
+
+    def prefix(self, prefix: str, page: int | None = None) -> dict[str, list[Posting]]:
+        """Occurrences of the tokens starting with `prefix`, per token.
+
+        :param prefix: token prefix, normalized like words, e.g. `"inv"`.
+        :param page: only occurrences on this page. (default: every page)
+        """
+        prefix = normalize(prefix)
+        matches: dict[str, list[Posting]] = {}
+        for number in range(bisect_left(self.tokens, prefix), self._token_count):
+            if not self.tokens[number].startswith(prefix):
+                break
+            if postings := self._token_postings_of(number, page):
+                matches[self.tokens[number]] = postings
+        return matches
+
+    def fuzzy(
+        self, word: str, max_distance: int = 1, page: int | None = None
+    ) -> dict[str, list[Posting]]:
+        """Occurrences of the tokens within `max_distance` edits of `word`.
+
+        Tokens are returned by increasing edit (Levenshtein) distance. Every
+        token is compared, in a linear scan of the token list.
+
+        :param word: word to look up, e.g. `"lnvoice"`.
+        :param max_distance: largest number of inserted, deleted or replaced characters. (default: 1)
+        :param page: only occurrences on this page. (default: every page)
+        """
+        word = normalize(word)
+        found: list[tuple[int, str, int]] = []
+        for number, token in enumerate(self.tokens):
+            if abs(len(token) - len(word)) > max_distance:
+                continue
+            distance = _distance(word, token, max_distance)
+            if distance <= max_distance:
+                found.append((distance, token, number))
+        matches: dict[str, list[Posting]] = {}
+        for _, token, number in sorted(found):
+            if postings := self._token_postings_of(number, page):
+                matches[token] = postings
+        return matches
+
+    def within(
+        self, page: int, box: tuple[int, int, int, int], conf: float | None = None
+    ) -> list[Posting]:
+        """Words of `page` overlapping `box`, in reading order.
+
+        :param page: page number.
+        :param box: (left, top, right, bottom) area in pixels.
+        :param conf: only words recognised with at least this confidence. (default: any)
+        """
+        left, top, right, bottom = box
+        size = self.cell_size
+        numbers: set[int] = set()
+        for row in range(max(top, 0) // size, max(bottom - 1, 0) // size + 1):
+            first = bisect_left(self._cells, (page, row, max(left, 0) // size))
+            last = bisect_right(self._cells, (page, row, max(right - 1, 0) // size))
+            if first < last:
+                start, end = self._cell_postings[first], self._cell_postings[last]
+                numbers.update(self._references[i] for i in range(start, end))
+        postings = []
+        for number in numbers:
+            posting = self._posting(number)
+            p_left, p_top, p_right, p_bottom = posting.bbox
+            if (
+                p_left < right
+                and left < max(p_right, p_left + 1)
+                and p_top < bottom
+                and top < max(p_bottom, p_top + 1)
+                and (conf is None or posting.conf >= conf)
+            ):
+                postings.append(posting)
+        postings.sort(key=_reading_order)
+        return postings
+
+    def __iter__(self) -> Iterator[Posting]:
+        """Every posting, in token order."""
+        return (self._posting(number) for number in range(self._posting_count))
+
+    def _find(self, token: str) -> int | None:
+        number = bisect_left(self.tokens, token)
+        if number < self._token_count and self.tokens[number] == token:
+            return number
+        return None
+
+    def _token(self, number: int) -> str:
+        if not 0 <= number < self._token_count:
+            raise IndexError(number)
+        start = self._tokens_offset + self._token_offsets[number]
+        end = self._tokens_offset + self._token_offsets[number + 1]
+        return self._buffer[start:end].decode()
+
+    def _token_postings_of(self, number: int, page: int | None) -> list[Posting]:
+        token = self._token(number)
+        start, end = self._token_postings[number], self._token_postings[number + 1]
+        postings = [
+            Posting(token, *values)
+            for values in _POSTING.iter_unpack(
+                self._buffer[
+                    self._postings_offset
+                    + _POSTING.size * start : self._postings_offset
+                    + _POSTING.size * end
+                ]
+            )
+        ]
+        if page is not None:
+            postings = [posting for posting in postings if posting.page == page]
+        return postings
+
+    def _posting(self, number: int) -> Posting:
+        token = self._token(bisect_right(self._token_postings, number) - 1)
+        values = _POSTING.unpack_from(
+            self._buffer, self._postings_offset + _POSTING.size * number
+        )
+        return Posting(token, *values)
+
+
+def _reading_order(posting: Posting) -> tuple[int, int, int, int, int]:
+    return posting.page, posting.block, posting.par, posting.line, posting.word
+
+
+def _distance(a: str, b: str, limit: int) -> int:
+    # Levenshtein distance, `limit + 1` as soon as it is certain to exceed `limit`
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
@@ -0,0 +1,157 @@
+"""`lang="auto"`: pick recognition languages from a script detection pass.
+
+Recognition cost grows with every language in `lang`, while OSD (psm 0)
+is cheap: it only classifies the script. Routing runs OSD once per
+document, maps the detected script to the installed candidate languages
+and recognises with those alone.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from aiopytesseract._logger import logger
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_DEFAULT_CACHE_SIZE,
+    AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    AIOPYTESSERACT_SCRIPT_LANGUAGES,
+)
+from aiopytesseract.exceptions import TesseractRuntimeError
+
+_language_router: ContextVar["LanguageRouter | None"] = ContextVar(
+    "aiopytesseract_language_router", default=None
+)
+_document: ContextVar[str | None] = ContextVar("aiopytesseract_document", default=None)
+_default_router: "LanguageRouter | None" = None
+
+
+class LanguageRouter:
+    """Resolve `lang="auto"` through orientation and script detection.
+
+    Results are cached per document, keyed by the `document` argument or,
+    without one, by the image digest, so every page of a document after
+    the first skips the detection pass. Concurrent pages of the same
+    document wait for a single detection.
+
+    :param scripts: OSD script name to candidate languages. (default: AIOPYTESSERACT_SCRIPT_LANGUAGES)
+    :param fallback: languages used for Latin pages, unmapped scripts, failed detection or no installed candidate, e.g. "eng+por+spa". (default: eng)
+    :param min_confidence: lowest OSD script confidence trusted. (default: 0)
+    :param cache_size: documents remembered. (default: 256)
+    """
+
+    def __init__(
+        self,
+        scripts: Mapping[str, Sequence[str]] | None = None,
+        fallback: str = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+        min_confidence: float = 0.0,
+        cache_size: int = AIOPYTESSERACT_DEFAULT_CACHE_SIZE,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError(f"cache_size must be at least 1, got: {cache_size}")
+        self.scripts = dict(
+            AIOPYTESSERACT_SCRIPT_LANGUAGES if scripts is None else scripts
+        )
+        self.fallback = fallback
+        self.min_confidence = min_confidence
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, asyncio.Future[str]] = OrderedDict()
+        # installed languages per tessdata_dir
+        self._installed: dict[str | None, set[str]] = {}
+
+    async def resolve(
+        self,
+        image: bytes,
+        document: str | None = None,
+        timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+        tessdata_dir: str | None = None,
+    ) -> str:
+        """Languages to recognise `image` with, in tesseract `lang` format.
+
+        :param image: image bytes, only read on a cache miss.
+        :param document: cache key shared by the pages of a document. (default: image digest)
+        :param timeout: detection timeout. (default: 30)
+        :param tessdata_dir: location of tessdata path. (default: None)
+        """
+        key = document if document is not None else hashlib.sha256(image).hexdigest()
+        future = self._cache.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._detect(image, timeout, tessdata_dir))
+            self._cache[key] = future
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        try:
+            # shielded so one cancelled page does not fail the others.
+            return await asyncio.shield(future)
+        except BaseException:
+            if future.done() and (future.cancelled() or future.exception()):
+                self.forget(key)
+            raise
+
+    def forget(self, document: str) -> None:
+        """Drop the cached languages of `document`."""
+        self._cache.pop(document, None)
+
+    async def _detect(
+        self, image: bytes, timeout: float, tessdata_dir: str | None
+    ) -> str:
+        from aiopytesseract.commands import get_languages, image_to_osd
+
+        try:
+            osd = await image_to_osd(image, timeout=timeout, tessdata_dir=tessdata_dir)
+        except TesseractRuntimeError as exc:
+            # no osd model, or too little text to tell the script
+            logger.debug(f"Script detection failed, using {self.fallback}: {exc}")
+            return self.fallback
+        if osd.script_confidence < self.min_confidence:
+            return self.fallback
+        installed = self._installed.get(tessdata_dir)
+        if installed is None:
+            installed = set(await get_languages(tessdata_dir=tessdata_dir))
+            self._installed[tessdata_dir] = installed
+        languages = [
+            lang for lang in self.scripts.get(osd.script, ()) if lang in installed
+        ]
+        return "+".join(languages) or self.fallback
+
+
+def current_language_router() -> LanguageRouter:
+    """Router used for `lang="auto"` in the current context."""
+    global _default_router
+    router = _language_router.get()
+    if router is not None:
+        return router
+    if _default_router is None:
+        _default_router = LanguageRouter()
+    return _default_router
+
+
+@contextmanager
+def language_router(
+    router: LanguageRouter | None = None, document: str | None = None
+) -> Iterator[None]:
+    """Route `lang="auto"` inside the block through `router`.
+
+    :param router: language router. (default: the current one)
+    :param document: cache key shared by every page OCRed in the block. (default: None)
+    """
+    router_token = _language_router.set(router or current_language_router())
+    document_token = _document.set(document)
+    try:
+        yield
+    finally:
+        _document.reset(document_token)
+        _language_router.reset(router_token)
+
+
+async def resolve_language(
+    image: bytes, timeout: float, tessdata_dir: str | None = None
+) -> str:
+    return await current_language_router().resolve(
+        image, _document.get(), timeout, tessdata_dir
+    )
@@ -1,6 +1,37 @@
+from aiopytesseract.models.alto import String, TextLine
 from aiopytesseract.models.box import Box
+from aiopytesseract.models.cascade import CascadeLine, CascadeResult
 from aiopytesseract.models.data import Data
+from aiopytesseract.models.hedge import HedgeStats
+from aiopytesseract.models.image_info import ImageInfo
 from aiopytesseract.models.osd import OSD
 from aiopytesseract.models.parameter import Parameter
+from aiopytesseract.models.posting import Posting
+from aiopytesseract.models.region import Region
+from aiopytesseract.models.speculation import LanguageRun, SpeculativeResult
+from aiopytesseract.models.tier import Tier, TieredResult
+from aiopytesseract.models.usage import Accounted, Usage, UsageStats
+from aiopytesseract.models.warmup import WarmupReport
 
-__all__ = ["OSD", "Box", "Data", "Parameter"]
+__all__ = [
+    "OSD",
+    "Accounted",
+    "Box",
+    "CascadeLine",
+    "CascadeResult",
+    "Data",
+    "HedgeStats",
+    "ImageInfo",
+    "LanguageRun",
+    "Parameter",
+    "Posting",
+    "Region",
+    "SpeculativeResult",
+    "String",
+    "TextLine",
+    "Tier",
+    "TieredResult",
+    "Usage",
+    "UsageStats",
+    "WarmupReport",
+]
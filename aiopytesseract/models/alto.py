@@ -0,0 +1,27 @@
+from attrs import field, frozen
+
+
+@frozen
+class String:
+    content: str
+    hpos: int
+    vpos: int
+    width: int
+    height: int
+    wc: float
+
+    def __str__(self) -> str:
+        return self.content
+
+
+@frozen
+class TextLine:
+    id: str
+    hpos: int
+    vpos: int
+    width: int
+    height: int
+    strings: tuple[String, ...] = field(factory=tuple)
+
+    def __str__(self) -> str:
+        return " ".join(string.content for string in self.strings)
@@ -0,0 +1,64 @@
+from collections import Counter
+
+from attrs import frozen
+
+from aiopytesseract.models.data import Data
+from aiopytesseract.models.tier import Tier
+
+
+@frozen
+class CascadeLine:
+    """Words of a text line and the tier that recognised them."""
+
+    words: tuple[Data, ...]
+    tier: Tier
+
+    @property
+    def conf(self) -> float:
+        """Mean word confidence."""
+        return sum(word.conf for word in self.words) / len(self.words)
+
+    @property
+    def text(self) -> str:
+        return " ".join(word.text for word in self.words)
+
+    @property
+    def bbox(self) -> tuple[int, int, int, int]:
+        """(left, top, right, bottom) box of the words."""
+        return (
+            min(word.left for word in self.words),
+            min(word.top for word in self.words),
+            max(word.left + word.width for word in self.words),
+            max(word.top + word.height for word in self.words),
+        )
+
+    def __str__(self) -> str:
+        return self.text
+
+
+@frozen
+class CascadeResult:
+    lines: tuple[CascadeLine, ...]
+
+    @property
+    def text(self) -> str:
+        return "\n".join(line.text for line in self.lines)
+
+    @property
+    def data(self) -> list[Data]:
+        """Word rows of every line, in page coordinates."""
+        return [word for line in self.lines for word in line.words]
+
+    @property
+    def conf(self) -> float:
+        """Mean word confidence, 0 without words."""
+        words = self.data
+        return sum(word.conf for word in words) / len(words) if words else 0.0
+
+    @property
+    def tiers(self) -> Counter[str]:
+        """Number of lines produced by each tier, by tier name."""
+        return Counter(line.tier.name for line in self.lines)
+
+    def __str__(self) -> str:
+        return self.text
@@ -0,0 +1,30 @@
+from attrs import frozen
+
+
+@frozen
+class HedgeStats:
+    """Counters of a `Hedger` since its creation or last reset.
+
+    `hedged` calls started a second process, `hedge_wins` of them were won
+    by it and `denied` calls were slow enough to hedge but over budget.
+    `delay` is the current hedging delay in seconds, None until enough
+    latencies were observed.
+    """
+
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    denied: int = 0
+    delay: float | None = None
+
+    @property
+    def extra_load(self) -> float:
+        """Extra processes started, as a fraction of the calls."""
+        return self.hedged / self.calls if self.calls else 0.0
+
+    def __str__(self) -> str:
+        delay = "-" if self.delay is None else f"{self.delay:.3f}s"
+        return (
+            f"{self.calls} calls, {self.hedged} hedged ({self.extra_load:.1%} extra load), "
+            f"{self.hedge_wins} won by the hedge, {self.denied} over budget, delay {delay}"
+        )
@@ -0,0 +1,18 @@
+from attrs import frozen
+
+
+@frozen
+class ImageInfo:
+    format: str
+    width: int
+    height: int
+    bit_depth: int
+    dpi: tuple[float, float] | None = None
+
+    @property
+    def pixels(self) -> int:
+        """Pixel count, the cost estimate used for scheduling and timeouts."""
+        return self.width * self.height
+
+    def __str__(self) -> str:
+        return f"{self.format} {self.width}x{self.height}"
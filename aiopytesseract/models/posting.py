@@ -0,0 +1,26 @@
+from attrs import frozen
+
+
+@frozen
+class Posting:
+    """Occurrence of a normalized token in OCR output."""
+
+    token: str
+    page: int
+    block: int
+    par: int
+    line: int
+    word: int
+    left: int
+    top: int
+    width: int
+    height: int
+    conf: float
+
+    @property
+    def bbox(self) -> tuple[int, int, int, int]:
+        """(left, top, right, bottom) box."""
+        return self.left, self.top, self.left + self.width, self.top + self.height
+
+    def __str__(self) -> str:
+        return f"{self.token} p{self.page} {self.width}x{self.height}+{self.left}+{self.top}"
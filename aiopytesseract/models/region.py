@@ -0,0 +1,20 @@
+from attrs import field, frozen, validators
+
+
+@frozen
+class Region:
+    x: int = field(validator=validators.ge(0))
+    y: int = field(validator=validators.ge(0))
+    w: int = field(validator=validators.gt(0))
+    h: int = field(validator=validators.gt(0))
+    # 7: single text line, 8: single word
+    psm: int = 7
+    whitelist: str | None = None
+
+    @property
+    def box(self) -> tuple[int, int, int, int]:
+        """(left, upper, right, lower) crop box."""
+        return self.x, self.y, self.x + self.w, self.y + self.h
+
+    def __str__(self) -> str:
+        return f"{self.w}x{self.h}+{self.x}+{self.y}"
@@ -0,0 +1,37 @@
+from attrs import frozen
+
+from aiopytesseract.models.data import Data
+
+
+@frozen
+class LanguageRun:
+    """Outcome of one single-language run of a speculative recognition.
+
+    `status` is "done", "cancelled" (lost, stopped early) or "failed".
+    `conf` is the mean word confidence, None unless done.
+    """
+
+    lang: str
+    status: str
+    seconds: float
+    conf: float | None = None
+    words: int = 0
+
+    def __str__(self) -> str:
+        conf = "-" if self.conf is None else f"{self.conf:.1f}"
+        return f"{self.lang}: {self.status} in {self.seconds:.3f}s, conf {conf}, {self.words} words"
+
+
+@frozen
+class SpeculativeResult:
+    data: list[Data]
+    lang: str
+    runs: tuple[LanguageRun, ...]
+
+    @property
+    def conf(self) -> float:
+        """Mean word confidence of the winning run."""
+        return next(run.conf or 0.0 for run in self.runs if run.lang == self.lang)
+
+    def __str__(self) -> str:
+        return f"{self.lang} ({'; '.join(str(run) for run in self.runs)})"
@@ -0,0 +1,40 @@
+from typing import Generic, TypeVar
+
+from attrs import frozen
+
+from aiopytesseract.preprocessing import Preprocess
+
+ResultT = TypeVar("ResultT")
+
+
+@frozen
+class Tier:
+    name: str
+    tessdata_dir: str | None = None
+    dpi: int | None = None
+    oem: int | None = None
+    preprocess: Preprocess | None = None
+    psm: int | None = None
+
+    def options(self) -> dict[str, object]:
+        """Command keyword arguments this tier overrides."""
+        options: dict[str, object] = {
+            "tessdata_dir": self.tessdata_dir,
+            "dpi": self.dpi,
+            "oem": self.oem,
+            "preprocess": self.preprocess,
+            "psm": self.psm,
+        }
+        return {name: value for name, value in options.items() if value is not None}
+
+    def __str__(self) -> str:
+        return self.name
+
+
+@frozen
+class TieredResult(Generic[ResultT]):
+    result: ResultT
+    tier: Tier
+
+    def __str__(self) -> str:
+        return f"{self.result} ({self.tier})"
@@ -0,0 +1,88 @@
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+from attrs import frozen
+
+ResultT = TypeVar("ResultT")
+
+
+@frozen
+class Usage:
+    """Resources used by the tesseract processes of a call.
+
+    `user` and `system` are CPU seconds, `max_rss` the largest peak
+    resident set size of a single process in bytes and `wall` the seconds
+    from spawn to exit, summed over processes run one after the other.
+    """
+
+    user: float = 0.0
+    system: float = 0.0
+    max_rss: int = 0
+    wall: float = 0.0
+    processes: int = 0
+
+    @property
+    def cpu(self) -> float:
+        return self.user + self.system
+
+    @classmethod
+    def total(cls, usages: Iterable["Usage"]) -> "Usage":
+        total = cls()
+        for usage in usages:
+            total = cls(
+                total.user + usage.user,
+                total.system + usage.system,
+                max(total.max_rss, usage.max_rss),
+                total.wall + usage.wall,
+                total.processes + usage.processes,
+            )
+        return total
+
+    def __str__(self) -> str:
+        return (
+            f"cpu {self.cpu:.3f}s (user {self.user:.3f}s, sys {self.system:.3f}s), "
+            f"max rss {self.max_rss / 1024**2:.1f} MiB, wall {self.wall:.3f}s"
+        )
+
+
+@frozen
+class UsageStats:
+    """Usage aggregated over the calls of one (command, lang, psm, oem)."""
+
+    calls: int = 0
+    user: float = 0.0
+    system: float = 0.0
+    max_rss: int = 0
+    wall: float = 0.0
+
+    @property
+    def cpu(self) -> float:
+        return self.user + self.system
+
+    @property
+    def cpu_per_call(self) -> float:
+        return self.cpu / self.calls if self.calls else 0.0
+
+    def add(self, usage: Usage) -> "UsageStats":
+        return UsageStats(
+            self.calls + 1,
+            self.user + usage.user,
+            self.system + usage.system,
+            max(self.max_rss, usage.max_rss),
+            self.wall + usage.wall,
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"{self.calls} calls, cpu {self.cpu:.3f}s ({self.cpu_per_call:.3f}s/call), "
+            f"max rss {self.max_rss / 1024**2:.1f} MiB, wall {self.wall:.3f}s"
+        )
+
+
+@frozen
+class Accounted(Generic[ResultT]):
+    result: ResultT
+    usage: Usage
+
+    def __str__(self) -> str:
+        return f"{self.result} ({self.usage})"
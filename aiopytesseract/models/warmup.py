@@ -0,0 +1,19 @@
+from attrs import frozen
+
+
+@frozen
+class WarmupReport:
+    tessdata_dir: str
+    staging_dir: str
+    languages: tuple[str, ...]
+    size: int
+    linked: int
+    copied: int
+    reused: int
+    seconds: float
+
+    def __str__(self) -> str:
+        return (
+            f"{'+'.join(self.languages)} staged in {self.staging_dir} "
+            f"({self.size} bytes, {self.seconds:.3f}s)"
+        )
@@ -0,0 +1,146 @@
+"""Parsers of tesseract output, run off the event loop for large outputs.
+
+The parsers are pure module level functions of `(data, encoding)`, so
+they can run inline, in a thread or in a process pool alike.
+"""
+
+import asyncio
+import re
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TypeVar
+
+from attrs import field, frozen, validators
+
+from aiopytesseract.constants import AIOPYTESSERACT_DEFAULT_PARSE_THRESHOLD
+from aiopytesseract.models import OSD, Box, Data, Parameter
+
+ResultT = TypeVar("ResultT")
+
+
+@frozen
+class ParsePolicy:
+    """Where tesseract output is parsed.
+
+    Outputs smaller than `threshold` bytes are parsed inline, since
+    handing them to an executor costs more than parsing them. Larger ones,
+    e.g. the TSV or hOCR of a dense page, are parsed in `executor`. Threads
+    still share the GIL, but the loop gets to run every switch interval
+    (5ms by default) instead of waiting for the whole parse; a
+    `ProcessPoolExecutor` takes the parsing off the loop's process.
+
+    :param threshold: output size in bytes from which parsing is offloaded. (default: 65536)
+    :param executor: executor used to parse large outputs. (default: event loop default)
+    """
+
+    threshold: int = field(
+        default=AIOPYTESSERACT_DEFAULT_PARSE_THRESHOLD, validator=validators.ge(0)
+    )
+    executor: Executor | None = field(default=None, eq=False)
+
+
+_DEFAULT_PARSE_POLICY = ParsePolicy()
+_parse_policy: ContextVar[ParsePolicy | None] = ContextVar(
+    "aiopytesseract_parse_policy", default=None
+)
+
+
+def current_parse_policy() -> ParsePolicy:
+    """Parse policy of the current context."""
+    return _parse_policy.get() or _DEFAULT_PARSE_POLICY
+
+
+@contextmanager
+def parse_policy(policy: ParsePolicy) -> Iterator[None]:
+    """Parse the output of every command run inside the block with `policy`.
+
+    Tasks created inside the block keep the policy after it exits.
+
+    :param policy: parse policy, `ParsePolicy(threshold=0)` offloads every output.
+    """
+    token = _parse_policy.set(policy)
+    try:
+        yield
+    finally:
+        _parse_policy.reset(token)
+
+
+async def parse(
+    parser: Callable[[bytes, str], ResultT], data: bytes, encoding: str
+) -> ResultT:
+    """Run `parser(data, encoding)`, in the policy executor for large outputs.
+
+    :param parser: module level parser, e.g. `parse_data`.
+    :param data: tesseract output.
+    :param encoding: decode bytes to string.
+    """
+    policy = current_parse_policy()
+    if len(data) < policy.threshold:
+        return parser(data, encoding)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(policy.executor, parser, data, encoding)
+
+
+def decode(data: bytes, encoding: str) -> str:
+    return data.decode(encoding)
+
+
+def parse_boxes(data: bytes, encoding: str) -> list[Box]:
+    # cattrs is imported on first use, it dominates the package import time.
+    import cattr
+
+    lines = data.decode(encoding).split("\n")
+    return [
+        cattr.structure_attrs_fromtuple(tuple(line.split()), Box)
+        for line in lines[: len(lines) - 1]
+    ]
+
+
+def parse_data(data: bytes, encoding: str) -> list[Data]:
+    import cattr
+
+    lines = data.decode(encoding).split("\n")
+    return [
+        cattr.structure_attrs_fromtuple(line.split(), Data)  # type: ignore
+        for line in lines[1 : len(lines) - 1]
+    ]
+
+
+def parse_osd(data: bytes, encoding: str) -> OSD:
+    import cattr
+
+    return cattr.structure_attrs_fromtuple(
+        re.findall(  # type: ignore
+            r"\w+\s?:\s*(\d+.?\d*|\w+)",
+            data.decode(encoding),
+        ),
+        OSD,
+    )
+
+
+def parse_parameters(data: bytes, encoding: str) -> list[Parameter]:
+    import cattr
+
+    params = []
+    # [1:] - skip first line with text: "Tesseract parameters:\n"
+    for line in data.decode(encoding).split("\n")[1:]:
+        param = re.search(r"(\w+)\s+(-?\d+.?\d*)\s+(.*)[^\n]$", line)
+        if param:
+            params.append(
+                cattr.structure_attrs_fromtuple(
+                    (param.group(1), param.group(3), param.group(2)),
+                    Parameter,
+                )
+            )
+        else:
+            param = re.search(r"(\w+)\s+(.*)[^\n]$", line)
+            if param:
+                params.append(
+                    cattr.structure_attrs_fromtuple(
+                        (param.group(1), param.group(2)),
+                        Parameter,
+                    )
+                )
+    return sorted(params, key=lambda p: p.name)
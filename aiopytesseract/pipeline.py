@@ -0,0 +1,130 @@
+import asyncio
+import os
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
+from typing import TypeVar, cast, overload
+
+from aiopytesseract.commands import image_to_string
+from aiopytesseract.resources import pool_context
+
+ImageT = TypeVar("ImageT")
+ResultT = TypeVar("ResultT")
+
+_EXHAUSTED = object()
+
+
+async def _next(iterator: AsyncIterator[ImageT]) -> ImageT | object:
+    try:
+        return await anext(iterator)
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+def _outcome(future: "asyncio.Future[ResultT]") -> ResultT | Exception:
+    exc = future.exception()
+    if exc is None:
+        return future.result()
+    if not isinstance(exc, Exception):
+        raise exc
+    return exc
+
+
+@overload
+def ocr_stream(
+    source: AsyncIterable[str | bytes],
+    concurrency: int | None = None,
+    ordered: bool = True,
+) -> AsyncGenerator[tuple[int, str | Exception], None]: ...
+
+
+@overload
+def ocr_stream(
+    source: AsyncIterable[ImageT],
+    concurrency: int | None = None,
+    ordered: bool = True,
+    *,
+    func: Callable[[ImageT], Awaitable[ResultT]],
+) -> AsyncGenerator[tuple[int, ResultT | Exception], None]: ...
+
+
+async def ocr_stream(
+    source: AsyncIterable[ImageT],
+    concurrency: int | None = None,
+    ordered: bool = True,
+    *,
+    func: Callable[[ImageT], Awaitable[ResultT]] = image_to_string,  # type: ignore
+) -> AsyncGenerator[tuple[int, ResultT | Exception], None]:
+    """Run OCR over an async stream of images with bounded concurrency.
+
+    Yields `(index, result)` tuples, where `index` is the position of the
+    image in `source` and `result` is either the OCR output or the exception
+    raised for that image. At most `concurrency` images are pulled from
+    `source` and not yet yielded at any time, so a slow consumer slows the
+    producer down instead of buffering images in memory.
+
+    Use `functools.partial` to pass OCR options or another command,
+    e.g. `func=partial(aiopytesseract.image_to_data, lang="por")`.
+
+    :param source: async iterable of images. (valid values: str, bytes)
+    :param concurrency: maximum images in flight. (default: number of CPUs)
+    :param ordered: yield in source order, otherwise in completion order. (default: True)
+    :param func: coroutine function applied to each image. (default: image_to_string)
+
+    Unless a `resource_policy` is active, tesseract processes run under
+    `ResourcePolicy.for_pool(concurrency)`.
+    """
+    limit = concurrency or os.cpu_count() or 1
+    if limit < 1:
+        raise ValueError(f"concurrency must be at least 1, got: {limit}")
+    iterator = aiter(source)
+    context = pool_context(limit)
+    in_flight: deque[tuple[int, asyncio.Future[ResultT]]] = deque()
+    fetch: asyncio.Task[ImageT | object] | None = None
+    index = 0
+    exhausted = False
+    try:
+        while True:
+            if fetch is None and not exhausted and len(in_flight) < limit:
+                fetch = asyncio.create_task(_next(iterator))
+            waiters: set[asyncio.Future[ResultT] | asyncio.Future[ImageT | object]]
+            waiters = {future for _, future in in_flight}
+            if fetch is not None:
+                waiters.add(fetch)
+            if not waiters:
+                return
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            if fetch is not None and fetch.done():
+                image = fetch.result()
+                fetch = None
+                if image is _EXHAUSTED:
+                    exhausted = True
+                else:
+                    future: asyncio.Future[ResultT] = context.run(
+                        asyncio.ensure_future, func(cast(ImageT, image))
+                    )
+                    in_flight.append((index, future))
+                    index += 1
+            if ordered:
+                while in_flight and in_flight[0][1].done():
+                    position, future = in_flight.popleft()
+                    result = _outcome(future)
+                    yield position, result
+            else:
+                for item in [item for item in in_flight if item[1].done()]:
+                    in_flight.remove(item)
+                    result = _outcome(item[1])
+                    yield item[0], result
+    finally:
+        pending: list[asyncio.Future[ResultT] | asyncio.Future[ImageT | object]]
+        pending = [future for _, future in in_flight]
+        if fetch is not None:
+            pending.append(fetch)
+        for waiter in pending:
+            waiter.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,115 @@
+import asyncio
+import io
+from concurrent.futures import Executor
+
+from attrs import field, frozen, validators
+
+from aiopytesseract.constants import AIOPYTESSERACT_DEFAULT_DPI
+
+PREPROCESS_OUTPUT_FORMATS: dict[str, str] = {"pnm": "PPM", "tiff": "TIFF"}
+_MIN_EMBEDDED_DPI = 100
+
+
+@frozen
+class Preprocess:
+    """Image preprocessing applied before the image is piped to tesseract.
+
+    Tesseract binarizes and rescales every input internally, so doing the
+    same work up front shrinks what goes through stdin and what tesseract
+    has to decode. Requires Pillow (`pip install aiopytesseract[pillow]`).
+
+    :param grayscale: convert to 8-bit grayscale. (default: True)
+    :param threshold: binarize with this 0-255 threshold. (default: None)
+    :param target_dpi: downscale images above this resolution. (default: 300)
+    :param crop_borders: crop uniform borders around the content. (default: False)
+    :param output_format: `pnm` or uncompressed `tiff`. (default: pnm)
+    :param executor: executor used to run the stage. (default: event loop default)
+    """
+
+    grayscale: bool = True
+    threshold: int | None = field(
+        default=None,
+        validator=validators.optional(
+            validators.and_(validators.ge(0), validators.le(255))
+        ),
+    )
+    target_dpi: int | None = AIOPYTESSERACT_DEFAULT_DPI
+    crop_borders: bool = False
+    output_format: str = field(
+        default="pnm", validator=validators.in_(PREPROCESS_OUTPUT_FORMATS)
+    )
+    executor: Executor | None = field(default=None, eq=False)
+
+    async def apply(self, image: bytes, dpi: int) -> tuple[bytes, int]:
+        """Return the preprocessed image and the DPI to pass to tesseract.
+
+        :param image: encoded image.
+        :param dpi: image resolution used when the image has no embedded DPI.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            preprocess_image,
+            image,
+            dpi,
+            self.grayscale,
+            self.threshold,
+            self.target_dpi,
+            self.crop_borders,
+            self.output_format,
+        )
+
+
+def preprocess_image(
+    image: bytes,
+    dpi: int,
+    grayscale: bool = True,
+    threshold: int | None = None,
+    target_dpi: int | None = AIOPYTESSERACT_DEFAULT_DPI,
+    crop_borders: bool = False,
+    output_format: str = "pnm",
+) -> tuple[bytes, int]:
+    """Blocking implementation of `Preprocess.apply`, safe for process pools."""
+    try:
+        from PIL import Image, ImageChops, ImageOps
+    except ImportError:
+        raise ImportError(
+            "image preprocessing requires Pillow: pip install aiopytesseract[pillow]"
+        ) from None
+
+    with Image.open(io.BytesIO(image)) as source:
+        # 72/96 DPI are screen defaults written by most encoders, not a scan
+        # resolution, so only trust higher embedded values.
+        embedded_dpi = source.info.get("dpi")
+        if embedded_dpi and embedded_dpi[0] >= _MIN_EMBEDDED_DPI:
+            dpi = round(embedded_dpi[0])
+        img = ImageOps.exif_transpose(source)
+        if img.mode not in ("1", "L", "RGB"):
+            img = img.convert("RGB")
+
+        if grayscale or threshold is not None:
+            img = img.convert("L")
+
+        if crop_borders:
+            # anything differing from the top-left pixel counts as content
+            background = Image.new(img.mode, img.size, img.getpixel((0, 0)))
+            bbox = ImageChops.difference(img, background).getbbox()
+            if bbox:
+                img = img.crop(bbox)
+
+        if target_dpi and dpi > target_dpi:
+            scale = target_dpi / dpi
+            size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            img = img.resize(size, Image.Resampling.LANCZOS)
+            dpi = target_dpi
+
+        if threshold is not None:
+            img = img.point(lambda value: 255 if value > threshold else 0, mode="1")
+
+        output = io.BytesIO()
+        img.save(
+            output,
+            format=PREPROCESS_OUTPUT_FORMATS[output_format],
+            dpi=(dpi, dpi),
+        )
+    return output.getvalue(), dpi
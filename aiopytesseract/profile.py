@@ -0,0 +1,188 @@
+import hashlib
+import inspect
+import weakref
+from collections.abc import Iterable, Mapping
+from contextlib import suppress
+from functools import lru_cache
+
+from attrs import Attribute, field, frozen
+
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_AUTO_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_DPI,
+    AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_OEM,
+    AIOPYTESSERACT_DEFAULT_PSM,
+    OCR_ENGINE_MODES,
+    PAGE_SEGMENTATION_MODES,
+    TESSERACT_LANGUAGES,
+)
+from aiopytesseract.exceptions import (
+    LanguageInvalidException,
+    OEMInvalidException,
+    PSMInvalidException,
+)
+from aiopytesseract.tessdata import staged_tessdata_dir
+from aiopytesseract.wordlists import WordList, acquire, release, wordlist_content
+
+
+def _psm_is_valid(instance: object, attribute: "Attribute[int]", psm: int) -> None:
+    if psm not in PAGE_SEGMENTATION_MODES:
+        raise PSMInvalidException(psm)
+
+
+def _oem_is_valid(instance: object, attribute: "Attribute[int]", oem: int) -> None:
+    if oem not in OCR_ENGINE_MODES:
+        raise OEMInvalidException(oem)
+
+
+def _language_is_valid(
+    instance: object, attribute: "Attribute[str]", language: str
+) -> None:
+    if language == AIOPYTESSERACT_AUTO_LANGUAGE:
+        return
+    for lang in language.split("+"):
+        if lang not in TESSERACT_LANGUAGES:
+            raise LanguageInvalidException(
+                f"'{lang}' language is not among the supported by Tesseract."
+            )
+
+
+def _freeze_config(
+    config: Iterable[tuple[str, str]] | None,
+) -> tuple[tuple[str, str], ...]:
+    return () if config is None else tuple((name, value) for name, value in config)
+
+
+def _freeze_wordlist(wordlist: WordList | None) -> str | bytes | None:
+    if wordlist is None or isinstance(wordlist, str):
+        return wordlist
+    return wordlist_content(wordlist)
+
+
+@frozen
+class OCRProfile:
+    """Tesseract options validated and turned into arguments once.
+
+    Commands called with `profile=` skip per-call option validation and
+    argument building, and `key` gives batching and caching layers a
+    stable identity for the options. Profiles are immutable and hashable;
+    derive variants with `attrs.evolve`.
+
+    :param dpi: image dots per inch (DPI). (default: 300)
+    :param lang: tesseract language. (default: eng, format: eng, eng+por, eng+por+fra, auto)
+    :param psm: page segmentation modes. (default: 3)
+    :param oem: ocr engine modes. (default: 3)
+    :param user_words: location of user words file, or the words as bytes or an iterable of str. (default: None)
+    :param user_patterns: location of user patterns file, or the patterns as bytes or an iterable of str. (default: None)
+    :param tessdata_dir: location of tessdata path. (default: None)
+    :param config: set value for config variables. (default: None)
+    """
+
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI
+    lang: str = field(
+        default=AIOPYTESSERACT_DEFAULT_LANGUAGE, validator=_language_is_valid
+    )
+    psm: int = field(default=AIOPYTESSERACT_DEFAULT_PSM, validator=_psm_is_valid)
+    oem: int = field(default=AIOPYTESSERACT_DEFAULT_OEM, validator=_oem_is_valid)
+    # in-memory lists are kept as file content, materialized while the
+    # profile is alive
+    user_words: str | bytes | None = field(default=None, converter=_freeze_wordlist)
+    user_patterns: str | bytes | None = field(default=None, converter=_freeze_wordlist)
+    tessdata_dir: str | None = None
+    config: tuple[tuple[str, str], ...] = field(default=None, converter=_freeze_config)
+    # arguments after the input and output base, and before the config files
+    argv: tuple[str, ...] = field(init=False, eq=False, repr=False)
+    # arguments before the input
+    prefix: tuple[str, ...] = field(init=False, eq=False, repr=False)
+    key: str = field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        argv = ["--dpi", f"{self.dpi}", "--psm", f"{self.psm}", "--oem", f"{self.oem}"]
+        if self.lang != AIOPYTESSERACT_AUTO_LANGUAGE:
+            argv += ["-l", self.lang]
+        for option, value in self.config:
+            argv += ["-c", f"{option}={value}"]
+        prefix = []
+        digest = hashlib.sha256()
+        for option, wordlist in (
+            ("--user-words", self.user_words),
+            ("--user-patterns", self.user_patterns),
+        ):
+            if not wordlist:
+                continue
+            digest.update(option.encode())
+            if isinstance(wordlist, bytes):
+                path = acquire(wordlist)
+                weakref.finalize(self, release, path)
+                # the content, not its per-process path, identifies the list
+                digest.update(wordlist)
+            else:
+                path = wordlist
+                digest.update(path.encode())
+            digest.update(b"\0")
+            prefix += [option, path]
+        for arg in (self.tessdata_dir or "", self.lang, *argv):
+            digest.update(arg.encode())
+            digest.update(b"\0")
+        object.__setattr__(self, "argv", tuple(argv))
+        object.__setattr__(self, "prefix", tuple(prefix))
+        object.__setattr__(self, "key", digest.hexdigest())
+
+    def cmd_args(
+        self, output_extension: str, output: str = "stdout", source: str = "stdin"
+    ) -> list[str]:
+        """Tesseract arguments reading the image from stdin.
+
+        :param output_extension: output config files, e.g. `txt` or `hocr txt`.
+        :param output: output base name. (default: stdout)
+        :param source: input, an image path or a list file of images. (default: stdin)
+        """
+        if self.lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+            raise ValueError("resolve lang='auto' before building arguments")
+        tessdata_dir = staged_tessdata_dir(self.tessdata_dir, self.lang, self.psm)
+        return [
+            *(("--tessdata-dir", tessdata_dir) if tessdata_dir else ()),
+            *self.prefix,
+            source,
+            output,
+            *self.argv,
+            *reversed(output_extension.split()),
+        ]
+
+
+def call_options(
+    func: object,
+    image: object,
+    args: tuple[object, ...],
+    kwargs: Mapping[str, object],
+) -> tuple[str, int, int]:
+    """`(lang, psm, oem)` of the call `func(image, *args, **kwargs)`.
+
+    Taken from a `profile` keyword when given, else from the arguments
+    bound to the signature of `func`, positional ones included.
+    """
+    profile = kwargs.get("profile")
+    if isinstance(profile, OCRProfile):
+        return profile.lang, profile.psm, profile.oem
+    options = dict(kwargs)
+    signature = _signature(func)
+    with suppress(TypeError):
+        if signature is not None:
+            bound = signature.bind_partial(image, *args, **kwargs)
+            bound.apply_defaults()
+            options.update(bound.arguments)
+    lang = options.get("lang") or AIOPYTESSERACT_DEFAULT_LANGUAGE
+    psm = options.get("psm", AIOPYTESSERACT_DEFAULT_PSM)
+    oem = options.get("oem", AIOPYTESSERACT_DEFAULT_OEM)
+    return str(lang), int(psm), int(oem)  # type: ignore[call-overload]
+
+
+@lru_cache(maxsize=64)
+def _signature(func: object) -> inspect.Signature | None:
+    if not callable(func):
+        return None
+    try:
+        return inspect.signature(func)
+    except (TypeError, ValueError):
+        return None
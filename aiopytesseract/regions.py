@@ -0,0 +1,42 @@
+"""Blocking crop stage of `image_to_regions`, requires Pillow."""
+
+import io
+from collections.abc import Sequence
+from pathlib import Path
+
+from aiopytesseract.models import Region
+
+
+def write_crops(image: bytes, regions: Sequence[Region], directory: str) -> list[str]:
+    """Save each region of `image` to `directory`, returning the file paths.
+
+    Crops are written as uncompressed PNM, the cheapest format for
+    tesseract to decode. Regions are clipped to the image bounds.
+
+    :param image: encoded image.
+    :param regions: regions to crop.
+    :param directory: existing output directory.
+    """
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        raise ImportError(
+            "region OCR requires Pillow: pip install aiopytesseract[pillow]"
+        ) from None
+
+    paths = []
+    with Image.open(io.BytesIO(image)) as source:
+        img = ImageOps.exif_transpose(source)
+        if img.mode not in ("1", "L", "RGB"):
+            img = img.convert("RGB")
+        for index, region in enumerate(regions):
+            left, upper, right, lower = region.box
+            box = (left, upper, min(right, img.width), min(lower, img.height))
+            if box[0] >= box[2] or box[1] >= box[3]:
+                raise ValueError(
+                    f"region {region} is outside the {img.width}x{img.height} image"
+                )
+            path = Path(directory) / f"region-{index}.pnm"
+            img.crop(box).save(path, format="PPM")
+            paths.append(str(path))
+    return paths
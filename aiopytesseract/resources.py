@@ -0,0 +1,184 @@
+import asyncio
+import os
+import sys
+from asyncio.subprocess import Process
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+
+from attrs import field, frozen, validators
+
+_resource_policy: ContextVar["ResourcePolicy | None"] = ContextVar(
+    "aiopytesseract_resource_policy", default=None
+)
+
+
+def _freeze_cpu_sets(cpu_sets: Iterable[Iterable[int]]) -> tuple[frozenset[int], ...]:
+    return tuple(frozenset(cpus) for cpus in cpu_sets)
+
+
+@frozen
+class ResourcePolicy:
+    """Resource limits applied to every tesseract process spawned under it.
+
+    Tesseract's LSTM engine starts one OpenMP thread per core, so N
+    concurrent processes oversubscribe the host N times over. Limiting
+    threads keeps concurrent workers from competing for the same cores;
+    pinning each process to its own CPU set goes further.
+
+    Affinity (Linux), niceness and the memory cap (Linux) are set in the
+    child before it execs tesseract, so they cover its start-up and every
+    thread. That needs fork + exec instead of `posix_spawn`, and Python
+    documents `preexec_fn` as unsafe in a process running other threads;
+    a policy that only limits threads keeps the fast spawn path.
+
+    :param omp_thread_limit: `OMP_THREAD_LIMIT` of each process, at most the size of its CPU set. (default: None)
+    :param cpu_sets: CPU sets handed out to processes, least used first. (default: ())
+    :param nice: niceness increment of each process. (default: 0)
+    :param memory_limit: `RLIMIT_AS` of each process, in bytes. (default: None)
+    """
+
+    omp_thread_limit: int | None = field(
+        default=None, validator=validators.optional(validators.ge(1))
+    )
+    cpu_sets: tuple[frozenset[int], ...] = field(default=(), converter=_freeze_cpu_sets)
+    nice: int = field(default=0, validator=validators.ge(0))
+    memory_limit: int | None = field(
+        default=None, validator=validators.optional(validators.ge(1))
+    )
+    _in_use: list[int] = field(init=False, eq=False, repr=False)
+    _watchers: set["asyncio.Task[int]"] = field(
+        factory=set, init=False, eq=False, repr=False
+    )
+
+    def __attrs_post_init__(self) -> None:
+        object.__setattr__(self, "_in_use", [0] * len(self.cpu_sets))
+
+    @classmethod
+    def for_pool(
+        cls, concurrency: int | None = None, pin_cpus: bool = False
+    ) -> "ResourcePolicy":
+        """Share the available CPUs evenly between `concurrency` processes.
+
+        Each process gets an even share of the CPUs as its OpenMP thread
+        limit. With `pin_cpus` every process is also pinned to its own CPU
+        set, which is set in the child before exec: tesseract is then
+        spawned with fork + exec, and the calling process should not run
+        other threads (see `preexec`).
+
+        :param concurrency: processes running at once. (default: number of CPUs)
+        :param pin_cpus: pin each process to its own CPU set (Linux). (default: False)
+        """
+        cpus = sorted(_available_cpus())
+        workers = max(1, min(concurrency or len(cpus), len(cpus)))
+        # the first `extra` sets get one CPU more, so no CPU is left out
+        per_worker, extra = divmod(len(cpus), workers)
+        omp_thread_limit = per_worker + bool(extra)
+        if not pin_cpus:
+            return cls(omp_thread_limit=omp_thread_limit)
+        cpu_sets = []
+        start = 0
+        for index in range(workers):
+            end = start + per_worker + (index < extra)
+            cpu_sets.append(frozenset(cpus[start:end]))
+            start = end
+        return cls(omp_thread_limit=omp_thread_limit, cpu_sets=tuple(cpu_sets))
+
+    def reserve(self) -> int | None:
+        """Pick the least used CPU set for the next process, None without CPU sets."""
+        if not self.cpu_sets or sys.platform != "linux":
+            return None
+        index = min(range(len(self.cpu_sets)), key=self._in_use.__getitem__)
+        self._in_use[index] += 1
+        return index
+
+    def release(self, cpu_set: int | None) -> None:
+        """Return a CPU set taken with `reserve`."""
+        if cpu_set is not None:
+            self._in_use[cpu_set] -= 1
+
+    def environment(self, cpu_set: int | None = None) -> dict[str, str]:
+        """Environment variables set on spawned processes.
+
+        :param cpu_set: CPU set of the process, from `reserve`. (default: None)
+        """
+        if self.omp_thread_limit is None:
+            return {}
+        limit = self.omp_thread_limit
+        if cpu_set is not None:
+            limit = min(limit, len(self.cpu_sets[cpu_set]))
+        return {"OMP_THREAD_LIMIT": str(limit)}
+
+    def preexec(self, cpu_set: int | None = None) -> Callable[[], None] | None:
+        """Child setup applying affinity, niceness and the memory cap before exec.
+
+        None when there is nothing to apply, so `posix_spawn` can be used.
+
+        :param cpu_set: CPU set of the process, from `reserve`. (default: None)
+        """
+        cpus = None if cpu_set is None else self.cpu_sets[cpu_set]
+        nice = self.nice if sys.platform != "win32" else 0
+        memory_limit = self.memory_limit if sys.platform == "linux" else None
+        if cpus is None and not nice and memory_limit is None:
+            return None
+        if memory_limit is not None:
+            import resource
+
+        def setup() -> None:
+            # runs in the forked child, single threaded until exec
+            if cpus is not None:
+                os.sched_setaffinity(0, cpus)
+            if nice:
+                os.nice(nice)
+            if memory_limit is not None:
+                resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+        return setup
+
+    def watch(self, proc: Process, cpu_set: int | None) -> None:
+        """Release `cpu_set` once `proc` exits."""
+        if cpu_set is None:
+            return
+        watcher = asyncio.ensure_future(proc.wait())
+        self._watchers.add(watcher)
+
+        def release(task: "asyncio.Task[int]") -> None:
+            self.release(cpu_set)
+            self._watchers.discard(task)
+
+        watcher.add_done_callback(release)
+
+
+def _available_cpus() -> set[int]:
+    cpus = set(range(os.cpu_count() or 1))
+    if sys.platform == "linux":
+        cpus = os.sched_getaffinity(0)
+    return cpus
+
+
+def current_resource_policy() -> ResourcePolicy | None:
+    """Policy applied to processes spawned from the current context."""
+    return _resource_policy.get()
+
+
+@contextmanager
+def resource_policy(policy: ResourcePolicy | None) -> Iterator[None]:
+    """Apply `policy` to every tesseract process spawned inside the block.
+
+    Tasks created inside the block keep the policy after it exits.
+
+    :param policy: resource policy, `ResourcePolicy()` applies no limits.
+    """
+    token = _resource_policy.set(policy)
+    try:
+        yield
+    finally:
+        _resource_policy.reset(token)
+
+
+def pool_context(concurrency: int) -> Context:
+    """Copy of the current context, with a pool policy unless one is set."""
+    context = copy_context()
+    if current_resource_policy() is None:
+        context.run(_resource_policy.set, ResourcePolicy.for_pool(concurrency))
+    return context
@@ -0,0 +1,190 @@
+import asyncio
+import heapq
+import itertools
+import os
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Concatenate, ParamSpec, TypeVar
+
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_DEFAULT_PIXELS_PER_SECOND,
+    AIOPYTESSERACT_MAX_TIMEOUT,
+    AIOPYTESSERACT_MIN_TIMEOUT,
+)
+from aiopytesseract.profile import call_options
+from aiopytesseract.resources import ResourcePolicy, resource_policy
+from aiopytesseract.validators import file_exists, image_is_valid
+
+P = ParamSpec("P")
+ResultT = TypeVar("ResultT")
+ModelKey = tuple[str, int, int]
+
+
+class ThroughputModel:
+    """Online estimate of tesseract throughput, in pixels per second.
+
+    One exponentially weighted moving average is kept per `(lang, psm, oem)`,
+    since language models and segmentation modes differ a lot in speed.
+
+    :param prior: throughput assumed until a key has been measured. (default: 500000)
+    :param alpha: weight of each new observation. (default: 0.2)
+    :param overhead: fixed per-process cost in seconds, model load included. (default: 0.25)
+    :param safety_factor: timeout multiplier over the estimate. (default: 4)
+    :param min_timeout: lower bound of derived timeouts. (default: 5)
+    :param max_timeout: upper bound of derived timeouts. (default: 600)
+    """
+
+    def __init__(
+        self,
+        prior: float = AIOPYTESSERACT_DEFAULT_PIXELS_PER_SECOND,
+        alpha: float = 0.2,
+        overhead: float = 0.25,
+        safety_factor: float = 4,
+        min_timeout: float = AIOPYTESSERACT_MIN_TIMEOUT,
+        max_timeout: float = AIOPYTESSERACT_MAX_TIMEOUT,
+    ) -> None:
+        if prior <= 0:
+            raise ValueError(f"prior must be positive, got: {prior}")
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in the range (0-1], got: {alpha}")
+        self.prior = prior
+        self.alpha = alpha
+        self.overhead = overhead
+        self.safety_factor = safety_factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._rates: dict[ModelKey, float] = {}
+
+    def throughput(self, key: ModelKey) -> float:
+        return self._rates.get(key, self.prior)
+
+    def observe(self, key: ModelKey, pixels: int, seconds: float) -> None:
+        """Record a successful run of `pixels` that took `seconds`."""
+        # floor the compute time so sub-overhead runs can't explode the rate
+        rate = pixels / max(seconds - self.overhead, 0.01)
+        current = self._rates.get(key)
+        self._rates[key] = (
+            rate if current is None else self.alpha * rate + (1 - self.alpha) * current
+        )
+
+    def estimate(self, key: ModelKey, pixels: int) -> float:
+        """Expected run time in seconds."""
+        return self.overhead + pixels / self.throughput(key)
+
+    def timeout_for(self, key: ModelKey, pixels: int) -> float:
+        """Timeout in seconds for an image of `pixels`."""
+        timeout = self.estimate(key, pixels) * self.safety_factor
+        return min(max(timeout, self.min_timeout), self.max_timeout)
+
+
+class Scheduler:
+    """Run OCR commands with cost-aware timeouts and bounded concurrency.
+
+    Each image is sniffed up front (see `aiopytesseract.image_header`), its
+    run time estimated by a `ThroughputModel` and, unless given, the command
+    timeout derived from that estimate. When `shortest_first` is set, queued
+    jobs start by estimated cost instead of arrival; every second spent
+    waiting lowers a job's cost by `aging` seconds, so large documents
+    still start once they have waited as long as they are expected to run.
+
+    :param concurrency: maximum commands running at once. (default: number of CPUs)
+    :param model: shared throughput model. (default: new ThroughputModel)
+    :param shortest_first: start the cheapest queued job first. (default: True)
+    :param aging: seconds of estimated cost forgiven per second waited. (default: 1)
+    :param policy: resource policy of spawned processes. (default: ResourcePolicy.for_pool)
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        model: ThroughputModel | None = None,
+        shortest_first: bool = True,
+        aging: float = 1,
+        policy: ResourcePolicy | None = None,
+    ) -> None:
+        self.concurrency = concurrency or os.cpu_count() or 1
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got: {self.concurrency}")
+        self.model = model or ThroughputModel()
+        self.shortest_first = shortest_first
+        self.aging = aging
+        self.policy = policy or ResourcePolicy.for_pool(self.concurrency)
+        self._running = 0
+        self._queue: list[tuple[float, int, asyncio.Future[None]]] = []
+        # waiters in the heap that were neither handed a slot nor cancelled
+        self._queued = 0
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    async def run(
+        self,
+        func: Callable[Concatenate[bytes, P], Awaitable[ResultT]],
+        image: str | bytes,
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> ResultT:
+        """Schedule `func(image, *args, **kwargs)`.
+
+        The `lang`, `psm` and `oem` arguments, or those of a `profile`,
+        select the throughput model, and a derived `timeout` keyword is
+        added unless given. File paths are read here so the image is only
+        validated once.
+
+        :param func: OCR command, e.g. `aiopytesseract.image_to_string`.
+        :param image: image input to tesseract. (valid values: str, bytes)
+        """
+        if isinstance(image, str):
+            await file_exists(image)
+            image = Path(image).read_bytes()
+        info = await image_is_valid(image)
+        key = call_options(func, image, args, kwargs)
+        kwargs.setdefault("timeout", self.model.timeout_for(key, info.pixels))
+        await self._acquire(self.model.estimate(key, info.pixels))
+        loop = asyncio.get_running_loop()
+        try:
+            started = loop.time()
+            with resource_policy(self.policy):
+                result = await func(image, *args, **kwargs)
+            self.model.observe(key, info.pixels, loop.time() - started)
+            return result
+        finally:
+            self._release()
+
+    async def _acquire(self, cost: float) -> None:
+        if self._running < self.concurrency and not self.queued:
+            self._running += 1
+            return
+        loop = asyncio.get_running_loop()
+        # cost - aging * waited orders the same as cost + aging * arrival,
+        # which does not change over time and can live in a heap.
+        priority = cost + self.aging * loop.time() if self.shortest_first else 0.0
+        waiter: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._sequence), waiter))
+        self._queued += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over right before the cancellation
+                self._release()
+            else:
+                # left in the heap, skipped by _release
+                self._queued -= 1
+            raise
+
+    def _release(self) -> None:
+        while self._queue:
+            *_, waiter = heapq.heappop(self._queue)
+            if not waiter.done():
+                waiter.set_result(None)
+                self._queued -= 1
+                return
+        self._running -= 1
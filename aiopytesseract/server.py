@@ -0,0 +1,789 @@
+"""Local OCR server shared by many processes: `python -m aiopytesseract.server`.
+
+Every app process that OCRs on its own spawns tesseract under its own
+concurrency limit, so N workers on one host oversubscribe the CPUs N
+times over and OCR the same image once per worker. The server owns the
+only worker pool on the host instead: one queue, one concurrency cap, one
+resource policy and one result cache shared by every `OCRClient`.
+
+The protocol is plain HTTP/1.1 with keep-alive over a Unix socket or a
+localhost TCP port, so it can also be poked with `curl --unix-socket`:
+
+    POST /<command>?lang=eng&psm=6&config=tessedit_char_whitelist=0123456789
+    body: image bytes
+
+    GET /languages | /tesseract_version | /stats
+
+Clients may only set the config variables of `config_variables`, and
+path options (`tessdata_dir`, `user_words`, `user_patterns`) only inside
+the server's `path_roots`, so they cannot make tesseract read or write
+arbitrary files. The Unix socket is created with `socket_mode` (0o600).
+"""
+
+import argparse
+import asyncio
+import contextlib
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+import tempfile
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Concatenate, ParamSpec, cast
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import aiofiles
+import aiofiles.tempfile
+import attrs
+import cattr
+
+from aiopytesseract._logger import logger
+from aiopytesseract.commands import (
+    confidence,
+    deskew,
+    get_languages,
+    get_tesseract_version,
+    image_to_alto,
+    image_to_boxes,
+    image_to_data,
+    image_to_hocr,
+    image_to_osd,
+    image_to_pdf,
+    image_to_string,
+)
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_AUTO_LANGUAGE,
+    AIOPYTESSERACT_DEFAULT_CACHE_BYTES,
+    AIOPYTESSERACT_DEFAULT_CACHE_SIZE,
+    AIOPYTESSERACT_DEFAULT_SERVER_PORT,
+    AIOPYTESSERACT_KEEP_ALIVE_TIMEOUT,
+    AIOPYTESSERACT_MAX_CACHED_PAYLOAD,
+    AIOPYTESSERACT_MAX_REQUEST_SIZE,
+    AIOPYTESSERACT_SERVER_CONFIG_VARIABLES,
+    TESSERACT_LANGUAGES,
+)
+from aiopytesseract.exceptions import (
+    InvalidImageError,
+    LanguageInvalidException,
+    NoSuchFileException,
+    OCRServerError,
+    OEMInvalidException,
+    PSMInvalidException,
+    TesseractTimeoutError,
+)
+from aiopytesseract.models import OSD, Box, Data
+from aiopytesseract.resources import ResourcePolicy, resource_policy
+
+P = ParamSpec("P")
+Command = Callable[[bytes, dict[str, object]], Awaitable[object]]
+# (content type, body) of a successful response, as cached.
+Payload = tuple[str, bytes]
+_Route = tuple[Command, frozenset[str]]
+
+_TEXT = "text/plain; charset=utf-8"
+_BINARY = "application/octet-stream"
+_JSON = "application/json"
+_OPTION_TYPES: dict[str, type] = {
+    "dpi": int,
+    "psm": int,
+    "oem": int,
+    "timeout": float,
+}
+# `preprocess` and `profile` take objects and cannot cross the process boundary.
+_UNSUPPORTED_OPTIONS = frozenset({"image", "preprocess", "profile"})
+# options tesseract opens as files, only accepted inside the server's path roots
+_PATH_OPTIONS = frozenset({"tessdata_dir", "user_words", "user_patterns"})
+# language codes joined by "+", checked before the values reach any command
+_LANGUAGE = re.compile(r"[A-Za-z0-9_+]+")
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Content Too Large",
+    500: "Internal Server Error",
+    504: "Gateway Timeout",
+}
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, error: str, message: str) -> None:
+        self.status = status
+        self.error = error
+        self.message = message
+        super().__init__(message)
+
+
+def _parameters(func: Callable[Concatenate[P], Awaitable[object]]) -> frozenset[str]:
+    return frozenset(inspect.signature(func).parameters) - _UNSUPPORTED_OPTIONS
+
+
+# options are checked against the parameters and converted by `_options`
+# before the call, which mypy cannot follow through a ParamSpec.
+def _route(func: Callable[Concatenate[bytes, P], Awaitable[object]]) -> _Route:
+    async def call(image: bytes, options: dict[str, object]) -> object:
+        return await func(image, **options)  # type: ignore[arg-type, call-arg]
+
+    return call, _parameters(func)
+
+
+def _file_route(func: Callable[Concatenate[str, P], Awaitable[object]]) -> _Route:
+    # confidence and deskew only accept a path.
+    async def call(image: bytes, options: dict[str, object]) -> object:
+        async with aiofiles.tempfile.NamedTemporaryFile(
+            prefix="aiopytesseract-"
+        ) as file:
+            await file.write(image)
+            await file.flush()
+            return await func(str(file.name), **options)  # type: ignore[arg-type, call-arg]
+
+    return call, _parameters(func)
+
+
+_ROUTES: dict[str, _Route] = {
+    "image_to_string": _route(image_to_string.dispatch(bytes)),
+    "image_to_hocr": _route(image_to_hocr.dispatch(bytes)),
+    "image_to_alto": _route(image_to_alto.dispatch(bytes)),
+    "image_to_pdf": _route(image_to_pdf.dispatch(bytes)),
+    "image_to_boxes": _route(image_to_boxes.dispatch(bytes)),
+    "image_to_data": _route(image_to_data.dispatch(bytes)),
+    "image_to_osd": _route(image_to_osd.dispatch(bytes)),
+    "confidence": _file_route(confidence),
+    "deskew": _file_route(deskew),
+}
+
+
+def _options(
+    query: str,
+    parameters: frozenset[str],
+    config_variables: frozenset[str],
+    path_roots: tuple[Path, ...],
+) -> dict[str, object]:
+    options: dict[str, object] = {}
+    config: list[tuple[str, str]] = []
+    for name, value in parse_qsl(query, keep_blank_values=True, strict_parsing=False):
+        if name not in parameters:
+            raise _HTTPError(400, "InvalidOption", f"unsupported option: {name!r}")
+        if name == "config":
+            key, separator, config_value = value.partition("=")
+            if not separator:
+                raise _HTTPError(
+                    400, "InvalidOption", f"config must be name=value, got: {value!r}"
+                )
+            if key not in config_variables:
+                raise _HTTPError(
+                    403, "ForbiddenOption", f"config variable not allowed: {key!r}"
+                )
+            config.append((key, config_value))
+            continue
+        if name == "lang" and not _language_is_valid(value):
+            raise _HTTPError(400, "InvalidOption", f"invalid language: {value!r}")
+        if name in _PATH_OPTIONS and not _inside(value, path_roots):
+            raise _HTTPError(
+                403, "ForbiddenOption", f"{name} outside the server's path roots"
+            )
+        try:
+            options[name] = _OPTION_TYPES.get(name, str)(value)
+        except ValueError:
+            raise _HTTPError(
+                400, "InvalidOption", f"invalid value for {name!r}: {value!r}"
+            ) from None
+    if config:
+        options["config"] = config
+    return options
+
+
+def _language_is_valid(lang: str) -> bool:
+    if lang == AIOPYTESSERACT_AUTO_LANGUAGE:
+        return True
+    return _LANGUAGE.fullmatch(lang) is not None and all(
+        part in TESSERACT_LANGUAGES for part in lang.split("+")
+    )
+
+
+def _inside(path: str, roots: tuple[Path, ...]) -> bool:
+    # resolved, so `..` and symlinks cannot leave a root
+    resolved = Path(path).resolve()
+    return any(resolved.is_relative_to(root) for root in roots)
+
+
+def _jsonable(value: object) -> object:
+    if attrs.has(type(value)):
+        return attrs.asdict(value)  # type: ignore[arg-type]
+    if isinstance(value, list):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def _payload(value: object) -> Payload:
+    if isinstance(value, str):
+        return _TEXT, value.encode()
+    if isinstance(value, bytes):
+        return _BINARY, value
+    return _JSON, json.dumps(_jsonable(value)).encode()
+
+
+def _error_status(exc: Exception) -> int:
+    if isinstance(exc, TesseractTimeoutError):
+        return 504
+    if isinstance(
+        exc,
+        InvalidImageError
+        | PSMInvalidException
+        | OEMInvalidException
+        | LanguageInvalidException
+        | NoSuchFileException
+        | ValueError,
+    ):
+        return 400
+    return 500
+
+
+class OCRServer:
+    """Serve aiopytesseract commands to local processes over HTTP/1.1.
+
+    Requests from every connection share one concurrency limit and one
+    result cache keyed by the image digest, the command and its options;
+    identical requests that arrive while the first one is still running
+    wait for its result instead of spawning tesseract again.
+
+    :param concurrency: maximum commands running at once. (default: number of CPUs)
+    :param cache_size: results kept in the LRU cache, 0 disables it. (default: 256)
+    :param policy: resource policy of spawned processes. (default: ResourcePolicy.for_pool)
+    :param max_request_size: largest accepted image in bytes. (default: 64 MiB)
+    :param keep_alive_timeout: seconds an idle connection is kept open. (default: 60)
+    :param cache_bytes: total size of the cached results. (default: 256 MiB)
+    :param max_cached_payload: larger results are not cached. (default: 16 MiB)
+    :param config_variables: config variables clients may set. (default: AIOPYTESSERACT_SERVER_CONFIG_VARIABLES)
+    :param path_roots: directories path options may point into. (default: none, path options are rejected)
+    """
+
+    def __init__(
+        self,
+        concurrency: int | None = None,
+        cache_size: int = AIOPYTESSERACT_DEFAULT_CACHE_SIZE,
+        policy: ResourcePolicy | None = None,
+        max_request_size: int = AIOPYTESSERACT_MAX_REQUEST_SIZE,
+        keep_alive_timeout: float = AIOPYTESSERACT_KEEP_ALIVE_TIMEOUT,
+        cache_bytes: int = AIOPYTESSERACT_DEFAULT_CACHE_BYTES,
+        max_cached_payload: int = AIOPYTESSERACT_MAX_CACHED_PAYLOAD,
+        config_variables: Iterable[str] = AIOPYTESSERACT_SERVER_CONFIG_VARIABLES,
+        path_roots: Iterable[str] = (),
+    ) -> None:
+        self.concurrency = concurrency or os.cpu_count() or 1
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got: {self.concurrency}")
+        if cache_size < 0:
+            raise ValueError(f"cache_size must not be negative, got: {cache_size}")
+        if cache_bytes < 0:
+            raise ValueError(f"cache_bytes must not be negative, got: {cache_bytes}")
+        self.cache_size = cache_size
+        self.cache_bytes = cache_bytes
+        self.max_cached_payload = min(max_cached_payload, cache_bytes)
+        self.config_variables = frozenset(config_variables)
+        self.path_roots = tuple(Path(root).resolve() for root in path_roots)
+        self.policy = policy or ResourcePolicy.for_pool(self.concurrency)
+        self.max_request_size = max_request_size
+        self.keep_alive_timeout = keep_alive_timeout
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._cache: OrderedDict[str, Payload] = OrderedDict()
+        self._cached_bytes = 0
+        self._inflight: dict[str, asyncio.Future[Payload]] = {}
+        self._server: asyncio.Server | None = None
+        self._path: str | None = None
+        self._stats = dict.fromkeys(
+            ("requests", "running", "queued", "cache_hits", "cache_misses", "errors"), 0
+        )
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters since start, plus the current queue and cache sizes."""
+        return {
+            **self._stats,
+            "cached": len(self._cache),
+            "cached_bytes": self._cached_bytes,
+        }
+
+    async def start(
+        self,
+        path: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = AIOPYTESSERACT_DEFAULT_SERVER_PORT,
+        socket_mode: int = 0o600,
+    ) -> None:
+        """Listen on the Unix socket `path`, or on `host:port` without one.
+
+        :param path: Unix socket path. (default: None)
+        :param host: TCP host when no path is given. (default: 127.0.0.1)
+        :param port: TCP port, 0 picks a free one. (default: 8884)
+        :param socket_mode: permissions of the Unix socket, e.g. 0o660 for a group. (default: 0o600)
+        """
+        if path is None:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            return
+        # bound inside a private directory and moved into place once its
+        # mode is set, so it is never reachable with the umask's permissions
+        staging = Path(
+            tempfile.mkdtemp(prefix=".aiopytesseract-", dir=Path(path).parent)
+        )
+        try:
+            staged = staging / "socket"
+            self._server = await asyncio.start_unix_server(self._handle, staged)
+            staged.chmod(socket_mode)
+            staged.replace(path)
+        finally:
+            with contextlib.suppress(OSError):
+                staging.rmdir()
+        self._path = path
+
+    @property
+    def address(self) -> str | tuple[str, int]:
+        """Socket path or (host, port) the server listens on."""
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        if self._path is not None:
+            return self._path
+        address: str | tuple[str, int] = self._server.sockets[0].getsockname()
+        if isinstance(address, tuple):
+            return address[:2]  # IPv6 adds flowinfo and scope id
+        return address
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            raise RuntimeError("server is not started")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self) -> "OCRServer":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await self._serve_one(reader, writer):
+                pass
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            TimeoutError,
+            ConnectionError,
+            ValueError,  # malformed request line
+        ) as exc:
+            logger.debug(f"Closing connection: {exc!r}")
+        finally:
+            writer.close()
+
+    async def _serve_one(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        head = await asyncio.wait_for(
+            reader.readuntil(b"\r\n\r\n"), self.keep_alive_timeout
+        )
+        request_line, *header_lines = head.decode("latin-1").split("\r\n")[:-2]
+        method, target, version = request_line.split(" ", 2)
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = (
+            headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+        )
+        try:
+            body = await self._body(reader, method, headers)
+            content_type, payload = await self._dispatch(method, target, body)
+            status = 200
+        except _HTTPError as exc:
+            status, content_type, payload = exc.status, _JSON, self._error(exc)
+            self._stats["errors"] += 1
+            # the unread body would be parsed as the next request.
+            keep_alive = keep_alive and status not in (411, 413)
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+            ).encode("latin-1")
+            + payload
+        )
+        await writer.drain()
+        return keep_alive
+
+    async def _body(
+        self, reader: asyncio.StreamReader, method: str, headers: dict[str, str]
+    ) -> bytes:
+        if method != "POST":
+            return b""
+        if "content-length" not in headers:
+            raise _HTTPError(411, "LengthRequired", "Content-Length is required")
+        try:
+            length = int(headers["content-length"])
+        except ValueError:
+            raise _HTTPError(411, "LengthRequired", "invalid Content-Length") from None
+        if length > self.max_request_size:
+            raise _HTTPError(
+                413,
+                "RequestTooLarge",
+                f"image of {length} bytes exceeds {self.max_request_size}",
+            )
+        return await reader.readexactly(length)
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Payload:
+        url = urlsplit(target)
+        name = url.path.strip("/")
+        self._stats["requests"] += 1
+        if method == "GET":
+            if name == "stats":
+                return _payload(self.stats)
+            if name == "languages":
+                return await self._cached(name, b"", lambda: get_languages())
+            if name == "tesseract_version":
+                return await self._cached(name, b"", lambda: get_tesseract_version())
+        elif method == "POST" and name in _ROUTES:
+            command, parameters = _ROUTES[name]
+            options = _options(
+                url.query, parameters, self.config_variables, self.path_roots
+            )
+            key = f"{name}?{sorted(options.items())}"
+            return await self._cached(key, body, lambda: command(body, options))
+        if name in _ROUTES or name in ("stats", "languages", "tesseract_version"):
+            raise _HTTPError(405, "MethodNotAllowed", f"{method} /{name}")
+        raise _HTTPError(404, "UnknownCommand", f"unknown command: {name!r}")
+
+    async def _cached(
+        self, key: str, body: bytes, call: Callable[[], Awaitable[object]]
+    ) -> Payload:
+        digest = hashlib.sha256(body)
+        digest.update(key.encode())
+        cache_key = digest.hexdigest()
+        if cache_key in self._cache:
+            self._stats["cache_hits"] += 1
+            self._cache.move_to_end(cache_key)
+            return self._cache[cache_key]
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self._stats["cache_hits"] += 1
+            return await asyncio.shield(inflight)
+        self._stats["cache_misses"] += 1
+        future: asyncio.Future[Payload] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            payload = _payload(await self._run(call))
+        except Exception as exc:
+            error = self._http_error(exc)
+            future.set_exception(error)
+            future.exception()  # followers are optional, mark it retrieved
+            raise error from exc
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(payload)
+        finally:
+            del self._inflight[cache_key]
+        self._store(cache_key, payload)
+        return payload
+
+    def _store(self, cache_key: str, payload: Payload) -> None:
+        size = len(payload[1])
+        if not self.cache_size or size > self.max_cached_payload:
+            return
+        self._cache[cache_key] = payload
+        self._cached_bytes += size
+        while (
+            len(self._cache) > self.cache_size or self._cached_bytes > self.cache_bytes
+        ):
+            _, (_, evicted) = self._cache.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+
+    async def _run(self, call: Callable[[], Awaitable[object]]) -> object:
+        self._stats["queued"] += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._stats["queued"] -= 1
+        self._stats["running"] += 1
+        try:
+            with resource_policy(self.policy):
+                return await call()
+        finally:
+            self._stats["running"] -= 1
+            self._semaphore.release()
+
+    @staticmethod
+    def _http_error(exc: Exception) -> _HTTPError:
+        if isinstance(exc, _HTTPError):
+            return exc
+        return _HTTPError(_error_status(exc), type(exc).__name__, str(exc))
+
+    @staticmethod
+    def _error(exc: _HTTPError) -> bytes:
+        return json.dumps({"error": exc.error, "message": exc.message}).encode()
+
+
+class OCRClient:
+    """Async client of an `OCRServer`, with the signatures of the commands.
+
+    Connections are kept alive and reused; a pooled connection the server
+    has since closed is retried once on a fresh one. Options are those of
+    the matching aiopytesseract command, except `preprocess`.
+
+    :param path: Unix socket path of the server. (default: None)
+    :param host: TCP host when no path is given. (default: 127.0.0.1)
+    :param port: TCP port when no path is given. (default: 8884)
+    :param pool_size: maximum open connections. (default: 8)
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = AIOPYTESSERACT_DEFAULT_SERVER_PORT,
+        pool_size: int = 8,
+    ) -> None:
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be at least 1, got: {pool_size}")
+        self.path = path
+        self.host = host
+        self.port = port
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+
+    async def image_to_string(self, image: str | bytes, **options: object) -> str:
+        return (await self._post("image_to_string", image, options)).decode()
+
+    async def image_to_hocr(self, image: str | bytes, **options: object) -> str:
+        return (await self._post("image_to_hocr", image, options)).decode()
+
+    async def image_to_alto(self, image: str | bytes, **options: object) -> bytes:
+        return await self._post("image_to_alto", image, options)
+
+    async def image_to_pdf(self, image: str | bytes, **options: object) -> bytes:
+        return await self._post("image_to_pdf", image, options)
+
+    async def image_to_boxes(self, image: str | bytes, **options: object) -> list[Box]:
+        body = await self._post("image_to_boxes", image, options)
+        return cattr.structure(json.loads(body), list[Box])
+
+    async def image_to_data(self, image: str | bytes, **options: object) -> list[Data]:
+        body = await self._post("image_to_data", image, options)
+        return cattr.structure(json.loads(body), list[Data])
+
+    async def image_to_osd(self, image: str | bytes, **options: object) -> OSD:
+        body = await self._post("image_to_osd", image, options)
+        return cattr.structure(json.loads(body), OSD)
+
+    async def confidence(self, image: str | bytes, **options: object) -> float:
+        return float(await self._post("confidence", image, options))
+
+    async def deskew(self, image: str | bytes, **options: object) -> float:
+        return float(await self._post("deskew", image, options))
+
+    async def languages(self) -> list[str]:
+        return cattr.structure(json.loads(await self._get("languages")), list[str])
+
+    async def tesseract_version(self) -> str:
+        return (await self._get("tesseract_version")).decode()
+
+    async def stats(self) -> dict[str, int]:
+        return cattr.structure(json.loads(await self._get("stats")), dict[str, int])
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        await asyncio.gather(
+            *(writer.wait_closed() for _, writer in idle), return_exceptions=True
+        )
+
+    async def __aenter__(self) -> "OCRClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def _post(
+        self, command: str, image: str | bytes, options: dict[str, object]
+    ) -> bytes:
+        if isinstance(image, str):
+            async with aiofiles.open(image, "rb") as file:
+                image = await file.read()
+        query: list[tuple[str, object]] = []
+        for name, value in options.items():
+            if name == "config":
+                config = cast(list[tuple[str, str]], value) or []
+                query += [("config", f"{key}={item}") for key, item in config]
+            elif value is not None:
+                query.append((name, value))
+        target = f"/{command}?{urlencode(query)}" if query else f"/{command}"
+        return await self._request("POST", target, image, options.get("timeout"))
+
+    async def _get(self, name: str) -> bytes:
+        return await self._request("GET", f"/{name}", b"", None)
+
+    async def _request(
+        self, method: str, target: str, body: bytes, timeout: object
+    ) -> bytes:
+        request = (
+            f"{method} {target} HTTP/1.1\r\n"
+            f"Host: aiopytesseract\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("latin-1") + body
+        async with self._slots:
+            reused = bool(self._idle)
+            connection = self._idle.pop() if reused else await self._connect()
+            try:
+                status, keep_alive, payload = await self._exchange(connection, request)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                connection[1].close()
+                if not reused:
+                    raise
+                # the server dropped the idle connection, retry on a new one.
+                connection = await self._connect()
+                status, keep_alive, payload = await self._exchange(connection, request)
+            except BaseException:
+                connection[1].close()
+                raise
+            if keep_alive:
+                self._idle.append(connection)
+            else:
+                connection[1].close()
+        if status == 200:
+            return payload
+        error = json.loads(payload)
+        if status == 504:
+            raise TesseractTimeoutError(timeout if isinstance(timeout, float) else None)
+        raise OCRServerError(status, str(error["error"]), str(error["message"]))
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.path is not None:
+            return await asyncio.open_unix_connection(self.path)
+        return await asyncio.open_connection(self.host, self.port)
+
+    @staticmethod
+    async def _exchange(
+        connection: tuple[asyncio.StreamReader, asyncio.StreamWriter], request: bytes
+    ) -> tuple[int, bool, bytes]:
+        reader, writer = connection
+        writer.write(request)
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        status_line, *header_lines = head.split("\r\n")[:-2]
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        payload = await reader.readexactly(int(headers["content-length"]))
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return int(status_line.split(" ", 2)[1]), keep_alive, payload
+
+
+def parser() -> argparse.ArgumentParser:
+    cli = argparse.ArgumentParser(
+        prog="python -m aiopytesseract.server",
+        description="Serve aiopytesseract commands to local processes.",
+    )
+    cli.add_argument("--unix", metavar="PATH", help="listen on a Unix socket")
+    cli.add_argument("--host", default="127.0.0.1", help="(default: %(default)s)")
+    cli.add_argument(
+        "--port",
+        type=int,
+        default=AIOPYTESSERACT_DEFAULT_SERVER_PORT,
+        help="(default: %(default)s)",
+    )
+    cli.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="tesseract processes running at once (default: %(default)s)",
+    )
+    cli.add_argument(
+        "--cache-size",
+        type=int,
+        default=AIOPYTESSERACT_DEFAULT_CACHE_SIZE,
+        help="results kept in memory, 0 disables the cache (default: %(default)s)",
+    )
+    cli.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=AIOPYTESSERACT_DEFAULT_CACHE_BYTES,
+        help="total size of the cached results (default: %(default)s)",
+    )
+    cli.add_argument(
+        "--allow-path",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="directory clients may pass tessdata_dir, user_words or user_patterns in",
+    )
+    cli.add_argument(
+        "--allow-config",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="config variable clients may set, in addition to the defaults",
+    )
+    cli.add_argument(
+        "--socket-mode",
+        type=lambda mode: int(mode, 8),
+        default=0o600,
+        help="permissions of the Unix socket, in octal (default: 600)",
+    )
+    return cli
+
+
+async def serve(options: argparse.Namespace) -> None:
+    server = OCRServer(
+        options.concurrency,
+        options.cache_size,
+        cache_bytes=options.cache_bytes,
+        config_variables=AIOPYTESSERACT_SERVER_CONFIG_VARIABLES
+        | set(options.allow_config),
+        path_roots=options.allow_path,
+    )
+    async with server:
+        await server.start(
+            options.unix, options.host, options.port, socket_mode=options.socket_mode
+        )
+        print(f"aiopytesseract server listening on {server.address}", file=sys.stderr)
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> int:
+    options = parser().parse_args(argv)
+    if options.concurrency < 1:
+        parser().error("--concurrency must be at least 1")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(options))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+"""Recognize with each candidate language alone and keep the best run.
+
+A combined `lang="eng+deu"` run evaluates every model on every word and
+is often several times slower than one language, for little or no gain
+on text that is mostly in a single language. Speculative recognition
+runs `image_to_data` once per language in parallel and keeps the run
+with the highest mean word confidence; a run that is confident enough
+wins outright and the slower ones are cancelled (their processes
+killed).
+"""
+
+import asyncio
+from collections.abc import Sequence
+from pathlib import Path
+
+from aiopytesseract import commands
+from aiopytesseract._logger import logger
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_DEFAULT_DPI,
+    AIOPYTESSERACT_DEFAULT_ENCODING,
+    AIOPYTESSERACT_DEFAULT_PSM,
+    AIOPYTESSERACT_DEFAULT_SPECULATIVE_CONFIDENCE,
+    AIOPYTESSERACT_DEFAULT_TIMEOUT,
+)
+from aiopytesseract.models import Data, LanguageRun, SpeculativeResult
+from aiopytesseract.validators import file_exists, language_is_valid
+
+_WORD_LEVEL = 5
+
+
+def mean_confidence(data: Sequence[Data]) -> tuple[float, int]:
+    """Mean confidence and number of the recognised words of `image_to_data` rows."""
+    confs = [
+        row.conf
+        for row in data
+        if row.level == _WORD_LEVEL and row.conf >= 0 and row.text.strip()
+    ]
+    return (sum(confs) / len(confs) if confs else 0.0), len(confs)
+
+
+async def speculate(
+    image: str | bytes,
+    languages: Sequence[str],
+    confident: float = AIOPYTESSERACT_DEFAULT_SPECULATIVE_CONFIDENCE,
+    patience: float | None = None,
+    dpi: int = AIOPYTESSERACT_DEFAULT_DPI,
+    timeout: float = AIOPYTESSERACT_DEFAULT_TIMEOUT,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+    tessdata_dir: str | None = None,
+    psm: int = AIOPYTESSERACT_DEFAULT_PSM,
+) -> SpeculativeResult:
+    """`image_to_data` with the best of several single-language runs.
+
+    The first run to finish with a mean word confidence of `confident` or
+    more wins and the others are cancelled. Otherwise the best finished run
+    wins once every run finished, or once the others ran `patience` times
+    longer than the first finished one. Failed runs are reported, the
+    error is raised only if every run failed.
+
+    :param image: image input to tesseract. (valid values: str, bytes)
+    :param languages: single languages to run, in order of preference on ties. (format: [eng, deu])
+    :param confident: mean word confidence that wins without waiting for slower runs. (default: 85)
+    :param patience: wait at most this factor of the first finished run's time for the others. (default: None, wait for every run)
+    :param dpi: image dots per inch (DPI). (default: 300)
+    :param timeout: command timeout of each run (default: 30)
+    :param encoding: decode bytes to string. (default: utf-8)
+    :param tessdata_dir: location of tessdata path. (default: None)
+    :param psm: page segmentation modes. (default: 3)
+    """
+    if not languages:
+        raise ValueError("at least one language is required")
+    if len(set(languages)) != len(languages):
+        raise ValueError(f"languages must be unique, got: {languages}")
+    for lang in languages:
+        await language_is_valid(lang)
+    if patience is not None and patience < 1:
+        raise ValueError(f"patience must be at least 1, got: {patience}")
+    if isinstance(image, str):
+        await file_exists(image)
+        # read once for every run
+        image = Path(image).read_bytes()
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    tasks = {
+        asyncio.create_task(
+            commands.image_to_data(
+                image,
+                dpi=dpi,
+                lang=lang,
+                timeout=timeout,
+                encoding=encoding,
+                tessdata_dir=tessdata_dir,
+                psm=psm,
+            )
+        ): lang
+        for lang in languages
+    }
+    runs: dict[str, LanguageRun] = {}
+    results: dict[str, list[Data]] = {}
+    errors: list[BaseException] = []
+    pending = set(tasks)
+    deadline: float | None = None
+    try:
+        while pending:
+            wait = None if deadline is None else max(deadline - loop.time(), 0)
+            done, pending = await asyncio.wait(
+                pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                break
+            for task in done:
+                lang = tasks[task]
+                seconds = loop.time() - started
+                error = task.exception()
+                if error is not None:
+                    errors.append(error)
+                    runs[lang] = LanguageRun(lang, "failed", seconds)
+                    continue
+                data = task.result()
+                conf, words = mean_confidence(data)
+                results[lang] = data
+                runs[lang] = LanguageRun(lang, "done", seconds, conf, words)
+                if patience is not None and deadline is None:
+                    deadline = started + seconds * patience
+            if any(
+                (run.conf or 0.0) >= confident
+                for run in runs.values()
+                if run.status == "done"
+            ):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        seconds = loop.time() - started
+        for task in pending:
+            runs[tasks[task]] = LanguageRun(tasks[task], "cancelled", seconds)
+
+    if not results:
+        raise errors[0]
+    winner = max(
+        (lang for lang in languages if lang in results),
+        key=lambda lang: runs[lang].conf or 0.0,
+    )
+    ordered = tuple(runs[lang] for lang in languages)
+    logger.debug(
+        f"Speculative run: {winner} won ({'; '.join(str(run) for run in ordered)})"
+    )
+    return SpeculativeResult(results[winner], winner, ordered)
@@ -0,0 +1,153 @@
+"""Blocking facade over the asyncio API for callers without an event loop."""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from types import TracebackType
+from typing import ParamSpec, TypeVar
+
+from aiopytesseract.commands import image_to_data, image_to_string
+from aiopytesseract.models import Data
+from aiopytesseract.resources import ResourcePolicy, resource_policy
+
+P = ParamSpec("P")
+ResultT = TypeVar("ResultT")
+ImageT = TypeVar("ImageT")
+
+
+class SyncClient:
+    """Run aiopytesseract commands from synchronous code.
+
+    One event loop lives in a background thread for the lifetime of the
+    client, so blocking calls from Celery tasks, Django views or plain
+    threads share it instead of paying `asyncio.run` per page, and
+    `submit`/`map` fan batches out concurrently.
+
+    :param concurrency: maximum commands running at once. (default: number of CPUs)
+    :param policy: resource policy of spawned processes. (default: ResourcePolicy.for_pool)
+    """
+
+    def __init__(
+        self, concurrency: int | None = None, policy: ResourcePolicy | None = None
+    ) -> None:
+        self.concurrency = concurrency or os.cpu_count() or 1
+        if self.concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got: {self.concurrency}")
+        self.policy = policy or ResourcePolicy.for_pool(self.concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="aiopytesseract", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        func: Callable[P, Awaitable[ResultT]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> "concurrent.futures.Future[ResultT]":
+        """Schedule `func(*args, **kwargs)` on the client loop.
+
+        :param func: coroutine function, e.g. `aiopytesseract.image_to_hocr`.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot submit to a closed SyncClient")
+            return asyncio.run_coroutine_threadsafe(
+                self._call(func, *args, **kwargs), self._loop
+            )
+
+    def map(
+        self,
+        func: Callable[[ImageT], Awaitable[ResultT]],
+        images: Iterable[ImageT],
+        timeout: float | None = None,
+    ) -> Iterator[ResultT]:
+        """Run `func` over `images` concurrently, yielding results in order.
+
+        Like `concurrent.futures.Executor.map`, every image is submitted up
+        front and the first exception is raised when its result is reached.
+        Use `functools.partial` to pass options.
+
+        :param func: coroutine function applied to each image.
+        :param images: images. (valid values: str, bytes)
+        :param timeout: seconds to wait for all results. (default: None)
+        """
+        futures = [self.submit(func, image) for image in images]
+        return self._results(futures, timeout)
+
+    def image_to_string(self, image: str | bytes, **options: object) -> str:
+        """Blocking `aiopytesseract.image_to_string`, same options."""
+        return self.submit(image_to_string, image, **options).result()
+
+    def image_to_data(self, image: str | bytes, **options: object) -> list[Data]:
+        """Blocking `aiopytesseract.image_to_data`, same options."""
+        return self.submit(image_to_data, image, **options).result()
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the client loop.
+
+        :param wait: wait for submitted calls, otherwise cancel them. (default: True)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        asyncio.run_coroutine_threadsafe(self._shutdown(wait), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def _call(
+        self,
+        func: Callable[P, Awaitable[ResultT]],
+        /,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> ResultT:
+        async with self._semaphore:
+            with resource_policy(self.policy):
+                return await func(*args, **kwargs)
+
+    async def _shutdown(self, wait: bool) -> None:
+        # cancel tasks on the loop rather than their concurrent futures, so
+        # running commands get to kill their tesseract process.
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        if not wait:
+            for task in tasks:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._loop.shutdown_asyncgens()
+
+    @staticmethod
+    def _results(
+        futures: "list[concurrent.futures.Future[ResultT]]", timeout: float | None
+    ) -> Iterator[ResultT]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            for future in futures:
+                if deadline is None:
+                    yield future.result()
+                else:
+                    yield future.result(max(deadline - time.monotonic(), 0))
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,180 @@
+"""Stage traineddata files on tmpfs so tesseract processes load them from memory."""
+
+import asyncio
+import hashlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_DEFAULT_ENCODING,
+    AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    AIOPYTESSERACT_TESSDATA_STAGING_ROOT,
+)
+from aiopytesseract.exceptions import NoSuchFileException, TessdataStagingError
+from aiopytesseract.models import WarmupReport
+
+# --tessdata-dir replaces the whole data directory, output configs (hocr,
+# tsv, alto, pdf...) and the pdf font must be staged with the languages.
+_SHARED_DIRECTORIES = ("configs", "tessconfigs")
+_SHARED_FILES = ("pdf.ttf",)
+_READ_SIZE = 1024 * 1024
+
+# source tessdata dir (None: tesseract default) -> (staging dir, languages)
+_staged: dict[str | None, tuple[str, frozenset[str]]] = {}
+
+
+async def warm_tessdata(
+    langs: str | Iterable[str] = AIOPYTESSERACT_DEFAULT_LANGUAGE,
+    tessdata_dir: str | None = None,
+    staging_dir: str | None = None,
+    encoding: str = AIOPYTESSERACT_DEFAULT_ENCODING,
+) -> WarmupReport:
+    """Stage traineddata files on tmpfs and pre-read them into the page cache.
+
+    Files are hardlinked when the staging dir shares the source filesystem,
+    copied otherwise; copies are verified against the SHA-256 of the source
+    (a hardlink is the source file, there is nothing to verify). Afterwards
+    every command that uses `tessdata_dir` and only staged languages runs
+    with the staging dir as `--tessdata-dir`. Calling it again adds
+    languages to the staging dir.
+
+    :param langs: languages to stage. (default: eng, format: eng+por or ["eng", "por"])
+    :param tessdata_dir: location of tessdata path. (default: tesseract default)
+    :param staging_dir: where files are staged. (default: under /dev/shm)
+    :param encoding: decode bytes to string. (default: utf-8)
+    """
+    started = time.perf_counter()
+    languages = _split_languages(langs)
+    source = tessdata_dir or await _default_tessdata_dir(encoding)
+    key = _registry_key(tessdata_dir)
+    if key in _staged:
+        languages |= _staged[key][1]
+    if staging_dir is None:
+        staging_dir = _default_staging_dir(source)
+    linked, copied, reused, size = await asyncio.to_thread(
+        _stage, Path(source), Path(staging_dir), sorted(languages)
+    )
+    _staged[key] = (staging_dir, frozenset(languages))
+    return WarmupReport(
+        tessdata_dir=source,
+        staging_dir=staging_dir,
+        languages=tuple(sorted(languages)),
+        size=size,
+        linked=linked,
+        copied=copied,
+        reused=reused,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def staged_tessdata_dir(
+    tessdata_dir: str | None, lang: str | None = None, psm: int | None = None
+) -> str | None:
+    """Return the staging dir that replaces `tessdata_dir` for `lang`.
+
+    Falls back to `tessdata_dir` when any required language is not staged.
+    """
+    staged = _staged.get(_registry_key(tessdata_dir))
+    if staged is None:
+        return tessdata_dir
+    staging_dir, languages = staged
+    required = _split_languages(lang or AIOPYTESSERACT_DEFAULT_LANGUAGE)
+    if psm in (0, 1, 12):  # orientation and script detection
+        required.add("osd")
+    return staging_dir if required <= languages else tessdata_dir
+
+
+def unstage_tessdata(tessdata_dir: str | None = None) -> None:
+    """Stop substituting the staging dir, staged files are left in place."""
+    _staged.pop(_registry_key(tessdata_dir), None)
+
+
+def _split_languages(langs: str | Iterable[str]) -> set[str]:
+    if isinstance(langs, str):
+        langs = langs.split("+")
+    return {lang for lang in langs if lang}
+
+
+def _registry_key(tessdata_dir: str | None) -> str | None:
+    return str(Path(tessdata_dir).absolute()) if tessdata_dir else None
+
+
+async def _default_tessdata_dir(encoding: str) -> str:
+    if prefix := os.environ.get("TESSDATA_PREFIX"):
+        return prefix
+    from aiopytesseract.base_command import execute_cmd
+
+    proc = await execute_cmd("--list-langs")
+    stdout, _ = await proc.communicate()
+    # List of available languages in "/usr/share/tesseract-ocr/5/tessdata/" (3):
+    match = re.search(r'"(.+?)"', stdout.decode(encoding))
+    if match is None:
+        raise TessdataStagingError("could not locate the tesseract tessdata dir")
+    return match.group(1)
+
+
+def _default_staging_dir(source: str) -> str:
+    root = Path(AIOPYTESSERACT_TESSDATA_STAGING_ROOT)
+    if not root.is_dir():
+        root = Path(tempfile.gettempdir())
+    owner = os.getuid() if sys.platform != "win32" else 0
+    digest = hashlib.sha256(str(Path(source).absolute()).encode()).hexdigest()[:12]
+    return str(root / f"aiopytesseract-tessdata-{owner}-{digest}")
+
+
+def _stage(
+    source: Path, staging: Path, languages: list[str]
+) -> tuple[int, int, int, int]:
+    staging.mkdir(mode=0o700, parents=True, exist_ok=True)
+    for directory in _SHARED_DIRECTORIES:
+        if (source / directory).is_dir():
+            shutil.copytree(source / directory, staging / directory, dirs_exist_ok=True)
+    names = [f"{lang}.traineddata" for lang in languages]
+    for name in names:
+        if not (source / name).is_file():
+            raise NoSuchFileException(str(source / name))
+    names.extend(name for name in _SHARED_FILES if (source / name).is_file())
+    linked = copied = reused = size = 0
+    for name in names:
+        # recorded before staging, so a copy is checked against the source
+        checksum = _sha256(source / name)
+        target = staging / name
+        size += (source / name).stat().st_size
+        if target.is_file() and (
+            target.samefile(source / name) or _sha256(target) == checksum
+        ):
+            reused += 1
+            continue
+        # stage under a temporary name so concurrent readers never see a
+        # partial file.
+        partial = staging / f".{name}.{os.getpid()}"
+        try:
+            os.link(source / name, partial)
+        except OSError:
+            shutil.copyfile(source / name, partial)
+            copied += 1
+            # verify what actually landed on the staging fs
+            if _sha256(partial) != checksum:
+                partial.unlink()
+                raise TessdataStagingError(
+                    f"checksum mismatch staging '{name}'"
+                ) from None
+        else:
+            linked += 1
+        partial.replace(target)
+    return linked, copied, reused, size
+
+
+def _sha256(path: Path) -> str:
+    # reading the whole file also pulls it into the page cache
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -4,13 +4,16 @@ from aiopytesseract.constants import (
     OCR_ENGINE_MODES,
     PAGE_SEGMENTATION_MODES,
     TESSERACT_LANGUAGES,
+    TESSERACT_MAX_IMAGE_SIDE,
 )
 from aiopytesseract.exceptions import (
+    InvalidImageError,
     LanguageInvalidException,
     NoSuchFileException,
     OEMInvalidException,
     PSMInvalidException,
 )
+from aiopytesseract.models import ImageInfo
 
 
 async def psm_is_valid(psm: int) -> None:
@@ -34,3 +37,12 @@ async def language_is_valid(language: str) -> None:
             raise LanguageInvalidException(
                 f"'{lang}' language is not among the supported by Tesseract."
             )
+
+
+async def image_is_valid(image: bytes) -> ImageInfo:
+    from aiopytesseract.image_header import sniff
+
+    info = sniff(image)
+    if max(info.width, info.height) > TESSERACT_MAX_IMAGE_SIDE:
+        raise InvalidImageError(f"{info} is larger than {TESSERACT_MAX_IMAGE_SIDE}px")
+    return info
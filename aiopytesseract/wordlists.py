@@ -0,0 +1,131 @@
+"""Materialize in-memory `user_words` and `user_patterns` lists on tmpfs.
+
+Tesseract only reads word and pattern lists from files. Lists given as
+bytes or as an iterable of str are written once per content to a file
+named by its SHA-256 under a per-process tmpfs directory, shared by
+concurrent calls through a reference count. Files no longer referenced
+are kept for reuse, the least recently released ones are deleted once
+more than `AIOPYTESSERACT_MAX_IDLE_WORDLISTS` are idle.
+"""
+
+import atexit
+import hashlib
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from aiopytesseract.constants import (
+    AIOPYTESSERACT_MAX_IDLE_WORDLISTS,
+    AIOPYTESSERACT_TESSDATA_STAGING_ROOT,
+)
+
+# a str is a file path, bytes the file content, other iterables one word
+# (or pattern) per item
+WordList = str | bytes | Iterable[str]
+
+_lock = threading.Lock()
+_directory: Path | None = None
+# content digest -> references
+_references: dict[str, int] = {}
+# unreferenced digests, least recently released first
+_idle: OrderedDict[str, None] = OrderedDict()
+
+
+def wordlist_content(words: bytes | Iterable[str]) -> bytes:
+    """File content of a word or pattern list, one entry per line.
+
+    :param words: file content, or one word (or pattern) per item.
+    """
+    if isinstance(words, bytes):
+        return words
+    lines = []
+    for word in words:
+        if "\n" in word:
+            raise ValueError(f"word list entries must be single lines, got: {word!r}")
+        lines.append(f"{word}\n")
+    return "".join(lines).encode()
+
+
+def acquire(content: bytes) -> str:
+    """Path of a file holding `content`, kept until the matching `release`.
+
+    :param content: file content.
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    with _lock:
+        path = _staging_directory() / f"{digest}.txt"
+        if digest in _references:
+            _references[digest] += 1
+        else:
+            if digest in _idle:
+                del _idle[digest]
+            else:
+                _write(path, content)
+            _references[digest] = 1
+    return str(path)
+
+
+def release(path: str) -> None:
+    """Drop a reference taken by `acquire`.
+
+    :param path: path returned by `acquire`.
+    """
+    digest = Path(path).stem
+    with _lock:
+        _references[digest] -= 1
+        if _references[digest]:
+            return
+        del _references[digest]
+        _idle[digest] = None
+        while len(_idle) > AIOPYTESSERACT_MAX_IDLE_WORDLISTS:
+            evicted, _ = _idle.popitem(last=False)
+            if _directory is not None:
+                (_directory / f"{evicted}.txt").unlink(missing_ok=True)
+
+
+@contextmanager
+def wordlist_files(
+    user_words: WordList | None, user_patterns: WordList | None
+) -> Iterator[tuple[str | None, str | None]]:
+    """File paths for `user_words` and `user_patterns`, valid inside the block.
+
+    Paths and None pass through, lists are materialized for the duration
+    of the block.
+    """
+    acquired: list[str] = []
+    try:
+        paths = []
+        for wordlist in (user_words, user_patterns):
+            if wordlist is None or isinstance(wordlist, str):
+                paths.append(wordlist)
+            else:
+                acquired.append(acquire(wordlist_content(wordlist)))
+                paths.append(acquired[-1])
+        yield paths[0], paths[1]
+    finally:
+        for path in acquired:
+            release(path)
+
+
+def _staging_directory() -> Path:
+    global _directory
+    if _directory is None:
+        root = Path(AIOPYTESSERACT_TESSDATA_STAGING_ROOT)
+        if not root.is_dir():
+            root = Path(tempfile.gettempdir())
+        _directory = Path(
+            tempfile.mkdtemp(prefix="aiopytesseract-wordlists-", dir=root)
+        )
+        atexit.register(shutil.rmtree, _directory, ignore_errors=True)
+    return _directory
+
+
+def _write(path: Path, content: bytes) -> None:
+    # readers only ever see the complete file
+    partial = path.with_suffix(".tmp")
+    partial.write_bytes(content)
+    partial.replace(path)
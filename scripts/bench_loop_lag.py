@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""Measure event loop lag while large tesseract outputs are parsed.
+
+A probe task sleeps 1ms in a loop and records how late it wakes up, while
+a mixed workload parses synthetic TSV pages (`image_to_data` output) of a
+dense page and of small snippets. Parsing runs inline, in a thread pool
+and in a process pool, with the default size threshold for the latter two.
+
+    PYTHONPATH=. python scripts/bench_loop_lag.py [--words 5000] [--pages 40] [--concurrency 4] [--interval 0.01]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from aiopytesseract.parsing import ParsePolicy, parse, parse_data, parse_policy
+
+HEADER = (
+    "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+    "left\ttop\twidth\theight\tconf\ttext\n"
+)
+
+
+def tsv(words: int) -> bytes:
+    rows = [
+        f"5\t1\t1\t1\t{n // 12 + 1}\t{n % 12 + 1}\t{n % 12 * 80}\t{n // 12 * 30}"
+        f"\t72\t24\t{90 + n % 10}.5\tword{n}\n"
+        for n in range(words)
+    ]
+    return (HEADER + "".join(rows)).encode()
+
+
+async def probe(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - started - 0.001)
+
+
+async def workload(
+    policy: ParsePolicy, pages: list[bytes], concurrency: int, interval: float
+) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def one(arrival: float, page: bytes) -> None:
+        # outputs arrive over time, as tesseract processes finish
+        await asyncio.sleep(arrival)
+        async with semaphore:
+            await parse(parse_data, page, "utf-8")
+
+    prober = asyncio.create_task(probe(stop, lags))
+    started = time.perf_counter()
+    with parse_policy(policy):
+        await asyncio.gather(*(one(n * interval, page) for n, page in enumerate(pages)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await prober
+    return elapsed, lags
+
+
+def report(name: str, elapsed: float, lags: list[float]) -> None:
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[int(len(lags_ms) * 0.99) - 1]
+    print(
+        f"{name:<8} {elapsed:7.3f}s  lag p50 {statistics.median(lags_ms):6.2f}ms"
+        f"  p99 {p99:6.2f}ms  max {lags_ms[-1]:6.2f}ms"
+    )
+
+
+async def main(words: int, pages: int, concurrency: int, interval: float) -> None:
+    large, small = tsv(words), tsv(20)
+    # one dense page for every three snippets
+    mixed = [large if n % 4 == 0 else small for n in range(pages)]
+    print(f"{pages} outputs, dense page {len(large)} bytes, snippet {len(small)} bytes")
+    executors: list[tuple[str, Executor]] = [
+        ("thread", ThreadPoolExecutor(concurrency)),
+        ("process", ProcessPoolExecutor(concurrency)),
+    ]
+    inline = ParsePolicy(threshold=2**62)
+    report("inline", *await workload(inline, mixed, concurrency, interval))
+    for name, executor in executors:
+        with executor:
+            # warm up the workers before measuring
+            policy = ParsePolicy(executor=executor)
+            await workload(policy, mixed[:4], concurrency, 0)
+            report(name, *await workload(policy, mixed, concurrency, interval))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+    asyncio.run(main(args.words, args.pages, args.concurrency, args.interval))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Benchmark image_to_string on raw images against the preprocessing stage.
+
+Without arguments a 600 DPI colour "photo" is synthesized from the test sample.
+
+    python scripts/bench_preprocessing.py [images ...] [--runs 5] [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import io
+import statistics
+import time
+from pathlib import Path
+
+from PIL import Image
+
+import aiopytesseract
+from aiopytesseract.preprocessing import Preprocess
+
+SAMPLE = Path(__file__).parent.parent / "tests/samples/file-sample_150kB.png"
+
+
+def synthetic_photo() -> bytes:
+    with Image.open(SAMPLE) as img:
+        photo = img.convert("RGB").resize((img.width * 2, img.height * 2))
+    output = io.BytesIO()
+    photo.save(output, format="PNG", dpi=(600, 600))
+    return output.getvalue()
+
+
+async def measure(
+    images: list[bytes], runs: int, concurrency: int, preprocess: Preprocess | None
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(image: bytes) -> None:
+        async with semaphore:
+            await aiopytesseract.image_to_string(image, dpi=600, preprocess=preprocess)
+
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await asyncio.gather(*(one(image) for image in images))
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def main() -> None:
+    cli = argparse.ArgumentParser(description=__doc__)
+    cli.add_argument("images", nargs="*", type=Path)
+    cli.add_argument("--runs", type=int, default=5)
+    cli.add_argument("--concurrency", type=int, default=4)
+    options = cli.parse_args()
+    images = [path.read_bytes() for path in options.images] or [synthetic_photo()] * 8
+
+    variants = {
+        "raw": None,
+        "grayscale": Preprocess(),
+        "binarize": Preprocess(threshold=160),
+        "binarize+tiff": Preprocess(threshold=160, output_format="tiff"),
+    }
+    print(
+        f"{len(images)} images, {options.runs} runs, concurrency {options.concurrency}"
+    )
+    print(f"{'variant':<16}{'piped KiB':>12}{'median s':>12}{'images/s':>12}")
+    for name, preprocess in variants.items():
+        piped = sum(len(image) for image in images)
+        if preprocess is not None:
+            piped = sum([len((await preprocess.apply(i, 600))[0]) for i in images])
+        timings = await measure(images, options.runs, options.concurrency, preprocess)
+        median = statistics.median(timings)
+        print(
+            f"{name:<16}{piped / 1024:>12.0f}{median:>12.3f}{len(images) / median:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
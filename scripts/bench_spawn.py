@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""Measure per-call wrapper overhead of aiopytesseract against a no-op tesseract stub.
+
+The stub only drains stdin, so the difference between a bare
+`create_subprocess_exec` + `communicate` and `execute()` is what the
+wrapper itself costs per call (validation, argument building, spawning).
+
+    PYTHONPATH=. python scripts/bench_spawn.py [--calls 2000] [--concurrency 8] [--rounds 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from aiopytesseract import base_command
+from aiopytesseract.file_format import FileFormat
+
+IMAGE = b"P5\n1 1\n255\n\x00"
+STUB = "#!/bin/sh\nexec cat > /dev/null\n"
+
+
+async def raw(stub: str) -> None:
+    proc = await asyncio.create_subprocess_exec(
+        stub,
+        "stdin",
+        "stdout",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    await proc.communicate(IMAGE)
+
+
+async def wrapped(stub: str) -> None:
+    await base_command.execute(
+        IMAGE,
+        output_format=FileFormat.TXT,
+        dpi=300,
+        psm=3,
+        oem=3,
+        timeout=30,
+        lang="eng",
+    )
+
+
+async def measure(
+    func: Callable[[str], Awaitable[None]], stub: str, calls: int, concurrency: int
+) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await func(stub)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return latencies
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> float:
+    mean = statistics.fmean(latencies)
+    print(
+        f"{name:>8}: {len(latencies) / elapsed:8.0f} calls/s, "
+        f"mean {mean * 1e6:8.0f}us, median {statistics.median(latencies) * 1e6:8.0f}us"
+    )
+    return mean
+
+
+async def main() -> None:
+    cli = argparse.ArgumentParser(description=__doc__)
+    cli.add_argument("--calls", type=int, default=2000)
+    cli.add_argument("--concurrency", type=int, default=8)
+    cli.add_argument("--rounds", type=int, default=10)
+    options = cli.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        stub = Path(tmpdir) / "tesseract"
+        stub.write_text(STUB)
+        stub.chmod(0o755)
+        base_command.TESSERACT_CMD = str(stub)
+
+        variants = {"raw": raw, "execute": wrapped}
+        for func in variants.values():
+            await measure(func, str(stub), 50, options.concurrency)  # warm-up
+        # interleave rounds so drift in the host load hits both variants alike
+        latencies: dict[str, list[float]] = {name: [] for name in variants}
+        elapsed = dict.fromkeys(variants, 0.0)
+        for _ in range(options.rounds):
+            for name, func in variants.items():
+                started = time.perf_counter()
+                latencies[name] += await measure(
+                    func,
+                    str(stub),
+                    options.calls // options.rounds,
+                    options.concurrency,
+                )
+                elapsed[name] += time.perf_counter() - started
+        means = {
+            name: report(name, latencies[name], elapsed[name]) for name in variants
+        }
+        print(f"overhead: {(means['execute'] - means['raw']) * 1e6:.0f}us per call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
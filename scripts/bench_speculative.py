@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""Compare a combined language run with speculative single-language runs.
+
+For each image, `image_to_data` runs once with the combined language
+string (e.g. `eng+deu`) and once through `speculate`. Both report wall
+time and mean word confidence, and the speculative run reports each
+language's timing and outcome. A workload where speculation is as
+confident as the combined run, and faster, should use it.
+
+    PYTHONPATH=. python scripts/bench_speculative.py --lang eng deu [--repeat 3] [--patience 2] image ...
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+import aiopytesseract
+from aiopytesseract.speculative import mean_confidence, speculate
+
+
+async def main(args: argparse.Namespace) -> None:
+    combined = "+".join(args.lang)
+    for path in args.images:
+        image = Path(path).read_bytes()
+        combined_times, speculative_times = [], []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            data = await aiopytesseract.image_to_data(image, lang=combined)
+            combined_times.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            result = await speculate(
+                image, args.lang, confident=args.confident, patience=args.patience
+            )
+            speculative_times.append(time.perf_counter() - started)
+        conf, words = mean_confidence(data)
+        print(path)
+        print(
+            f"  {combined:<16} {statistics.median(combined_times):7.3f}s "
+            f"conf {conf:5.1f} ({words} words)"
+        )
+        print(
+            f"  {'speculative':<16} {statistics.median(speculative_times):7.3f}s "
+            f"conf {result.conf:5.1f}, winner {result.lang}"
+        )
+        for run in result.runs:
+            print(f"    {run}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("images", nargs="+")
+    parser.add_argument("--lang", nargs="+", default=["eng", "deu"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--confident", type=float, default=85)
+    parser.add_argument("--patience", type=float, default=None)
+    asyncio.run(main(parser.parse_args()))
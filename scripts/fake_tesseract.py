@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+"""Stand-in tesseract executable for scaling tests without real OCR.
+
+It answers the command lines aiopytesseract builds with realistic txt,
+tsv, hocr, alto, pdf, osd and makebox output for a synthetic page of the
+input image size, after a configurable latency. Failures, hangs (seen by
+the caller as timeouts) and their rates are configurable too.
+
+aiopytesseract passes only a few environment variables to tesseract, so
+the configuration is baked into a small wrapper script instead:
+
+    python scripts/fake_tesseract.py --install /tmp/fake/tesseract \\
+        --latency lognormal:0.2:0.5 --failure-rate 0.01 --timeout-rate 0.001
+    TESSERACT_CMD=/tmp/fake/tesseract python my_service.py
+
+Latency distributions (seconds): `0.2` (constant), `uniform:LOW:HIGH`,
+`exponential:MEAN` and `lognormal:MEDIAN:SIGMA`. While the `--hang-file`
+path exists every call hangs, so tests can stall the backend on demand.
+
+Only the standard library is imported, and the wrapper runs Python with
+`-S`, to keep the start-up cost of each fake process low.
+"""
+
+import os
+import random
+import stat
+import struct
+import sys
+import time
+from pathlib import Path
+
+# text, left, top, right, bottom, confidence
+Word = tuple[str, int, int, int, int, int]
+
+VERSION = (
+    "tesseract 5.3.0\n leptonica-1.82.0\n  libpng 1.6.39 : libjpeg 6b : zlib 1.2.13\n"
+)
+LANGUAGES = ("eng", "osd", "por")
+WORDS = (
+    "the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "invoice",
+    "total", "amount", "due", "date", "customer", "reference", "number",
+    "payment", "terms", "account", "balance", "order", "shipping", "address",
+    "description", "quantity", "unit", "price", "subtotal", "tax",
+)  # fmt: skip
+ERRORS = (
+    "Error in pixReadMem: Unknown format: no pix returned\n",
+    "Failed loading language 'eng'\n"
+    "Tesseract couldn't load any languages!\n"
+    "Could not initialize tesseract.\n",
+    "Error during processing.\n",
+)
+OPTIONS_WITH_VALUE = {
+    "--tessdata-dir",
+    "--user-words",
+    "--user-patterns",
+    "--dpi",
+    "--psm",
+    "--oem",
+    "-l",
+    "-c",
+}
+EXTENSIONS = {
+    "txt": ".txt",
+    "tsv": ".tsv",
+    "hocr": ".hocr",
+    "alto": ".xml",
+    "pdf": ".pdf",
+    "makebox": ".box",
+    "osd": ".osd",
+}
+ENVIRONMENT = {
+    "latency": "FAKE_TESSERACT_LATENCY",
+    "failure_rate": "FAKE_TESSERACT_FAILURE_RATE",
+    "timeout_rate": "FAKE_TESSERACT_TIMEOUT_RATE",
+    "hang_file": "FAKE_TESSERACT_HANG_FILE",
+    "words": "FAKE_TESSERACT_WORDS",
+}
+
+
+def latency(spec: str) -> float:
+    name, _, params = spec.partition(":")
+    if not params:
+        return float(name)
+    values = [float(value) for value in params.split(":")]
+    if name == "uniform":
+        return random.uniform(*values)  # noqa: S311
+    if name == "exponential":
+        return random.expovariate(1 / values[0])
+    if name == "lognormal":
+        median, sigma = values
+        return median * random.lognormvariate(0, sigma)
+    raise SystemExit(f"unknown latency distribution: {spec}")
+
+
+def hang() -> None:
+    # killed by the caller's timeout
+    while True:
+        time.sleep(3600)
+
+
+def image_size(image: bytes) -> tuple[int, int] | None:
+    if image.startswith(b"\x89PNG\r\n\x1a\n") and len(image) >= 24:
+        width, height = struct.unpack(">II", image[16:24])
+        return width, height
+    if image[:1] == b"P" and image[1:2] in b"123456":
+        fields = image.split(maxsplit=3)
+        if len(fields) >= 3 and fields[1].isdigit() and fields[2].isdigit():
+            return int(fields[1]), int(fields[2])
+    if image.startswith((b"\xff\xd8", b"II*\x00", b"MM\x00*", b"BM", b"GIF8")):
+        return 2480, 3508
+    if image.startswith(b"RIFF") and image[8:12] == b"WEBP":
+        return 2480, 3508
+    return None
+
+
+class Page:
+    """Synthetic page layout: one block of paragraphs of lines of words."""
+
+    def __init__(self, width: int, height: int, words: int) -> None:
+        self.width = width
+        self.height = height
+        scale = max(width / 2480, 0.05)
+        self.word_height = max(int(32 * scale), 1)
+        self.line_height = self.word_height + max(int(16 * scale), 1)
+        margin = int(200 * scale)
+        self.lines: list[list[Word]] = []
+        line: list[Word] = []
+        x, y = margin, margin
+        for index in range(words):
+            text = WORDS[index % len(WORDS)]
+            word_width = max(int(len(text) * 18 * scale), 1)
+            if line and x + word_width > width - margin:
+                self.lines.append(line)
+                x, y, line = margin, y + self.line_height, []
+            if y + self.word_height > height:
+                break
+            confidence = 90 + (index * 7) % 10
+            line.append((text, x, y, x + word_width, y + self.word_height, confidence))
+            x += word_width + int(20 * scale)
+        if line:
+            self.lines.append(line)
+
+    def paragraphs(self) -> list[list[list[Word]]]:
+        return [self.lines[index : index + 5] for index in range(0, len(self.lines), 5)]
+
+    @staticmethod
+    def bbox(words: list[Word]) -> tuple[int, ...]:
+        return (
+            min(word[1] for word in words),
+            min(word[2] for word in words),
+            max(word[3] for word in words),
+            max(word[4] for word in words),
+        )
+
+    def txt(self) -> str:
+        paragraphs = [
+            "\n".join(" ".join(word[0] for word in line) for line in paragraph)
+            for paragraph in self.paragraphs()
+        ]
+        return "\n\n".join(paragraphs) + "\n\f"
+
+    def tsv(self, page_num: int = 1) -> str:
+        # like tesseract, one header for every page of a list file
+        rows = [f"1\t{page_num}\t0\t0\t0\t0\t0\t0\t{self.width}\t{self.height}\t-1\t"]
+        if page_num == 1:
+            rows.insert(
+                0,
+                "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+                "left\ttop\twidth\theight\tconf\ttext",
+            )
+        if self.lines:
+            left, top, right, bottom = self.bbox([w for li in self.lines for w in li])
+            rows.append(
+                f"2\t{page_num}\t1\t0\t0\t0\t{left}\t{top}\t{right - left}\t{bottom - top}\t-1\t"
+            )
+        line_num = 0
+        for par_num, paragraph in enumerate(self.paragraphs(), 1):
+            left, top, right, bottom = self.bbox([w for li in paragraph for w in li])
+            rows.append(
+                f"3\t{page_num}\t1\t{par_num}\t0\t0\t{left}\t{top}\t{right - left}\t{bottom - top}\t-1\t"
+            )
+            for line in paragraph:
+                line_num += 1
+                left, top, right, bottom = self.bbox(line)
+                rows.append(
+                    f"4\t{page_num}\t1\t{par_num}\t{line_num}\t0\t{left}\t{top}\t{right - left}\t{bottom - top}\t-1\t"
+                )
+                for word_num, (text, x1, y1, x2, y2, conf) in enumerate(line, 1):
+                    rows.append(
+                        f"5\t{page_num}\t1\t{par_num}\t{line_num}\t{word_num}\t{x1}\t{y1}\t{x2 - x1}\t{y2 - y1}\t{conf}.000000\t{text}"
+                    )
+        return "\n".join(rows) + "\n"
+
+    def hocr(self, dpi: int) -> str:
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN"\n'
+            '    "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+            " <head>\n  <title></title>\n"
+            '  <meta http-equiv="Content-Type" content="text/html;charset=utf-8"/>\n'
+            "  <meta name='ocr-system' content='tesseract 5.3.0' />\n"
+            "  <meta name='ocr-capabilities' content='ocr_page ocr_carea ocr_par ocr_line ocrx_word ocrp_wconf'/>\n"
+            " </head>\n <body>\n"
+            f"  <div class='ocr_page' id='page_1' title='image \"stdin\"; bbox 0 0 {self.width} {self.height}; ppageno 0; scan_res {dpi} {dpi}'>\n"
+        ]
+        if self.lines:
+            bbox = " ".join(map(str, self.bbox([w for li in self.lines for w in li])))
+            parts.append(
+                f"   <div class='ocr_carea' id='block_1_1' title=\"bbox {bbox}\">\n"
+            )
+        line_num = word_num = 0
+        for par_num, paragraph in enumerate(self.paragraphs(), 1):
+            bbox = " ".join(map(str, self.bbox([w for li in paragraph for w in li])))
+            parts.append(
+                f"    <p class='ocr_par' id='par_1_{par_num}' lang='eng' title=\"bbox {bbox}\">\n"
+            )
+            for line in paragraph:
+                line_num += 1
+                bbox = " ".join(map(str, self.bbox(line)))
+                parts.append(
+                    f"     <span class='ocr_line' id='line_1_{line_num}' title=\"bbox {bbox}; "
+                    f'baseline 0 -8; x_size {self.word_height}; x_descenders 8; x_ascenders 8">\n'
+                )
+                for text, x1, y1, x2, y2, conf in line:
+                    word_num += 1
+                    parts.append(
+                        f"      <span class='ocrx_word' id='word_1_{word_num}' "
+                        f"title='bbox {x1} {y1} {x2} {y2}; x_wconf {conf}'>{text}</span>\n"
+                    )
+                parts.append("     </span>\n")
+            parts.append("    </p>\n")
+        if self.lines:
+            parts.append("   </div>\n")
+        parts.append("  </div>\n </body>\n</html>\n")
+        return "".join(parts)
+
+    def alto(self) -> str:
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#" '
+            'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+            "\t<Description>\n\t\t<MeasurementUnit>pixel</MeasurementUnit>\n"
+            "\t\t<sourceImageInformation>\n\t\t\t<fileName></fileName>\n"
+            "\t\t</sourceImageInformation>\n\t</Description>\n\t<Layout>\n"
+            f'\t\t<Page WIDTH="{self.width}" HEIGHT="{self.height}" PHYSICAL_IMG_NR="0" ID="page_0">\n'
+            f'\t\t\t<PrintSpace HPOS="0" VPOS="0" WIDTH="{self.width}" HEIGHT="{self.height}">\n'
+        ]
+        line_num = word_num = 0
+        for par_num, paragraph in enumerate(self.paragraphs(), 1):
+            x1, y1, x2, y2 = self.bbox([w for li in paragraph for w in li])
+            parts.append(
+                f'\t\t\t\t<TextBlock ID="block_{par_num}" HPOS="{x1}" VPOS="{y1}" '
+                f'WIDTH="{x2 - x1}" HEIGHT="{y2 - y1}">\n'
+            )
+            for line in paragraph:
+                line_num += 1
+                x1, y1, x2, y2 = self.bbox(line)
+                parts.append(
+                    f'\t\t\t\t\t<TextLine ID="line_{line_num}" HPOS="{x1}" VPOS="{y1}" '
+                    f'WIDTH="{x2 - x1}" HEIGHT="{y2 - y1}">\n'
+                )
+                for index, (text, x1, y1, x2, y2, conf) in enumerate(line):
+                    word_num += 1
+                    if index:
+                        parts.append("\t\t\t\t\t\t<SP/>\n")
+                    parts.append(
+                        f'\t\t\t\t\t\t<String ID="string_{word_num}" HPOS="{x1}" VPOS="{y1}" '
+                        f'WIDTH="{x2 - x1}" HEIGHT="{y2 - y1}" WC="{conf / 100:.2f}" '
+                        f'CONTENT="{text}"/>\n'
+                    )
+                parts.append("\t\t\t\t\t</TextLine>\n")
+            parts.append("\t\t\t\t</TextBlock>\n")
+        parts.append("\t\t\t</PrintSpace>\n\t\t</Page>\n\t</Layout>\n</alto>\n")
+        return "".join(parts)
+
+    def makebox(self) -> str:
+        # box coordinates have their origin at the bottom left corner
+        rows = []
+        for line in self.lines:
+            for text, x1, y1, x2, y2, _ in line:
+                step = max((x2 - x1) // len(text), 1)
+                for index, char in enumerate(text):
+                    left = x1 + index * step
+                    rows.append(
+                        f"{char} {left} {self.height - y2} {left + step} {self.height - y1} 0"
+                    )
+        return "\n".join(rows) + "\n"
+
+    def pdf(self) -> bytes:
+        text = " ".join(word[0] for line in self.lines for word in line)
+        stream = f"BT /F1 12 Tf 72 720 Td 3 Tr ({text}) Tj ET".encode()
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.width} {self.height}] "
+            "/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>".encode(),
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        ]
+        output = bytearray(b"%PDF-1.5\n")
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(len(output))
+            output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(output)
+        output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1,
+            xref,
+        )
+        return bytes(output)
+
+
+def osd() -> str:
+    return (
+        "Page number: 0\nOrientation in degrees: 0\nRotate: 0\n"
+        "Orientation confidence: 13.45\nScript: Latin\nScript confidence: 3.33\n"
+    )
+
+
+def render(page: Page, config: str, dpi: int, page_num: int = 1) -> bytes:
+    if config == "pdf":
+        return page.pdf()
+    if config == "tsv":
+        return page.tsv(page_num).encode()
+    if config == "hocr":
+        return page.hocr(dpi).encode()
+    if config == "alto":
+        return page.alto().encode()
+    if config == "makebox":
+        return page.makebox().encode()
+    return page.txt().encode()
+
+
+def fake(args: list[str]) -> int:
+    if "--version" in args:
+        sys.stdout.write(VERSION)
+        return 0
+    if "--list-langs" in args:
+        sys.stdout.write(
+            f'List of available languages in "/usr/share/tesseract-ocr/5/tessdata/" '
+            f"({len(LANGUAGES)}):\n" + "".join(f"{lang}\n" for lang in LANGUAGES)
+        )
+        return 0
+    if "--print-parameters" in args:
+        sys.stdout.write(
+            "Tesseract parameters:\n"
+            "tessedit_char_whitelist\t\tWhitelist of chars to recognize\n"
+            "tessedit_create_tsv\t0\tWrite .tsv output file\n"
+            "textord_debug_tabfind\t0\tDebug tab finding\n"
+        )
+        return 0
+    positional, options, index = [], {}, 0
+    while index < len(args):
+        if args[index] in OPTIONS_WITH_VALUE and index + 1 < len(args):
+            if args[index] == "-c":
+                name, _, value = args[index + 1].partition("=")
+                options[name] = value
+            else:
+                options[args[index]] = args[index + 1]
+            index += 2
+        else:
+            positional.append(args[index])
+            index += 1
+    if len(positional) < 2:
+        sys.stderr.write(
+            "Usage: tesseract imagename|imagelist|stdin outputbase|stdout\n"
+        )
+        return 1
+    source, output, *configs = positional
+    if options.get("tessedit_create_tsv") == "1":
+        configs.append("tsv")
+    configs = [config for config in configs if config != "batch.nochop"] or ["txt"]
+    images = []
+    if source == "stdin":
+        images.append(sys.stdin.buffer.read())
+    else:
+        try:
+            data = Path(source).read_bytes()
+        except OSError:
+            sys.stderr.write(f"Error, cannot read input file {source}: No such file\n")
+            return 1
+        if image_size(data) is None:
+            # a list file, one image path per line
+            try:
+                images += [Path(path).read_bytes() for path in data.decode().split()]
+            except (OSError, UnicodeDecodeError):
+                sys.stderr.write(ERRORS[0])
+                return 1
+        else:
+            images.append(data)
+
+    environ = os.environ
+    hang_file = environ.get(ENVIRONMENT["hang_file"])
+    if hang_file and Path(hang_file).exists():
+        hang()
+    if random.random() < float(environ.get(ENVIRONMENT["timeout_rate"], 0)):  # noqa: S311
+        hang()
+    time.sleep(latency(environ.get(ENVIRONMENT["latency"], "0")))
+    if random.random() < float(environ.get(ENVIRONMENT["failure_rate"], 0)):  # noqa: S311
+        sys.stderr.write(random.choice(ERRORS))  # noqa: S311
+        return 1
+
+    sizes = [image_size(image) for image in images]
+    if any(size is None for size in sizes):
+        sys.stderr.write(ERRORS[0])
+        return 1
+    dpi = int(options.get("--dpi", 300))
+    psm = options.get("--psm", "3")
+    words = int(environ.get(ENVIRONMENT["words"], 120))
+    if psm == "0":
+        sys.stdout.write(osd())
+        return 0
+    if psm == "2":
+        sys.stderr.write("Deskew angle: 0.0123\n")
+        return 0
+    pages = [Page(width, height, words) for width, height in sizes]  # type: ignore[misc]
+    for config in configs:
+        content = b"".join(
+            render(page, config, dpi, page_num)
+            for page_num, page in enumerate(pages, 1)
+        )
+        if output == "stdout":
+            sys.stdout.buffer.write(content)
+        else:
+            Path(f"{output}{EXTENSIONS.get(config, '.txt')}").write_bytes(content)
+    return 0
+
+
+def install(argv: list[str]) -> None:
+    import argparse
+    import shlex
+
+    parser = argparse.ArgumentParser(description="install a configured fake tesseract")
+    parser.add_argument("--install", required=True, metavar="PATH")
+    parser.add_argument("--latency", default="0", help="e.g. 0.2, lognormal:0.2:0.5")
+    parser.add_argument("--failure-rate", type=float, default=0)
+    parser.add_argument("--timeout-rate", type=float, default=0)
+    parser.add_argument("--hang-file", default=None)
+    parser.add_argument("--words", type=int, default=120)
+    args = parser.parse_args(argv)
+    latency(args.latency)  # fail early on a bad spec
+    lines = ["#!/bin/sh"]
+    for name, variable in ENVIRONMENT.items():
+        value = getattr(args, name)
+        if value is not None:
+            lines.append(f"export {variable}={shlex.quote(str(value))}")
+    script = shlex.quote(str(Path(__file__).resolve()))
+    lines.append(f'exec {shlex.quote(sys.executable)} -S {script} "$@"')
+    wrapper = Path(args.install)
+    wrapper.parent.mkdir(parents=True, exist_ok=True)
+    wrapper.write_text("\n".join(lines) + "\n")
+    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] and sys.argv[1].startswith("--install"):
+        install(sys.argv[1:])
+    else:
+        sys.exit(fake(sys.argv[1:]))
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+"""Drive aiopytesseract at increasing concurrency and report how it scales.
+
+Requests go through the public API. Unless `TESSERACT_CMD` is set, they
+run against a stand-in tesseract from scripts/fake_tesseract.py,
+installed in a temporary directory with the given latency, failure and
+timeout settings. Each concurrency level reports throughput, latency
+percentiles, outcomes and the peak number of open fds and child
+processes. `--csv` writes the same rows out for charting.
+
+    PYTHONPATH=. python scripts/loadgen.py [--concurrency 1 8 64 256] [--duration 10]
+        [--rate 1000] [--command string] [--latency lognormal:0.05:0.5]
+        [--failure-rate 0.01] [--timeout-rate 0.001] [--timeout 2] [--csv out.csv]
+
+Without `--rate` every worker sends its next request as soon as the last
+one finishes (closed loop). With `--rate` requests arrive at that rate
+regardless (open loop) and wait for one of the `concurrency` slots, so the
+latency includes the queueing delay.
+
+Every fake call starts a Python interpreter, tens of milliseconds of CPU,
+so the cores of the load generator host bound the rate it can reach.
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from pathlib import Path
+
+import aiopytesseract
+from aiopytesseract import base_command
+from aiopytesseract.exceptions import TesseractRuntimeError, TesseractTimeoutError
+
+SAMPLE = Path(__file__).parent.parent / "tests/samples/file-sample_150kB.png"
+FIELDS = (
+    "concurrency",
+    "requests",
+    "throughput",
+    "p50",
+    "p95",
+    "p99",
+    "max",
+    "ok",
+    "failed",
+    "timeout",
+    "peak_fds",
+    "peak_children",
+)
+Command = Callable[[bytes, float], Awaitable[object]]
+COMMANDS: dict[str, Command] = {
+    "string": lambda image, timeout: aiopytesseract.image_to_string(
+        image, timeout=timeout
+    ),
+    "data": lambda image, timeout: aiopytesseract.image_to_data(image, timeout=timeout),
+    "hocr": lambda image, timeout: aiopytesseract.image_to_hocr(image, timeout=timeout),
+    "boxes": lambda image, timeout: aiopytesseract.image_to_boxes(
+        image, timeout=timeout
+    ),
+    "osd": lambda image, timeout: aiopytesseract.image_to_osd(image, timeout=timeout),
+}
+
+
+def open_fds() -> int:
+    return sum(1 for _ in Path("/proc/self/fd").iterdir())
+
+
+def children() -> int:
+    # direct children of every thread, Linux only
+    count = 0
+    for task in Path("/proc/self/task").iterdir():
+        with suppress(FileNotFoundError):  # thread exited meanwhile
+            count += len((task / "children").read_text().split())
+    return count
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+async def monitor(stop: asyncio.Event, peaks: dict[str, int]) -> None:
+    while not stop.is_set():
+        peaks["fds"] = max(peaks["fds"], open_fds())
+        peaks["children"] = max(peaks["children"], children())
+        await asyncio.sleep(0.05)
+
+
+async def level(
+    command: Command,
+    image: bytes,
+    concurrency: int,
+    duration: float,
+    rate: float | None,
+    timeout: float,
+) -> dict[str, float]:
+    latencies: list[float] = []
+    outcomes: Counter[str] = Counter()
+    peaks = {"fds": 0, "children": 0}
+    slots = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+
+    async def request(arrival: float) -> None:
+        async with slots:
+            try:
+                await command(image, timeout)
+            except TesseractTimeoutError:
+                outcomes["timeout"] += 1
+            except TesseractRuntimeError:
+                outcomes["failed"] += 1
+            else:
+                outcomes["ok"] += 1
+        latencies.append(loop.time() - arrival)
+
+    async def worker() -> None:
+        while loop.time() < deadline:
+            await request(loop.time())
+
+    stop = asyncio.Event()
+    monitoring = asyncio.create_task(monitor(stop, peaks))
+    started = loop.time()
+    if rate is None:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    else:
+        requests = []
+        sent = 0
+        while (now := loop.time()) < deadline:
+            due = int((now - started) * rate)
+            requests += [asyncio.create_task(request(now)) for _ in range(due - sent)]
+            sent = due
+            await asyncio.sleep(0.001)
+        await asyncio.gather(*requests)
+    elapsed = loop.time() - started
+    stop.set()
+    await monitoring
+    latencies.sort()
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "max": latencies[-1],
+        "ok": outcomes["ok"],
+        "failed": outcomes["failed"],
+        "timeout": outcomes["timeout"],
+        "peak_fds": peaks["fds"],
+        "peak_children": peaks["children"],
+    }
+
+
+def install_fake(directory: str, args: argparse.Namespace) -> str:
+    path = str(Path(directory) / "tesseract")
+    options = [
+        f"--latency={args.latency}",
+        f"--failure-rate={args.failure_rate}",
+        f"--timeout-rate={args.timeout_rate}",
+    ]
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            str(Path(__file__).parent / "fake_tesseract.py"),
+            f"--install={path}",
+            *options,
+        ],
+        check=True,
+    )
+    return path
+
+
+async def main(args: argparse.Namespace) -> None:
+    image = Path(args.image).read_bytes()
+    command = COMMANDS[args.command]
+    print(f"tesseract: {base_command.TESSERACT_CMD}, command: {args.command}")
+    print(
+        f"{'conc':>5} {'reqs':>7} {'req/s':>8} {'p50':>7} {'p95':>7} {'p99':>7} "
+        f"{'max':>7} {'ok':>7} {'failed':>6} {'timeout':>7} {'fds':>5} {'procs':>5}"
+    )
+    rows = []
+    for concurrency in args.concurrency:
+        row = await level(
+            command, image, concurrency, args.duration, args.rate, args.timeout
+        )
+        rows.append(row)
+        print(
+            f"{row['concurrency']:>5} {row['requests']:>7} {row['throughput']:>8.1f} "
+            f"{row['p50']:>7.3f} {row['p95']:>7.3f} {row['p99']:>7.3f} "
+            f"{row['max']:>7.3f} {row['ok']:>7} {row['failed']:>6} "
+            f"{row['timeout']:>7} {row['peak_fds']:>5} {row['peak_children']:>5}"
+        )
+    if args.csv:
+        with Path(args.csv).open("w", newline="") as output:
+            writer = csv.DictWriter(output, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16, 64, 256]
+    )
+    parser.add_argument("--duration", type=float, default=10, help="seconds per level")
+    parser.add_argument("--rate", type=float, default=None, help="requests per second")
+    parser.add_argument("--command", choices=sorted(COMMANDS), default="string")
+    parser.add_argument("--image", default=str(SAMPLE))
+    parser.add_argument("--timeout", type=float, default=5)
+    parser.add_argument("--latency", default="lognormal:0.05:0.5")
+    parser.add_argument("--failure-rate", type=float, default=0)
+    parser.add_argument("--timeout-rate", type=float, default=0)
+    parser.add_argument("--csv", default=None)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory(prefix="aiopytesseract-loadgen-") as directory:
+        if "TESSERACT_CMD" not in os.environ:
+            base_command.TESSERACT_CMD = install_fake(directory, args)
+        asyncio.run(main(args))
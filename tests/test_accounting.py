@@ -0,0 +1,148 @@
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import accounting, base_command
+from aiopytesseract.accounting import UsageTracker, accounted, current_usage_collector
+from aiopytesseract.exceptions import TesseractTimeoutError
+from aiopytesseract.models import Accounted, Usage, UsageStats
+from aiopytesseract.profile import OCRProfile
+
+IMAGE = Path("tests/samples/file-sample_150kB.png").read_bytes()
+FAKE_TESSERACT = Path("scripts/fake_tesseract.py")
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "wait4"), reason="needs os.wait4")
+
+
+@pytest.fixture
+def fake_tesseract(tmp_path, monkeypatch):
+    def install(*options):
+        path = tmp_path / "tesseract"
+        subprocess.run(  # noqa: S603
+            [sys.executable, str(FAKE_TESSERACT), f"--install={path}", *options],
+            check=True,
+        )
+        monkeypatch.setattr(base_command, "TESSERACT_CMD", str(path))
+        return path
+
+    return install
+
+
+def test_usage_total():
+    total = Usage.total([Usage(0.1, 0.2, 100, 1.0, 1), Usage(0.3, 0.1, 300, 0.5, 1)])
+    assert total == Usage(pytest.approx(0.4), pytest.approx(0.3), 300, 1.5, 2)
+    assert total.cpu == pytest.approx(0.7)
+    assert Usage.total([]) == Usage()
+
+
+def test_usage_stats_add():
+    stats = (
+        UsageStats().add(Usage(0.1, 0.1, 100, 1.0, 1)).add(Usage(0.2, 0.0, 50, 1.0, 1))
+    )
+    assert stats.calls == 2
+    assert stats.max_rss == 100
+    assert stats.cpu_per_call == pytest.approx(0.2)
+    assert UsageStats().cpu_per_call == 0
+
+
+async def test_accounted(fake_tesseract):
+    fake_tesseract("--latency=0.1")
+    result = await accounted(aiopytesseract.image_to_string, IMAGE)
+    assert isinstance(result, Accounted)
+    assert result.result.split()[:2] == ["the", "quick"]
+    assert result.usage.processes == 1
+    assert result.usage.cpu > 0
+    assert result.usage.max_rss > 1024**2
+    assert result.usage.wall >= 0.1
+    assert current_usage_collector() is None
+
+
+async def test_not_accounted_by_default(fake_tesseract, monkeypatch):
+    fake_tesseract()
+
+    async def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(base_command, "spawn_accounted", fail)
+    assert await aiopytesseract.image_to_string(IMAGE)
+
+
+async def test_accounted_stream(fake_tesseract):
+    fake_tesseract("--words=20")
+    lines = await accounted(_alto_lines, IMAGE)
+    assert lines.result
+    assert lines.usage.processes == 1
+
+
+async def _alto_lines(image):
+    return [line async for line in aiopytesseract.image_to_alto_lines(image)]
+
+
+async def test_accounted_timeout_reaps_process(fake_tesseract):
+    fake_tesseract("--timeout-rate=1")
+    collectors = []
+
+    async def ocr(image):
+        collectors.append(current_usage_collector())
+        return await aiopytesseract.image_to_string(image, timeout=0.5)
+
+    with pytest.raises(TesseractTimeoutError):
+        await accounted(ocr, IMAGE)
+    # the killed process is reaped, and accounted for, after the timeout
+    await asyncio.sleep(0.2)
+    (collected,) = collectors
+    assert len(collected) == 1
+    assert collected[0].wall < 5
+
+
+async def test_usage_tracker(fake_tesseract):
+    fake_tesseract()
+    tracker = UsageTracker()
+    await tracker.run(aiopytesseract.image_to_string, IMAGE)
+    await tracker.run(aiopytesseract.image_to_string, IMAGE, psm=6)
+    # positional arguments select the key as well
+    await tracker.run(aiopytesseract.image_to_string, IMAGE, 300, "eng", 6)
+    await tracker.run(
+        aiopytesseract.image_to_data, IMAGE, profile=OCRProfile(lang="eng", psm=4)
+    )
+    stats = tracker.stats
+    assert set(stats) == {
+        ("image_to_string", "eng", 3, 3),
+        ("image_to_string", "eng", 6, 3),
+        ("image_to_data", "eng", 4, 3),
+    }
+    assert stats["image_to_string", "eng", 6, 3].calls == 2
+    assert stats["image_to_string", "eng", 6, 3].cpu > 0
+    tracker.reset()
+    assert tracker.stats == {}
+
+
+async def test_spawn_failure_kills_process(monkeypatch):
+    popens = []
+    popen = subprocess.Popen
+
+    def recording(*args, **kwargs):
+        popens.append(popen(*args, **kwargs))
+        return popens[-1]
+
+    async def connect_write_pipe(*args):
+        raise OSError("no pipe")
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(accounting.subprocess, "Popen", recording)
+    monkeypatch.setattr(loop, "connect_write_pipe", connect_write_pipe)
+    argv = [sys.executable, "-c", "import time; time.sleep(10)"]
+    with pytest.raises(OSError, match="no pipe"):
+        await accounting.spawn_accounted(argv, dict(os.environ), [])
+    (process,) = popens
+    for _ in range(100):
+        if process.returncode is not None:
+            break
+        await asyncio.sleep(0.01)
+    assert process.returncode == -signal.SIGKILL
@@ -1,6 +1,10 @@
+import os
+import shutil
+
 import pytest
 
 import aiopytesseract
+from aiopytesseract.exceptions import TesseractNotFoundError
 
 
 @pytest.mark.parametrize("input_data", [[], {}, (), None])
@@ -97,3 +101,37 @@ async def test_execute_unsupported(input_data):
 async def test_build_cmd_args_with_user_patterns(args, expected):
     command = await aiopytesseract.base_command._build_cmd_args(*args)
     assert command == expected
+
+
+async def test_binary_not_found(monkeypatch):
+    monkeypatch.setattr(
+        aiopytesseract.base_command, "TESSERACT_CMD", "tesseract-does-not-exist"
+    )
+    with pytest.raises(TesseractNotFoundError):
+        await aiopytesseract.base_command.spawn(["--version"], 1)
+
+
+def test_binary_resolved_once(monkeypatch):
+    aiopytesseract.base_command._which.cache_clear()
+    calls = []
+
+    def which(cmd):
+        calls.append(cmd)
+        return f"/opt/bin/{cmd}"
+
+    monkeypatch.setattr(shutil, "which", which)
+    assert aiopytesseract.base_command._which("tesseract") == "/opt/bin/tesseract"
+    assert aiopytesseract.base_command._which("tesseract") == "/opt/bin/tesseract"
+    assert calls == ["tesseract"]
+    aiopytesseract.base_command._which.cache_clear()
+
+
+def test_trimmed_environment(monkeypatch):
+    monkeypatch.setenv("TESSDATA_PREFIX", "/tessdata")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    monkeypatch.setenv("DYLD_LIBRARY_PATH", "/opt/homebrew/lib")
+    env = aiopytesseract.base_command._environment()
+    assert env["TESSDATA_PREFIX"] == "/tessdata"
+    assert env["DYLD_LIBRARY_PATH"] == "/opt/homebrew/lib"
+    assert env["PATH"] == os.environ["PATH"]
+    assert "AWS_SECRET_ACCESS_KEY" not in env
@@ -0,0 +1,152 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from aiopytesseract import base_command, cascade
+from aiopytesseract.cascade import Cascade
+from aiopytesseract.exceptions import PSMInvalidException
+from aiopytesseract.models import CascadeResult, Data, Tier
+from aiopytesseract.preprocessing import Preprocess
+
+pytest.importorskip("PIL")
+
+IMAGE = Path("tests/samples/file-sample_150kB.png").read_bytes()
+FAST = Tier("fast", tessdata_dir="tests/samples/tessdata_fast", oem=1, psm=6)
+BEST = Tier("best")
+
+
+def word(line, number, conf, text="word"):
+    return Data(5, 1, 1, 1, line, number, 100 * number, 40 * line, 80, 30, conf, text)
+
+
+@pytest.fixture
+def recognized(monkeypatch):
+    calls = []
+
+    def install(page_confs, line_confs=None):
+        async def recognize(source, image, profile, timeout, encoding):
+            calls.append((source, profile))
+            if source == "stdin":
+                return [
+                    word(line, number, conf)
+                    for line, line_conf in enumerate(
+                        page_confs[profile.tessdata_dir], 1
+                    )
+                    for number, conf in enumerate(line_conf, 1)
+                ]
+            crops = Path(source).read_text().split()
+            return [
+                Data(
+                    5,
+                    page,
+                    1,
+                    1,
+                    1,
+                    1,
+                    2,
+                    3,
+                    50,
+                    20,
+                    line_confs[profile.tessdata_dir],
+                    "retry",
+                )
+                for page in range(1, len(crops) + 1)
+            ]
+
+        monkeypatch.setattr(cascade, "_recognize", recognize)
+        return calls
+
+    return install
+
+
+async def test_confident_page_stays_on_first_tier(recognized):
+    calls = recognized({FAST.tessdata_dir: [[90, 80], [95]]})
+    result = await Cascade([FAST, BEST]).run(IMAGE)
+    assert isinstance(result, CascadeResult)
+    assert result.tiers == {"fast": 2}
+    assert result.text == "word word\nword"
+    assert len(calls) == 1
+    assert calls[0][1].psm == 6
+    assert calls[0][1].oem == 1
+
+
+async def test_escalates_only_failing_lines(recognized):
+    calls = recognized(
+        {FAST.tessdata_dir: [[90, 80], [30, 40], [50]]},
+        {None: 88},
+    )
+    result = await Cascade([FAST, BEST], threshold=70).run(IMAGE)
+    assert [line.tier.name for line in result.lines] == ["fast", "best", "best"]
+    assert [line.text for line in result.lines] == ["word word", "retry", "retry"]
+    source, profile = calls[1]
+    assert source != "stdin"
+    assert profile.psm == 7
+    # crop coordinates are moved back to the page, line numbers kept
+    retried = result.lines[1].words[0]
+    assert retried.line_num == 2
+    assert (retried.left, retried.top) == (100 - 4 + 2, 80 - 4 + 3)
+
+
+async def test_keeps_the_more_confident_line(recognized):
+    recognized({FAST.tessdata_dir: [[60]]}, {None: 40})
+    result = await Cascade([FAST, BEST]).run(IMAGE)
+    assert result.tiers == {"fast": 1}
+
+
+async def test_page_escalation(recognized):
+    calls = recognized(
+        {FAST.tessdata_dir: [[90], [30]], None: [[80], [85]]},
+    )
+    result = await Cascade([FAST, BEST], escalate="page").run(IMAGE)
+    assert result.tiers == {"best": 2}
+    assert result.conf == 82.5
+    assert [source for source, _ in calls] == ["stdin", "stdin"]
+    result = await Cascade([FAST, BEST], threshold=50, escalate="page").run(IMAGE)
+    assert result.tiers == {"fast": 2}
+
+
+async def test_page_without_words_is_retried(recognized):
+    calls = recognized({FAST.tessdata_dir: [], None: [[80, 90]]})
+    result = await Cascade([FAST, BEST]).run(IMAGE)
+    assert result.tiers == {"best": 1}
+    assert [source for source, _ in calls] == ["stdin", "stdin"]
+    assert calls[1][1].psm == 3
+
+
+@pytest.mark.parametrize(
+    "tiers, kwargs, exception",
+    [
+        ([], {}, ValueError),
+        ([FAST], {"escalate": "word"}, ValueError),
+        ([FAST], {"padding": -1}, ValueError),
+        ([Tier("x", preprocess=Preprocess())], {}, ValueError),
+    ],
+)
+def test_invalid(tiers, kwargs, exception):
+    with pytest.raises(exception):
+        Cascade(tiers, **kwargs)
+
+
+async def test_invalid_tier_option():
+    with pytest.raises(PSMInvalidException):
+        await Cascade([Tier("bad", psm=99)]).run(IMAGE)
+
+
+async def test_cascade_with_fake_tesseract(tmp_path, monkeypatch):
+    path = tmp_path / "tesseract"
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "scripts/fake_tesseract.py",
+            f"--install={path}",
+            "--words=12",
+        ],
+        check=True,
+    )
+    monkeypatch.setattr(base_command, "TESSERACT_CMD", str(path))
+    first = await Cascade([Tier("only")]).run(IMAGE)
+    result = await Cascade([Tier("fast"), Tier("best")], threshold=99.5).run(IMAGE)
+    assert result.text == first.text
+    assert [line.bbox for line in result.lines] == [line.bbox for line in first.lines]
@@ -0,0 +1,141 @@
+import io
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from aiopytesseract import cli
+
+SAMPLE = Path("tests/samples/file-sample_150kB.png")
+
+
+@pytest.fixture
+def images(tmp_path):
+    for name in ("a/1.png", "a/b/2.PNG", "c/3.jpg", "c/notes.txt"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(SAMPLE, path)
+    return tmp_path
+
+
+async def _scan(*targets):
+    return [path async for path in cli.scan(targets)]
+
+
+async def test_scan_directory(images):
+    paths = await _scan(str(images))
+    assert [p.relative_to(images).as_posix() for p in paths] == [
+        "a/1.png",
+        "a/b/2.PNG",
+        "c/3.jpg",
+    ]
+
+
+async def test_scan_glob_and_file(images):
+    paths = await _scan(f"{images}/**/*.png", str(images / "c/3.jpg"))
+    assert [p.relative_to(images).as_posix() for p in paths] == [
+        "a/1.png",
+        "c/3.jpg",
+    ]
+
+
+async def test_scan_symlink_loop(images):
+    (images / "a/b/loop").symlink_to(images / "a")
+    paths = await _scan(str(images / "a"))
+    assert [p.relative_to(images).as_posix() for p in paths] == [
+        "a/1.png",
+        "a/b/2.PNG",
+    ]
+
+
+def test_manifest_resume(tmp_path):
+    manifest_file = tmp_path / "manifest.txt"
+    manifest = cli.Manifest(manifest_file)
+    manifest.add(tmp_path / "done.png")
+    manifest.close()
+
+    manifest = cli.Manifest(manifest_file)
+    assert tmp_path / "done.png" in manifest
+    assert tmp_path / "todo.png" not in manifest
+    manifest.close()
+
+
+def test_progress_status():
+    progress = cli.Progress(None)
+    progress.found = 10
+    progress.done = 4
+    assert progress.status().startswith("4/10 done, 0 skipped, 0 failed")
+    assert progress.status().endswith("scanning")
+    progress.scanning = False
+    assert "ETA" in progress.status()
+
+
+def test_parser_defaults():
+    options = cli.parser().parse_args(["images/"])
+    assert options.paths == ["images/"]
+    assert options.format == "txt"
+    assert options.manifest is None
+    assert options.concurrency >= 1
+
+
+async def test_batch_jsonl_with_manifest(images, tmp_path, monkeypatch):
+    calls = []
+
+    async def recognize(path, options):
+        calls.append(path)
+        return f"text of {path.name}"
+
+    monkeypatch.setattr(cli, "_recognize", recognize)
+    output = tmp_path / "out.jsonl"
+    argv = [str(images), "-f", "jsonl", "-o", str(output), "-m", str(tmp_path / "m")]
+
+    progress = await cli.batch(cli.parser().parse_args(argv), None)
+    assert progress.done == 3
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(line["text"] for line in lines) == [
+        "text of 1.png",
+        "text of 2.PNG",
+        "text of 3.jpg",
+    ]
+
+    stream = io.StringIO()
+    progress = await cli.batch(cli.parser().parse_args(argv), stream)
+    assert progress.done == 0
+    assert progress.skipped == 3
+    assert len(calls) == 3
+    assert "0/0 done, 3 skipped" in stream.getvalue()
+
+
+async def test_batch_txt_sidecars(images):
+    options = cli.parser().parse_args([str(images / "a"), "-j", "2"])
+    progress = await cli.batch(options, None)
+    assert progress.done == 2
+    assert progress.failed == 0
+    assert len((images / "a/1.png.txt").read_text()) > 0
+    assert (images / "a/b/2.PNG.txt").exists()
+
+
+async def test_batch_unwritable_sidecar_fails_file(images, monkeypatch):
+    async def recognize(path, options):
+        return f"text of {path.name}"
+
+    monkeypatch.setattr(cli, "_recognize", recognize)
+    # a directory in the way of the sidecar makes writing it fail
+    (images / "a/1.png.txt").mkdir()
+    options = cli.parser().parse_args([str(images / "a")])
+    progress = await cli.batch(options, None)
+    assert progress.failed == 1
+    assert progress.done == 1
+    assert (images / "a/b/2.PNG.txt").read_text() == "text of 2.PNG"
+
+
+def test_main_reports_failures(tmp_path):
+    broken = tmp_path / "broken.png"
+    broken.write_bytes(b"")
+    assert cli.main([str(broken), "-q"]) == 1
+
+
+def test_main_rejects_prefetch():
+    with pytest.raises(SystemExit):
+        cli.main(["images", "--prefetch", "0"])
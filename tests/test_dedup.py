@@ -0,0 +1,142 @@
+import io
+import random
+
+import pytest
+
+from aiopytesseract.dedup import FrameDeduplicator, dhash
+from aiopytesseract.exceptions import InvalidImageError
+
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+
+def frame(text, noise=0, seed=0, quality=80):
+    img = Image.new("L", (320, 120), 255)
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((20, 20, 140, 100), fill=0)
+    draw.text((180, 50), text, fill=0)
+    if text == "other":
+        draw.rectangle((160, 10, 300, 110), fill=0)
+    if noise:
+        # sensor / encoder noise: every pixel off by a few levels
+        rng = random.Random(seed)  # noqa: S311
+        noisy = bytes(
+            min(max(value + rng.randint(-noise, noise), 0), 255)
+            for value in img.tobytes()
+        )
+        img = Image.frombytes("L", img.size, noisy)
+    output = io.BytesIO()
+    img.save(output, format="JPEG", quality=quality)
+    return output.getvalue()
+
+
+def page(last_line):
+    img = Image.new("L", (640, 360), 255)
+    draw = ImageDraw.Draw(img)
+    for line in range(15):
+        draw.text(
+            (40, 10 + line * 22), f"Item {line:02d} ........ {line * 13.37:.2f}", fill=0
+        )
+    draw.text((40, 340), last_line, fill=0)
+    output = io.BytesIO()
+    img.save(output, format="JPEG", quality=80)
+    return output.getvalue()
+
+
+class FakeOCR:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, image, lang="eng"):
+        self.calls += 1
+        if not image.startswith((b"\xff\xd8", b"\x89PNG")):
+            raise InvalidImageError("unknown image format")
+        return f"result {self.calls} {lang}"
+
+
+def test_dhash_stable_under_noise():
+    original = dhash(frame("hello"))
+    assert (
+        original ^ dhash(frame("hello", noise=8, seed=1, quality=60))
+    ).bit_count() <= 4
+    assert (original ^ dhash(frame("other"))).bit_count() > 4
+    assert dhash(frame("hello"), size=16).bit_length() <= 256
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"threshold": -1},
+        {"window": 0},
+        {"pixel_threshold": -1},
+        {"thumbnail_width": 0},
+    ],
+)
+def test_invalid_options(kwargs):
+    with pytest.raises(ValueError):
+        FrameDeduplicator(**kwargs)
+
+
+async def test_skips_near_duplicates():
+    ocr = FakeOCR()
+    dedup = FrameDeduplicator()
+    assert await dedup.run("cam", ocr, frame("hello")) == "result 1 eng"
+    for seed in range(3):
+        assert (
+            await dedup.run(
+                "cam", ocr, frame("hello", noise=8, seed=seed, quality=70 + seed)
+            )
+            == "result 1 eng"
+        )
+    assert await dedup.run("cam", ocr, frame("other")) == "result 2 eng"
+    assert ocr.calls == 2
+    assert dedup.calls["cam"] == 5
+    assert dedup.skipped["cam"] == 3
+
+
+async def test_changed_text_line_is_not_skipped():
+    before, after = page("Total: 1,234.56"), page("Total: 9,876.00")
+    # the coarse hash cannot see the change, the thumbnail check must
+    assert dhash(before) == dhash(after)
+    ocr = FakeOCR()
+    dedup = FrameDeduplicator()
+    assert await dedup.run("cam", ocr, before) == "result 1 eng"
+    assert await dedup.run("cam", ocr, after) == "result 2 eng"
+    assert ocr.calls == 2
+    assert dedup.skipped["cam"] == 0
+
+
+async def test_keyed_per_stream_and_options():
+    ocr = FakeOCR()
+    dedup = FrameDeduplicator()
+    image = frame("hello")
+    await dedup.run("cam-1", ocr, image)
+    await dedup.run("cam-2", ocr, image)
+    await dedup.run("cam-1", ocr, image, lang="por")
+    assert ocr.calls == 3
+    assert sum(dedup.skipped.values()) == 0
+
+
+async def test_bounded_window():
+    ocr = FakeOCR()
+    dedup = FrameDeduplicator(window=1)
+    await dedup.run("cam", ocr, frame("hello"))
+    await dedup.run("cam", ocr, frame("other"))
+    await dedup.run("cam", ocr, frame("hello"))
+    assert ocr.calls == 3
+
+
+async def test_undecodable_frame_runs_command():
+    dedup = FrameDeduplicator()
+    with pytest.raises(InvalidImageError):
+        await dedup.run("cam", FakeOCR(), b"not an image")
+
+
+async def test_forget():
+    dedup = FrameDeduplicator()
+    ocr = FakeOCR()
+    await dedup.run("cam", ocr, frame("hello"))
+    dedup.forget("cam")
+    assert dedup.calls["cam"] == 0
+    await dedup.run("cam", ocr, frame("hello"))
+    assert ocr.calls == 2
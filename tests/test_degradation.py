@@ -0,0 +1,136 @@
+import asyncio
+
+import pytest
+
+from aiopytesseract.degradation import DegradationPolicy
+from aiopytesseract.models import Tier, TieredResult
+from aiopytesseract.preprocessing import Preprocess
+from aiopytesseract.profile import OCRProfile
+from aiopytesseract.scheduler import Scheduler
+
+IMAGE = b"P5\n4 4\n255\n" + b"\x00" * 16
+TIERS = (
+    Tier("best"),
+    Tier("fast", tessdata_dir="tests/samples/tessdata_fast", oem=1),
+    Tier("draft", tessdata_dir="tests/samples/tessdata_fast", oem=1, dpi=150),
+)
+
+
+class FakeScheduler:
+    concurrency = 2
+    queued = 0
+
+
+async def command(image, dpi=300, oem=3, tessdata_dir=None, timeout=30):
+    await asyncio.sleep(0)
+    return {"dpi": dpi, "oem": oem, "tessdata_dir": tessdata_dir}
+
+
+async def boxes(image, tessdata_dir=None, timeout=30):
+    return {"tessdata_dir": tessdata_dir}
+
+
+@pytest.fixture
+def scheduler():
+    return FakeScheduler()
+
+
+def test_tier_options():
+    assert Tier("best").options() == {}
+    preprocess = Preprocess(target_dpi=150)
+    assert Tier("small", dpi=150, preprocess=preprocess).options() == {
+        "dpi": 150,
+        "preprocess": preprocess,
+    }
+    assert str(TieredResult("text", TIERS[1])) == "text (fast)"
+
+
+@pytest.mark.parametrize("kwargs", [{"tiers": ()}, {"recover_ratio": 1}, {"alpha": 0}])
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        DegradationPolicy(**{"tiers": TIERS, **kwargs})
+
+
+def test_default_max_queued():
+    assert DegradationPolicy(TIERS, Scheduler(concurrency=3)).max_queued == 6
+
+
+def test_queue_depth_hysteresis(scheduler):
+    policy = DegradationPolicy(TIERS, scheduler, max_queued=4, hold=0)
+    assert policy.select().name == "best"
+    scheduler.queued = 5
+    assert policy.select().name == "fast"
+    assert policy.select().name == "draft"
+    assert policy.select().name == "draft"  # cheapest tier already
+    scheduler.queued = 3  # below the threshold, above the recovery level
+    assert policy.select().name == "draft"
+    scheduler.queued = 2
+    assert policy.select().name == "fast"
+    assert policy.select().name == "best"
+
+
+def test_latency_slo(scheduler):
+    policy = DegradationPolicy(TIERS, scheduler, latency_slo=2, hold=0, alpha=1)
+    policy.observe(3)
+    assert policy.select().name == "fast"
+    policy.observe(1.5)
+    assert policy.select().name == "fast"
+    policy.observe(0.5)
+    assert policy.select().name == "best"
+
+
+def test_hold(scheduler, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("aiopytesseract.degradation.time.monotonic", lambda: now[0])
+    policy = DegradationPolicy(TIERS, scheduler, max_queued=0, hold=5)
+    scheduler.queued = 1
+    assert policy.select().name == "fast"
+    now[0] += 4
+    assert policy.select().name == "fast"
+    now[0] += 1
+    assert policy.select().name == "draft"
+
+
+async def test_run_applies_tier():
+    policy = DegradationPolicy(TIERS[1:], Scheduler(concurrency=1))
+    result = await policy.run(command, IMAGE, dpi=200)
+    assert result.tier.name == "fast"
+    assert result.result == {
+        "dpi": 200,
+        "oem": 1,
+        "tessdata_dir": "tests/samples/tessdata_fast",
+    }
+    assert policy.latency is not None
+
+
+async def test_run_skips_unsupported_options():
+    policy = DegradationPolicy(TIERS[2:], Scheduler(concurrency=1))
+    result = await policy.run(boxes, IMAGE)
+    assert result == TieredResult(
+        {"tessdata_dir": "tests/samples/tessdata_fast"}, TIERS[2]
+    )
+
+
+async def test_dpi_tier_downscales():
+    async def ocr(image, dpi=300, preprocess=None, tessdata_dir=None, timeout=30):
+        return {"dpi": dpi, "preprocess": preprocess}
+
+    policy = DegradationPolicy(TIERS[2:], Scheduler(concurrency=1))
+    result = await policy.run(ocr, IMAGE)
+    assert result.result == {
+        "dpi": 300,
+        "preprocess": Preprocess(grayscale=False, target_dpi=150),
+    }
+
+
+async def test_run_applies_tier_to_profile():
+    async def ocr(image, profile=None, preprocess=None, timeout=30):
+        return profile, preprocess
+
+    policy = DegradationPolicy(TIERS[1:], Scheduler(concurrency=1))
+    profile = OCRProfile(lang="por", psm=6)
+    tiered, preprocess = (await policy.run(ocr, IMAGE, profile=profile)).result
+    assert tiered == OCRProfile(
+        lang="por", psm=6, oem=1, tessdata_dir="tests/samples/tessdata_fast"
+    )
+    assert preprocess is None
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import base_command
+from aiopytesseract.exceptions import TesseractRuntimeError, TesseractTimeoutError
+from aiopytesseract.models import OSD, Box, Data
+
+IMAGE = Path("tests/samples/file-sample_150kB.png").read_bytes()
+FAKE_TESSERACT = Path("scripts/fake_tesseract.py")
+
+
+@pytest.fixture
+def fake_tesseract(tmp_path, monkeypatch):
+    def install(*options):
+        path = tmp_path / "tesseract"
+        subprocess.run(  # noqa: S603
+            [sys.executable, str(FAKE_TESSERACT), f"--install={path}", *options],
+            check=True,
+        )
+        monkeypatch.setattr(base_command, "TESSERACT_CMD", str(path))
+        return path
+
+    return install
+
+
+def test_install_creates_parent_dirs(tmp_path):
+    path = tmp_path / "fake" / "bin" / "tesseract"
+    subprocess.run(  # noqa: S603
+        [sys.executable, str(FAKE_TESSERACT), f"--install={path}"], check=True
+    )
+    assert os.access(path, os.X_OK)
+
+
+async def test_outputs(fake_tesseract):
+    fake_tesseract("--words=30")
+    text = await aiopytesseract.image_to_string(IMAGE)
+    assert text.split()[:3] == ["the", "quick", "brown"]
+    data = await aiopytesseract.image_to_data(IMAGE)
+    words = [item for item in data if item.level == 5]
+    assert len(words) == 30
+    assert isinstance(words[0], Data)
+    assert words[0].text == "the"
+    hocr = await aiopytesseract.image_to_hocr(IMAGE)
+    assert hocr.count("class='ocrx_word'") == 30
+    boxes = await aiopytesseract.image_to_boxes(IMAGE)
+    assert isinstance(boxes[0], Box)
+    assert "".join(box.character for box in boxes).startswith("thequick")
+    osd = await aiopytesseract.image_to_osd(IMAGE)
+    assert isinstance(osd, OSD)
+    lines = [line async for line in aiopytesseract.image_to_alto_lines(IMAGE)]
+    assert " ".join(str(line) for line in lines) == " ".join(text.split())
+
+
+async def test_multiple_outputs(fake_tesseract):
+    fake_tesseract()
+    async with aiopytesseract.run(IMAGE, "output", "alto hocr tsv txt pdf") as files:
+        contents = {Path(file).suffix: Path(file).read_bytes() for file in files}
+    assert contents[".pdf"].startswith(b"%PDF-")
+    assert contents[".xml"].startswith(b"<?xml")
+    assert b"ocr_page" in contents[".hocr"]
+
+
+async def test_latency(fake_tesseract):
+    fake_tesseract("--latency=0.2")
+    started = time.monotonic()
+    await aiopytesseract.image_to_string(IMAGE)
+    assert time.monotonic() - started >= 0.2
+
+
+async def test_failure_rate(fake_tesseract):
+    fake_tesseract("--failure-rate=1")
+    with pytest.raises(TesseractRuntimeError):
+        await aiopytesseract.image_to_string(IMAGE)
+
+
+async def test_timeout_rate(fake_tesseract):
+    fake_tesseract("--timeout-rate=1")
+    with pytest.raises(TesseractTimeoutError):
+        await aiopytesseract.image_to_string(IMAGE, timeout=0.5)
+
+
+async def test_hang_on_demand(fake_tesseract, tmp_path):
+    hang_file = tmp_path / "hang"
+    fake_tesseract(f"--hang-file={hang_file}")
+    assert await aiopytesseract.image_to_string(IMAGE, timeout=5)
+    hang_file.touch()
+    with pytest.raises(TesseractTimeoutError):
+        await aiopytesseract.image_to_string(IMAGE, timeout=0.5)
+
+
+def test_tesseract_cmd_from_environment():
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from aiopytesseract import base_command; print(base_command.TESSERACT_CMD)",
+        ],
+        env={**os.environ, "TESSERACT_CMD": "/opt/fake/tesseract"},
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert output.stdout.strip() == "/opt/fake/tesseract"
@@ -0,0 +1,166 @@
+import asyncio
+import signal
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import base_command
+from aiopytesseract.hedging import Hedger
+from aiopytesseract.models import HedgeStats
+
+IMAGE = Path("tests/samples/file-sample_150kB.png").read_bytes()
+
+
+def warmed(latency=0.01, **kwargs):
+    hedger = Hedger(min_samples=4, **kwargs)
+    for _ in range(4):
+        hedger.observe(latency)
+    return hedger
+
+
+def backend(*outcomes):
+    # one (seconds, result or exception) per call
+    calls = []
+
+    async def ocr(image, lang="eng"):
+        seconds, outcome = outcomes[len(calls)]
+        calls.append(lang)
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            calls.append("cancelled")
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return ocr, calls
+
+
+def test_delay():
+    hedger = Hedger(percentile=90, min_samples=3, window=10)
+    hedger.observe(1)
+    hedger.observe(2)
+    assert hedger.delay is None
+    for seconds in range(3, 11):
+        hedger.observe(seconds)
+    assert hedger.delay == 9
+    hedger.observe(20)
+    assert hedger.delay == 10
+    hedger.reset()
+    assert hedger.stats == HedgeStats()
+
+
+async def test_slow_call_is_hedged():
+    hedger = warmed(budget=1)
+    ocr, calls = backend((10, "slow"), (0, "fast"))
+    assert await hedger.run(ocr, IMAGE, lang="por") == "fast"
+    assert calls == ["por", "por", "cancelled"]
+    stats = hedger.stats
+    assert (stats.calls, stats.hedged, stats.hedge_wins, stats.denied) == (1, 1, 1, 0)
+    assert stats.extra_load == 1.0
+
+
+async def test_primary_may_still_win():
+    hedger = warmed(budget=1)
+    ocr, calls = backend((0.05, "primary"), (10, "hedge"))
+    assert await hedger.run(ocr, IMAGE) == "primary"
+    assert calls == ["eng", "eng", "cancelled"]
+    assert hedger.stats.hedge_wins == 0
+
+
+async def test_fast_call_is_not_hedged():
+    hedger = warmed(latency=1, budget=1)
+    ocr, calls = backend((0, "fast"))
+    assert await hedger.run(ocr, IMAGE) == "fast"
+    assert calls == ["eng"]
+    assert hedger.stats.hedged == 0
+
+
+async def test_no_hedging_before_min_samples():
+    hedger = Hedger(budget=1, min_samples=2)
+    ocr, calls = backend((0.05, "first"), (0.05, "second"))
+    assert await hedger.run(ocr, IMAGE) == "first"
+    assert await hedger.run(ocr, IMAGE) == "second"
+    assert calls == ["eng", "eng"]
+    assert hedger.stats.delay == pytest.approx(0.05, abs=0.04)
+
+
+async def test_budget():
+    hedger = warmed(percentile=50, budget=0.5)
+    ocr, calls = backend((0.05, "a"), (0.05, "b"), (0, "hedge"))
+    assert await hedger.run(ocr, IMAGE) == "a"
+    assert await hedger.run(ocr, IMAGE) == "hedge"
+    assert calls == ["eng", "eng", "eng", "cancelled"]
+    stats = hedger.stats
+    assert (stats.calls, stats.hedged, stats.denied) == (2, 1, 1)
+    assert "50.0% extra load" in str(stats)
+
+
+async def test_errors():
+    hedger = warmed(budget=1)
+    ocr, _ = backend((0, ValueError("bad image")))
+    with pytest.raises(ValueError, match="bad image"):
+        await hedger.run(ocr, IMAGE)
+    # the hedge still wins after a late failure
+    ocr, _ = backend((0.05, RuntimeError("crashed")), (0.1, "hedge"))
+    assert await hedger.run(ocr, IMAGE) == "hedge"
+    # the primary error is raised when both fail
+    ocr, _ = backend((0.05, RuntimeError("first")), (0, RuntimeError("second")))
+    with pytest.raises(RuntimeError, match="first"):
+        await hedger.run(ocr, IMAGE)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"percentile": 0},
+        {"percentile": 101},
+        {"budget": -0.1},
+        {"budget": 2},
+        {"min_samples": 0},
+        {"window": 4, "min_samples": 5},
+    ],
+)
+def test_invalid(kwargs):
+    with pytest.raises(ValueError):
+        Hedger(**kwargs)
+
+
+async def test_stalled_tesseract_is_killed(tmp_path, monkeypatch):
+    path = tmp_path / "tesseract"
+    hang = tmp_path / "hang"
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "scripts/fake_tesseract.py",
+            f"--install={path}",
+            f"--hang-file={hang}",
+            "--words=12",
+        ],
+        check=True,
+    )
+    monkeypatch.setattr(base_command, "TESSERACT_CMD", str(path))
+    procs = []
+    spawn = base_command.spawn
+
+    async def recording_spawn(cmd_args, timeout):
+        # the first process stalls, the hedge does not
+        if procs:
+            hang.unlink()
+        proc = await spawn(cmd_args, timeout)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(base_command, "spawn", recording_spawn)
+    hedger = warmed(latency=0.3, budget=1)
+    hang.touch()
+    text = await hedger.run(aiopytesseract.image_to_string, IMAGE)
+    assert text.strip()
+    assert hedger.stats.hedge_wins == 1
+    stalled, hedge = procs
+    assert await asyncio.wait_for(stalled.wait(), 5) == -signal.SIGKILL
+    assert hedge.returncode == 0
@@ -0,0 +1,121 @@
+import io
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import validators
+from aiopytesseract.exceptions import InvalidImageError, TesseractRuntimeError
+from aiopytesseract.image_header import sniff
+from aiopytesseract.models import ImageInfo
+
+
+def _encode(fmt, mode="RGB", size=(64, 32), **params):
+    pil_image = pytest.importorskip("PIL.Image")
+    output = io.BytesIO()
+    pil_image.new(mode, size, "white").save(output, format=fmt, **params)
+    return output.getvalue()
+
+
+def test_sniff_png_sample():
+    info = sniff(Path("tests/samples/file-sample_150kB.png").read_bytes())
+    assert isinstance(info, ImageInfo)
+    assert (info.format, info.width, info.height) == ("png", 1232, 297)
+    assert info.pixels == 1232 * 297
+    assert str(info) == "png 1232x297"
+
+
+@pytest.mark.parametrize(
+    "fmt, mode, expected_format, bit_depth",
+    [
+        ("PNG", "RGB", "png", 24),
+        ("PNG", "L", "png", 8),
+        ("JPEG", "RGB", "jpeg", 24),
+        ("JPEG", "L", "jpeg", 8),
+        ("TIFF", "RGB", "tiff", 24),
+        ("TIFF", "1", "tiff", 1),
+        ("BMP", "RGB", "bmp", 24),
+        ("PPM", "RGB", "pnm", 24),
+        ("PPM", "L", "pnm", 8),
+        ("PPM", "1", "pnm", 1),
+        ("WEBP", "RGB", "webp", 24),
+    ],
+)
+def test_sniff_formats(fmt, mode, expected_format, bit_depth):
+    info = sniff(_encode(fmt, mode))
+    assert (info.format, info.width, info.height) == (expected_format, 64, 32)
+    assert info.bit_depth == bit_depth
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG", "TIFF", "BMP"])
+def test_sniff_embedded_dpi(fmt):
+    info = sniff(_encode(fmt, dpi=(200, 200)))
+    assert info.dpi == pytest.approx((200, 200), abs=0.5)
+
+
+def test_sniff_plain_pnm():
+    info = sniff(b"P2\n# comment\n3 2\n255\n0 0 0\n255 255 255\n")
+    assert (info.format, info.width, info.height, info.bit_depth) == ("pnm", 3, 2, 8)
+
+
+def test_sniff_gif():
+    # logical screen descriptor with a 256 entry global color table, no frames
+    image = b"GIF89a\x40\x00\x20\x00\xf7\x00\x00" + b"\x00" * 768 + b";"
+    info = sniff(image)
+    assert (info.format, info.width, info.height, info.bit_depth) == ("gif", 64, 32, 8)
+
+
+@pytest.mark.parametrize(
+    "image",
+    [
+        b"",
+        b"not an image at all",
+        b"%PDF-1.4\n",
+        b"\x89PNG\r\n\x1a\n",
+        b"P5\n10 10\n255\n" + b"\x00" * 10,
+        b"GIF89a\x10\x00\x10\x00\x00",
+        b"BM\xff\xff\x00\x00",
+    ],
+)
+def test_sniff_rejects_invalid_input(image):
+    with pytest.raises(InvalidImageError):
+        sniff(image)
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "JPEG", "TIFF", "BMP", "PPM", "GIF", "WEBP"])
+def test_sniff_rejects_truncated_images(fmt):
+    image = _encode(fmt, "L", (512, 512))
+    with pytest.raises(InvalidImageError):
+        sniff(image[: len(image) // 2] if fmt != "JPEG" else image[:4])
+
+
+async def test_image_is_valid_returns_cost_estimate():
+    info = await validators.image_is_valid(_encode("PNG"))
+    assert info.pixels == 64 * 32
+
+
+async def test_image_is_valid_rejects_oversized_image():
+    header = b"P5\n40000 1\n255\n"
+    with pytest.raises(InvalidImageError, match="larger than"):
+        await validators.image_is_valid(header + b"\x00" * 40000)
+
+
+async def test_invalid_image_rejected_before_spawning(monkeypatch):
+    async def spawn(*args, **kwargs):
+        raise AssertionError("tesseract should not be spawned")
+
+    monkeypatch.setattr("asyncio.create_subprocess_exec", spawn)
+    with pytest.raises(InvalidImageError) as exc:
+        await aiopytesseract.image_to_string(b"")
+    assert isinstance(exc.value, TesseractRuntimeError)
+    assert str(exc.value) == "Invalid image: empty image"
+
+
+@pytest.mark.parametrize("fmt", ["PNG", "GIF"])
+def test_sniff_ignores_trailing_bytes(fmt):
+    image = _encode(fmt, "L", (64, 32))
+    info = sniff(image + b"\r\n")
+    assert (info.width, info.height) == (64, 32)
+    # cut before the IEND chunk / the GIF trailer
+    with pytest.raises(InvalidImageError, match="truncated"):
+        sniff(image[:-12] if fmt == "PNG" else image[:-1])
@@ -0,0 +1,113 @@
+import io
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract.alto import AltoParser
+from aiopytesseract.exceptions import TesseractRuntimeError
+from aiopytesseract.models import String, TextLine
+
+ALTO_SAMPLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<alto xmlns="http://www.loc.gov/standards/alto/ns-v3#">
+<Layout><Page><PrintSpace><ComposedBlock><TextBlock>
+<TextLine ID="line_1" HPOS="36" VPOS="92" WIDTH="582" HEIGHT="36">
+<String ID="string_1" HPOS="36" VPOS="92" WIDTH="112" HEIGHT="36" WC="0.96" CONTENT="Lorem"/>
+<SP WIDTH="10" VPOS="92" HPOS="148"/>
+<String ID="string_2" HPOS="158" VPOS="92" WIDTH="98" HEIGHT="36" WC="0.93" CONTENT="ipsum"/>
+</TextLine>
+<TextLine ID="line_2" HPOS="36" VPOS="140" WIDTH="200" HEIGHT="30">
+<String ID="string_3" HPOS="36" VPOS="140" WIDTH="200" HEIGHT="30" WC="0.5" CONTENT="dolor"/>
+</TextLine>
+</TextBlock></ComposedBlock></PrintSpace></Page></Layout>
+</alto>
+"""
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_image_to_alto_with_str_image(image):
+    alto = await aiopytesseract.image_to_alto(image)
+    assert isinstance(alto, bytes)
+    assert b"<alto" in alto
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_image_to_alto_with_bytes_image(image):
+    alto = await aiopytesseract.image_to_alto(Path(image).read_bytes())
+    assert isinstance(alto, bytes)
+    assert b"<alto" in alto
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_image_to_alto_stream(image):
+    sink = io.BytesIO()
+    written = await aiopytesseract.image_to_alto_stream(image, sink, chunk_size=512)
+    assert written == len(sink.getvalue())
+    assert b"<alto" in sink.getvalue()
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_image_to_alto_lines(image):
+    lines = [
+        line
+        async for line in aiopytesseract.image_to_alto_lines(Path(image).read_bytes())
+    ]
+    assert len(lines) > 0
+    assert isinstance(lines[0], TextLine)
+    assert isinstance(lines[0].strings[0], String)
+
+
+async def test_image_to_alto_with_invalid():
+    with pytest.raises(TesseractRuntimeError):
+        await aiopytesseract.image_to_alto("tests/samples/file-sample_150kB.pdf")
+
+
+async def test_image_to_alto_lines_with_invalid():
+    with pytest.raises(TesseractRuntimeError):
+        async for _ in aiopytesseract.image_to_alto_lines(
+            "tests/samples/file-sample_150kB.pdf"
+        ):
+            pass
+
+
+async def test_image_to_alto_with_type_not_supported():
+    with pytest.raises(NotImplementedError):
+        await aiopytesseract.image_to_alto(None)
+
+
+async def test_image_to_alto_stream_with_type_not_supported():
+    with pytest.raises(NotImplementedError):
+        await aiopytesseract.image_to_alto_stream(None, io.BytesIO())
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, len(ALTO_SAMPLE)])
+def test_alto_parser_incremental(chunk_size):
+    parser = AltoParser()
+    lines = []
+    for offset in range(0, len(ALTO_SAMPLE), chunk_size):
+        lines.extend(parser.feed(ALTO_SAMPLE[offset : offset + chunk_size]))
+    lines.extend(parser.close())
+    assert [str(line) for line in lines] == ["Lorem ipsum", "dolor"]
+    assert lines[0] == TextLine(
+        id="line_1",
+        hpos=36,
+        vpos=92,
+        width=582,
+        height=36,
+        strings=(
+            String(content="Lorem", hpos=36, vpos=92, width=112, height=36, wc=0.96),
+            String(content="ipsum", hpos=158, vpos=92, width=98, height=36, wc=0.93),
+        ),
+    )
+
+
+def test_alto_parser_releases_parsed_lines():
+    parser = AltoParser()
+    parser.feed(ALTO_SAMPLE[: ALTO_SAMPLE.index(b'<TextLine ID="line_2"')])
+    text_block = parser._stack[-1]
+    assert len(text_block) == 0
+
+
+def test_string_str():
+    string = String(content="abc", hpos=0, vpos=0, width=0, height=0, wc=0)
+    assert str(string) == "abc"
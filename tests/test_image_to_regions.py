@@ -0,0 +1,90 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import base_command
+from aiopytesseract.exceptions import NoSuchFileException, PSMInvalidException
+from aiopytesseract.models import Region
+
+pytest.importorskip("PIL")
+
+# echoes every listed crop as "<width>x<height> <psm> <whitelist>"
+FAKE_TESSERACT = """\
+import sys
+args = sys.argv[1:]
+psm = args[args.index("--psm") + 1]
+whitelist = next(
+    (arg.split("=", 1)[1] for arg in args if arg.startswith("tessedit_char_whitelist=")),
+    None,
+)
+with open(args[0]) as listfile:
+    for path in listfile.read().split():
+        with open(path, "rb") as crop:
+            _, width, height = crop.read(64).split()[:3]
+        sys.stdout.write(f"{width.decode()}x{height.decode()} {psm} {whitelist}\\n\\f")
+"""
+
+
+@pytest.fixture
+def fake_tesseract(tmp_path, monkeypatch):
+    script = tmp_path / "tesseract"
+    script.write_text(f"#!{sys.executable}\n{FAKE_TESSERACT}")
+    script.chmod(0o755)
+    monkeypatch.setattr(base_command, "TESSERACT_CMD", str(script))
+    return script
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_image_to_regions(image):
+    region = Region(0, 0, 600, 120)
+    texts = await aiopytesseract.image_to_regions(image, [region])
+    assert list(texts) == [region]
+    assert isinstance(texts[region], str)
+
+
+async def test_image_to_regions_groups_by_options(fake_tesseract):
+    image = Path("tests/samples/file-sample_150kB.png").read_bytes()
+    regions = [
+        (10, 10, 100, 20),
+        (10, 40, 50, 20, 8, "0123456789"),
+        Region(10, 70, 80, 30),
+        (10, 100, 30, 10, 8, "0123456789"),
+    ]
+    texts = await aiopytesseract.image_to_regions(image, regions)
+    assert texts == {
+        Region(10, 10, 100, 20): "100x20 7 None",
+        Region(10, 40, 50, 20, 8, "0123456789"): "50x20 8 0123456789",
+        Region(10, 70, 80, 30): "80x30 7 None",
+        Region(10, 100, 30, 10, 8, "0123456789"): "30x10 8 0123456789",
+    }
+
+
+async def test_image_to_regions_clips_to_image(fake_tesseract):
+    image = b"P5\n40 30\n255\n" + b"\x80" * 1200
+    texts = await aiopytesseract.image_to_regions(image, [(30, 20, 100, 100)])
+    assert texts == {Region(30, 20, 100, 100): "10x10 7 None"}
+
+
+async def test_image_to_regions_outside_image(fake_tesseract):
+    image = b"P5\n40 30\n255\n" + b"\x80" * 1200
+    with pytest.raises(ValueError, match="outside"):
+        await aiopytesseract.image_to_regions(image, [(50, 0, 10, 10)])
+
+
+@pytest.mark.parametrize("region", [(0, 0, 0, 10), (-1, 0, 10, 10)])
+def test_invalid_region(region):
+    with pytest.raises(ValueError):
+        Region(*region)
+
+
+async def test_image_to_regions_invalid_psm():
+    image = Path("tests/samples/file-sample_150kB.png").read_bytes()
+    with pytest.raises(PSMInvalidException):
+        await aiopytesseract.image_to_regions(image, [(0, 0, 10, 10, 14, None)])
+
+
+async def test_image_to_regions_file_not_found():
+    with pytest.raises(NoSuchFileException):
+        await aiopytesseract.image_to_regions("missing.png", [(0, 0, 10, 10)])
@@ -0,0 +1,117 @@
+import pytest
+
+from aiopytesseract.index import WordIndex, normalize
+from aiopytesseract.models import Data, Posting
+
+
+def word(text, left, top, width=40, height=20, page=1, line=1, number=1, conf=90.0):
+    return Data(5, page, 1, 1, line, number, left, top, width, height, conf, text)
+
+
+ROWS = [
+    Data(1, 1, 0, 0, 0, 0, 0, 0, 1000, 1000, -1, ""),
+    word("Invoice:", 10, 10, number=1),
+    word("number", 60, 10, number=2),
+    word("INV-2023", 120, 10, number=3, conf=40.0),
+    word("Total", 10, 600, line=2, number=1),
+    word("invoiced", 700, 600, line=2, number=2),
+    word("...", 800, 600, line=2, number=3),
+]
+
+
+@pytest.fixture
+def index():
+    return WordIndex.from_data(ROWS)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Invoice:", "invoice"),
+        ("(\uff21\uff22\uff23)", "abc"),  # fullwidth
+        ("Straße", "strasse"),
+        ("INV-2023.", "inv-2023"),
+        ("...", ""),
+    ],
+)
+def test_normalize(text, expected):
+    assert normalize(text) == expected
+
+
+def test_lookup(index):
+    assert index.lookup("INVOICE") == [
+        Posting("invoice", 1, 1, 1, 1, 1, 10, 10, 40, 20, 90.0)
+    ]
+    assert index.lookup("missing") == []
+    assert index.lookup("invoice", page=2) == []
+    assert "Total" in index
+    assert len(index) == 5
+    assert list(index.tokens) == ["inv-2023", "invoice", "invoiced", "number", "total"]
+
+
+def test_prefix(index):
+    matches = index.prefix("Inv")
+    assert list(matches) == ["inv-2023", "invoice", "invoiced"]
+    assert matches["invoiced"][0].bbox == (700, 600, 740, 620)
+    assert index.prefix("z") == {}
+
+
+def test_fuzzy(index):
+    assert list(index.fuzzy("lnvoice")) == ["invoice"]
+    assert list(index.fuzzy("lnvoice", max_distance=2)) == ["invoice", "invoiced"]
+    assert list(index.fuzzy("numbr")) == ["number"]
+
+
+def test_within(index):
+    header = index.within(1, (0, 0, 200, 50))
+    assert [posting.token for posting in header] == ["invoice", "number", "inv-2023"]
+    assert [p.token for p in index.within(1, (0, 0, 200, 50), conf=50)] == [
+        "invoice",
+        "number",
+    ]
+    # crosses grid cells, touching edges do not overlap
+    assert [p.token for p in index.within(1, (50, 0, 720, 700))] == [
+        "number",
+        "inv-2023",
+        "invoiced",
+    ]
+    assert index.within(1, (0, 0, 10, 10)) == []
+    assert index.within(2, (0, 0, 1000, 1000)) == []
+
+
+def test_from_pages():
+    index = WordIndex.from_pages([[word("alpha", 0, 0)], [word("alpha", 5, 5)]])
+    assert [posting.page for posting in index.lookup("alpha")] == [1, 2]
+    assert [p.left for p in index.within(2, (0, 0, 100, 100))] == [5]
+
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / "words.idx"
+    index.save(path)
+    with WordIndex.load(path) as loaded:
+        assert loaded.lookup("invoice") == index.lookup("invoice")
+        assert loaded.prefix("inv") == index.prefix("inv")
+        assert loaded.within(1, (0, 0, 1000, 1000)) == index.within(
+            1, (0, 0, 1000, 1000)
+        )
+        assert list(loaded) == list(index)
+
+
+def test_empty_index(tmp_path):
+    index = WordIndex.from_data([])
+    assert index.lookup("a") == []
+    assert index.within(1, (0, 0, 10, 10)) == []
+    index.save(tmp_path / "empty.idx")
+    assert len(WordIndex.load(tmp_path / "empty.idx")) == 0
+
+
+def test_invalid(tmp_path):
+    with pytest.raises(ValueError, match="not a word index"):
+        WordIndex(b"garbage")
+    with pytest.raises(ValueError, match="cell_size"):
+        WordIndex.from_data(ROWS, cell_size=0)
+    path = tmp_path / "words.idx"
+    WordIndex.from_data(ROWS).save(path)
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        WordIndex.load(path)
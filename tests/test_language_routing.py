@@ -0,0 +1,188 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aiopytesseract import base_command, commands, language_routing
+from aiopytesseract.exceptions import TesseractRuntimeError, TesseractTimeoutError
+from aiopytesseract.file_format import FileFormat
+from aiopytesseract.language_routing import (
+    LanguageRouter,
+    current_language_router,
+    language_router,
+)
+from aiopytesseract.models import OSD
+
+IMAGE = Path("tests/samples/file-sample_150kB.png").read_bytes()
+
+
+class FakeOSD:
+    def __init__(self, script="Latin", confidence=2.0, delay=0.0):
+        self.script = script
+        self.confidence = confidence
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, image, timeout=30, tessdata_dir=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.script is None:
+            raise TesseractRuntimeError("Too few characters. Skipping this page")
+        return OSD(0, 0.0, 0.0, 1.0, self.script, self.confidence)
+
+
+@pytest.fixture
+def osd(monkeypatch):
+    fake = FakeOSD()
+    fake.listed = []
+
+    async def get_languages(tessdata_dir=None):
+        fake.listed.append(tessdata_dir)
+        if tessdata_dir == "custom":
+            return ["eng", "ukr"]
+        return ["eng", "por", "rus", "ukr", "osd"]
+
+    monkeypatch.setattr(commands, "image_to_osd", fake)
+    monkeypatch.setattr(commands, "get_languages", get_languages)
+    return fake
+
+
+@pytest.mark.parametrize(
+    "script, confidence, expected",
+    [
+        ("Latin", 2.0, "eng"),
+        ("Cyrillic", 2.0, "rus+ukr"),
+        ("Han", 2.0, "eng"),  # no chi_sim/chi_tra installed
+        ("Klingon", 2.0, "eng"),
+        ("Cyrillic", 0.5, "eng"),  # below min_confidence
+        (None, 0.0, "eng"),  # detection failed
+    ],
+)
+async def test_resolve(osd, script, confidence, expected):
+    osd.script = script
+    osd.confidence = confidence
+    router = LanguageRouter(min_confidence=1.0)
+    assert await router.resolve(IMAGE) == expected
+
+
+async def test_latin_uses_fallback(osd):
+    # OSD cannot tell Latin languages apart, the caller's languages are kept
+    router = LanguageRouter(fallback="por+spa+eng")
+    assert await router.resolve(IMAGE) == "por+spa+eng"
+
+
+async def test_installed_languages_per_tessdata_dir(osd):
+    osd.script = "Cyrillic"
+    router = LanguageRouter()
+    assert await router.resolve(IMAGE, tessdata_dir="custom") == "ukr"
+    assert await router.resolve(b"page", tessdata_dir=None) == "rus+ukr"
+    assert await router.resolve(b"other", tessdata_dir="custom") == "ukr"
+    assert osd.listed == ["custom", None]
+
+
+async def test_confidence_auto_language(osd, monkeypatch, tmp_path):
+    commands_args = []
+
+    async def spawn(cmd_args, timeout):
+        commands_args.append(cmd_args)
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(commands, "spawn", spawn)
+    osd.script = "Cyrillic"
+    image = tmp_path / "page.png"
+    image.write_bytes(IMAGE)
+    with pytest.raises(TesseractTimeoutError):
+        await commands.confidence(str(image), lang="auto")
+    with pytest.raises(TesseractTimeoutError):
+        await commands.deskew(str(image), lang="auto")
+    assert len(commands_args) == 2
+    for cmd_args in commands_args:
+        assert cmd_args[cmd_args.index("-l") + 1] == "rus+ukr"
+
+
+async def test_regions_auto_language(osd, monkeypatch):
+    pytest.importorskip("PIL")
+    languages = []
+
+    async def recognize_list(listfile, count, psm, whitelist, dpi, lang, *args):
+        languages.append(lang)
+        return [""] * count
+
+    monkeypatch.setattr(commands, "_recognize_list", recognize_list)
+    osd.script = "Cyrillic"
+    await commands.image_to_regions(IMAGE, [(0, 0, 10, 10)], lang="auto")
+    assert languages == ["rus+ukr"]
+
+
+async def test_custom_scripts(osd):
+    router = LanguageRouter(scripts={"Latin": ["por", "eng", "fra"]}, fallback="osd")
+    assert await router.resolve(IMAGE) == "por+eng"
+    osd.script = "Cyrillic"
+    assert await router.resolve(b"another page") == "osd"
+
+
+async def test_detection_cached_per_document(osd):
+    router = LanguageRouter()
+    assert await router.resolve(IMAGE, document="invoice") == "eng"
+    osd.script = "Cyrillic"
+    assert await router.resolve(b"page 2", document="invoice") == "eng"
+    assert await router.resolve(IMAGE) == "rus+ukr"
+    assert await router.resolve(IMAGE) == "rus+ukr"
+    assert osd.calls == 2
+    router.forget("invoice")
+    assert await router.resolve(b"page 2", document="invoice") == "rus+ukr"
+
+
+async def test_concurrent_pages_detect_once(osd):
+    osd.delay = 0.1
+    router = LanguageRouter()
+    results = await asyncio.gather(
+        *(router.resolve(IMAGE, document="book") for _ in range(5))
+    )
+    assert results == ["eng"] * 5
+    assert osd.calls == 1
+
+
+async def test_cache_size(osd):
+    router = LanguageRouter(cache_size=2)
+    for document in ("a", "b", "c"):
+        await router.resolve(IMAGE, document=document)
+    assert list(router._cache) == ["b", "c"]
+
+
+def test_invalid_cache_size():
+    with pytest.raises(ValueError):
+        LanguageRouter(cache_size=0)
+
+
+def test_language_router_context():
+    router = LanguageRouter()
+    default = current_language_router()
+    assert current_language_router() is default
+    with language_router(router, document="invoice"):
+        assert current_language_router() is router
+        assert language_routing._document.get() == "invoice"
+    assert current_language_router() is default
+    assert language_routing._document.get() is None
+
+
+async def test_execute_auto_language(osd, monkeypatch):
+    spawned = []
+
+    async def spawn(cmd_args, timeout):
+        spawned.append(cmd_args)
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(base_command, "spawn", spawn)
+    osd.script = "Cyrillic"
+    with language_router(LanguageRouter()), pytest.raises(TesseractTimeoutError):
+        await base_command.execute(
+            IMAGE,
+            output_format=FileFormat.TXT,
+            dpi=300,
+            psm=3,
+            oem=3,
+            timeout=30,
+            lang="auto",
+        )
+    assert spawned[0][spawned[0].index("-l") + 1] == "rus+ukr"
@@ -0,0 +1,77 @@
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+
+# cumulative microseconds reported by `python -X importtime` for the package
+IMPORT_TIME_BUDGET_US = 20_000
+
+
+def _run_python(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_heavy_modules():
+    result = _run_python(
+        "import sys, aiopytesseract; "
+        "print(' '.join(m for m in ('aiopytesseract.commands', 'aiopytesseract.models', "
+        "'asyncio', 'attrs', 'cattr', 'aiofiles') if m in sys.modules))"
+    )
+    assert result.stdout.strip() == ""
+
+
+@pytest.mark.skipif(
+    sys.implementation.name != "cpython", reason="-X importtime is CPython only"
+)
+def test_import_time_budget():
+    result = _run_python("import aiopytesseract", "-X", "importtime")
+    line = next(
+        line
+        for line in result.stderr.splitlines()
+        if line.rstrip().endswith("| aiopytesseract")
+    )
+    cumulative = int(line.split("|")[1])
+    assert cumulative < IMPORT_TIME_BUDGET_US
+
+
+def test_first_use_does_not_load_cattrs():
+    result = _run_python(
+        "import sys, aiopytesseract; aiopytesseract.image_to_string; "
+        "print('cattr' in sys.modules, 'aiofiles' in sys.modules)"
+    )
+    assert result.stdout.strip() == "False False"
+
+
+@pytest.mark.parametrize("name", aiopytesseract.__all__)
+def test_lazy_attribute(name):
+    assert getattr(aiopytesseract, name) is not None
+    assert name in dir(aiopytesseract)
+
+
+def test_type_checking_imports_match_lazy_attributes():
+    tree = ast.parse(Path(aiopytesseract.__file__).read_text())
+    imported = {
+        alias.asname or alias.name
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    assert imported == set(aiopytesseract._LAZY_ATTRIBUTES)
+
+
+def test_submodule_attribute():
+    assert aiopytesseract.base_command.execute is not None
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        aiopytesseract.not_an_attribute  # noqa: B018
@@ -0,0 +1,64 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract.models import Box, Data
+from aiopytesseract.parsing import (
+    ParsePolicy,
+    current_parse_policy,
+    parse,
+    parse_boxes,
+    parse_data,
+    parse_policy,
+)
+
+TSV = (
+    b"level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\t"
+    b"left\ttop\twidth\theight\tconf\ttext\n"
+    b"5\t1\t1\t1\t1\t1\t36\t92\t60\t24\t95.5\tHello\n"
+    b"5\t1\t1\t1\t1\t2\t100\t92\t70\t24\t96.1\tworld\n"
+)
+
+
+def thread_name(data: bytes, encoding: str) -> str:
+    return threading.current_thread().name
+
+
+def test_parse_data():
+    data = parse_data(TSV, "utf-8")
+    assert [item.text for item in data] == ["Hello", "world"]
+    assert isinstance(data[0], Data)
+
+
+def test_parse_boxes():
+    boxes = parse_boxes(b"H 36 92 48 116 0\ni 48 92 52 116 0\n", "utf-8")
+    assert boxes == [Box("H", 36, 92, 48, 116), Box("i", 48, 92, 52, 116)]
+
+
+def test_invalid_policy():
+    with pytest.raises(ValueError):
+        ParsePolicy(threshold=-1)
+
+
+async def test_small_output_parsed_inline():
+    assert current_parse_policy() == ParsePolicy()
+    assert await parse(thread_name, b"x", "utf-8") == threading.current_thread().name
+
+
+async def test_large_output_offloaded():
+    executor = ThreadPoolExecutor(thread_name_prefix="parser")
+    with executor, parse_policy(ParsePolicy(threshold=4, executor=executor)):
+        assert await parse(thread_name, b"x", "utf-8") != "parser_0"
+        assert await parse(thread_name, b"xxxx", "utf-8") == "parser_0"
+    assert current_parse_policy() == ParsePolicy()
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_commands_with_offloaded_parsing(image):
+    with parse_policy(ParsePolicy(threshold=0)):
+        data = await aiopytesseract.image_to_data(image)
+        text = await aiopytesseract.image_to_string(image)
+    assert isinstance(data, list)
+    assert isinstance(text, str)
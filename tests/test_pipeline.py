@@ -0,0 +1,119 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract.exceptions import TesseractRuntimeError
+
+
+async def _source(items, pulled=None):
+    for item in items:
+        if pulled is not None:
+            pulled.append(item)
+        yield item
+
+
+def _slow_echo(in_flight):
+    async def func(item):
+        in_flight.append(item)
+        await asyncio.sleep(item / 100)
+        in_flight.remove(item)
+        if item == 2:
+            raise ValueError(item)
+        return item * 10
+
+    return func
+
+
+async def test_ocr_stream_ordered():
+    in_flight = []
+    results = [
+        item
+        async for item in aiopytesseract.ocr_stream(
+            _source([3, 1, 2, 0]), concurrency=2, func=_slow_echo(in_flight)
+        )
+    ]
+    assert [index for index, _ in results] == [0, 1, 2, 3]
+    assert results[0][1] == 30
+    assert isinstance(results[2][1], ValueError)
+
+
+async def test_ocr_stream_completion_order():
+    results = [
+        item
+        async for item in aiopytesseract.ocr_stream(
+            _source([5, 1, 3]), concurrency=3, ordered=False, func=_slow_echo([])
+        )
+    ]
+    assert results == [(1, 10), (2, 30), (0, 50)]
+
+
+async def test_ocr_stream_bounds_in_flight():
+    in_flight = []
+    peak = 0
+
+    async def func(item):
+        nonlocal peak
+        in_flight.append(item)
+        peak = max(peak, len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.remove(item)
+        return item
+
+    results = [
+        item
+        async for item in aiopytesseract.ocr_stream(
+            _source(range(20)), concurrency=4, ordered=False, func=func
+        )
+    ]
+    assert len(results) == 20
+    assert peak == 4
+
+
+async def test_ocr_stream_backpressure():
+    pulled = []
+    stream = aiopytesseract.ocr_stream(
+        _source(range(100), pulled), concurrency=3, func=_slow_echo([])
+    )
+    await anext(stream)
+    await asyncio.sleep(0.05)
+    assert len(pulled) <= 4
+    await stream.aclose()
+
+
+async def test_ocr_stream_cancels_pending_on_close():
+    cancelled = []
+
+    async def func(item):
+        try:
+            await asyncio.sleep(item)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    stream = aiopytesseract.ocr_stream(
+        _source([10, 10, 0]), concurrency=3, ordered=False, func=func
+    )
+    assert await anext(stream) == (2, 0)
+    await stream.aclose()
+    assert cancelled == [10, 10]
+
+
+async def test_ocr_stream_invalid_concurrency():
+    with pytest.raises(ValueError):
+        await anext(aiopytesseract.ocr_stream(_source([]), concurrency=-1))
+
+
+async def test_ocr_stream_with_image_to_string():
+    image = Path("tests/samples/file-sample_150kB.png").read_bytes()
+    invalid = "tests/samples/file-sample_150kB.pdf"
+    results = [
+        result
+        async for _, result in aiopytesseract.ocr_stream(
+            _source([image, invalid]), concurrency=2
+        )
+    ]
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], TesseractRuntimeError)
@@ -0,0 +1,78 @@
+import io
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract.preprocessing import Preprocess, preprocess_image
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def _photo(size=(1200, 800), dpi=600, border=100) -> bytes:
+    img = Image.new("RGB", size, (250, 250, 250))
+    img.paste((20, 40, 200), (border, border, size[0] - border, size[1] - border))
+    output = io.BytesIO()
+    img.save(output, format="PNG", dpi=(dpi, dpi))
+    return output.getvalue()
+
+
+def test_preprocess_image_downscales_to_target_dpi():
+    data, dpi = preprocess_image(_photo(), dpi=70, target_dpi=300)
+    assert dpi == 300
+    assert data.startswith(b"P5")
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.size == (600, 400)
+        assert img.mode == "L"
+
+
+def test_preprocess_image_uses_dpi_argument_without_embedded_dpi():
+    img = Image.new("RGB", (100, 100))
+    output = io.BytesIO()
+    img.save(output, format="BMP")
+    data, dpi = preprocess_image(output.getvalue(), dpi=150, target_dpi=300)
+    assert dpi == 150
+    with Image.open(io.BytesIO(data)) as result:
+        assert result.size == (100, 100)
+
+
+def test_preprocess_image_binarize_and_crop():
+    data, _ = preprocess_image(
+        _photo(), dpi=600, threshold=128, crop_borders=True, target_dpi=None
+    )
+    assert data.startswith(b"P4")
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.size == (1000, 600)
+        assert img.mode == "1"
+
+
+def test_preprocess_image_tiff():
+    data, _ = preprocess_image(_photo(), dpi=600, output_format="tiff")
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.format == "TIFF"
+        assert img.info.get("compression") == "raw"
+
+
+@pytest.mark.parametrize(
+    "options", [{"threshold": 256}, {"threshold": -1}, {"output_format": "jpeg"}]
+)
+def test_preprocess_invalid_options(options):
+    with pytest.raises(ValueError):
+        Preprocess(**options)
+
+
+async def test_preprocess_apply_in_process_pool():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        data, dpi = await Preprocess(executor=executor).apply(_photo(), 600)
+    assert data.startswith(b"P5")
+    assert dpi == 300
+
+
+@pytest.mark.parametrize("image", ["tests/samples/file-sample_150kB.png"])
+async def test_image_to_string_with_preprocess(image):
+    text = await aiopytesseract.image_to_string(
+        Path(image).read_bytes(), preprocess=Preprocess(threshold=180)
+    )
+    assert isinstance(text, str)
+    assert len(text) >= 90
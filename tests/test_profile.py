@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import attrs
+import pytest
+
+import aiopytesseract
+from aiopytesseract import base_command
+from aiopytesseract.exceptions import (
+    LanguageInvalidException,
+    OEMInvalidException,
+    PSMInvalidException,
+)
+from aiopytesseract.profile import OCRProfile
+
+IMAGE = "tests/samples/file-sample_150kB.png"
+
+
+@pytest.mark.parametrize(
+    "kwargs, exception",
+    [
+        ({"psm": 14}, PSMInvalidException),
+        ({"oem": 4}, OEMInvalidException),
+        ({"lang": "eng+xyz"}, LanguageInvalidException),
+    ],
+)
+def test_invalid_profile(kwargs, exception):
+    with pytest.raises(exception):
+        OCRProfile(**kwargs)
+
+
+async def test_profile_matches_build_cmd_args():
+    profile = OCRProfile(
+        dpi=150,
+        lang="por+eng",
+        psm=6,
+        user_words="words.txt",
+        user_patterns="patterns.txt",
+        tessdata_dir="tests/samples/tessdata_fast",
+        config=[("preserve_interword_spaces", "1")],
+    )
+    expected = await base_command._build_cmd_args(
+        "hocr txt",
+        dpi=150,
+        psm=6,
+        oem=3,
+        user_words="words.txt",
+        user_patterns="patterns.txt",
+        tessdata_dir="tests/samples/tessdata_fast",
+        lang="por+eng",
+        config=[("preserve_interword_spaces", "1")],
+    )
+    assert profile.cmd_args("hocr txt") == expected
+
+
+def test_profile_is_hashable_and_keyed():
+    profile = OCRProfile(lang="eng", config=[("a", "1")])
+    same = OCRProfile(lang="eng", config=(("a", "1"),))
+    assert profile == same
+    assert hash(profile) == hash(same)
+    assert profile.key == same.key
+    assert attrs.evolve(profile, psm=6).key != profile.key
+    with pytest.raises(attrs.exceptions.FrozenInstanceError):
+        profile.dpi = 150  # type: ignore[misc]
+
+
+def test_auto_profile_needs_resolution():
+    with pytest.raises(ValueError, match="auto"):
+        OCRProfile(lang="auto").cmd_args("txt")
+
+
+async def test_commands_skip_validation(monkeypatch):
+    async def validator(value):
+        raise AssertionError("options were validated per call")
+
+    for name in ("psm_is_valid", "oem_is_valid", "language_is_valid"):
+        monkeypatch.setattr(base_command, name, validator)
+    profile = OCRProfile(tessdata_dir="tests/samples/tessdata_fast")
+    text = await aiopytesseract.image_to_string(IMAGE, profile=profile)
+    assert len(text) >= 90
+    hocr = await aiopytesseract.image_to_hocr(Path(IMAGE).read_bytes(), profile=profile)
+    assert isinstance(hocr, str)
+
+
+async def test_profile_overrides_arguments(monkeypatch):
+    commands = []
+
+    async def spawn(cmd_args, timeout):
+        commands.append(cmd_args)
+        raise TimeoutError
+
+    monkeypatch.setattr(base_command, "spawn", spawn)
+    profile = OCRProfile(dpi=200, psm=6, lang="por")
+    with pytest.raises(aiopytesseract.exceptions.TesseractTimeoutError):
+        await aiopytesseract.image_to_string(IMAGE, dpi=70, psm=14, profile=profile)
+    assert commands == [profile.cmd_args("txt")]
+
+
+@pytest.mark.parametrize(
+    "command, extra, psm",
+    [
+        ("image_to_data", ["-c", "tessedit_create_tsv=1"], 6),
+        ("image_to_boxes", ["batch.nochop", "makebox"], 6),
+        ("confidence", [], 0),
+        ("deskew", [], 2),
+    ],
+)
+async def test_cmdline_commands_use_profile_arguments(monkeypatch, command, extra, psm):
+    calls = []
+
+    async def spawn(cmd_args, timeout):
+        calls.append(cmd_args)
+        raise TimeoutError
+
+    monkeypatch.setattr(aiopytesseract.commands, "spawn", spawn)
+    profile = OCRProfile(psm=6, oem=1, lang="por", config=[("a", "1")])
+    with pytest.raises(aiopytesseract.exceptions.TesseractTimeoutError):
+        await getattr(aiopytesseract.commands, command)(IMAGE, profile=profile)
+    (cmd_args,) = calls
+    expected = attrs.evolve(profile, psm=psm).cmd_args("")
+    if command == "deskew":
+        expected[expected.index("stdin")] = IMAGE
+    assert cmd_args == expected + extra
+
+
+@pytest.mark.parametrize(
+    "command",
+    [aiopytesseract.image_to_boxes, aiopytesseract.image_to_data],
+)
+async def test_profile_with_cmdline_commands(command):
+    profile = OCRProfile(tessdata_dir="tests/samples/tessdata_fast")
+    assert await command(IMAGE, profile=profile)
+
+
+async def test_derived_profiles_are_cached(monkeypatch):
+    async def resolve_language(image, timeout, tessdata_dir):
+        return "por"
+
+    monkeypatch.setattr(base_command, "resolve_language", resolve_language)
+    profile = OCRProfile(lang="auto")
+    image = Path(IMAGE).read_bytes()
+    first = await base_command.profile_cmd_args(image, profile, "txt", 1, dpi=150)
+    hits = base_command._derived_profile.cache_info().hits
+    second = await base_command.profile_cmd_args(image, profile, "txt", 1, dpi=150)
+    assert first == second
+    assert first[first.index("-l") + 1] == "por"
+    assert base_command._derived_profile.cache_info().hits == hits + 1
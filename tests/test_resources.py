@@ -0,0 +1,161 @@
+import asyncio
+import os
+import sys
+from contextlib import contextmanager
+
+import pytest
+
+from aiopytesseract import accounting, base_command, resources
+from aiopytesseract.resources import (
+    ResourcePolicy,
+    current_resource_policy,
+    pool_context,
+    resource_policy,
+)
+
+linux_only = pytest.mark.skipif(sys.platform != "linux", reason="Linux only")
+
+CHILD = (
+    "import os, resource, sys; sys.stdin.read(); "
+    "print(os.environ.get('OMP_THREAD_LIMIT'), sorted(os.sched_getaffinity(0)), "
+    "os.getpriority(os.PRIO_PROCESS, 0), resource.getrlimit(resource.RLIMIT_AS)[0])"
+)
+
+
+@contextmanager
+def accounting_collector():
+    # spawns through the Popen based path of `accounted`
+    token = accounting._usage.set([])
+    try:
+        yield
+    finally:
+        accounting._usage.reset(token)
+
+
+@pytest.fixture
+def python_as_tesseract(monkeypatch):
+    monkeypatch.setattr(base_command, "TESSERACT_CMD", sys.executable)
+
+
+@pytest.mark.parametrize(
+    "concurrency, omp_thread_limit, cpu_sets",
+    [
+        (4, 2, [{0, 1}, {2, 3}, {4, 5}, {6, 7}]),
+        (3, 3, [{0, 1, 2}, {3, 4, 5}, {6, 7}]),
+        (16, 1, [{cpu} for cpu in range(8)]),
+        (None, 1, [{cpu} for cpu in range(8)]),
+    ],
+)
+def test_for_pool(monkeypatch, concurrency, omp_thread_limit, cpu_sets):
+    monkeypatch.setattr(resources, "_available_cpus", lambda: set(range(8)))
+    policy = ResourcePolicy.for_pool(concurrency, pin_cpus=True)
+    assert policy.omp_thread_limit == omp_thread_limit
+    assert [set(cpus) for cpus in policy.cpu_sets] == cpu_sets
+    # only the thread limit by default, which keeps posix_spawn usable
+    policy = ResourcePolicy.for_pool(concurrency)
+    assert policy == ResourcePolicy(omp_thread_limit=omp_thread_limit)
+    assert policy.preexec(policy.reserve()) is None
+
+
+def test_environment():
+    assert ResourcePolicy().environment() == {}
+    policy = ResourcePolicy(omp_thread_limit=3, cpu_sets=[{0, 1, 2}, {3, 4}])
+    assert policy.environment() == {"OMP_THREAD_LIMIT": "3"}
+    # capped at the size of the process' CPU set
+    assert policy.environment(1) == {"OMP_THREAD_LIMIT": "2"}
+
+
+def test_cpu_sets_are_frozen():
+    policy = ResourcePolicy(cpu_sets=[[0, 1], {2}])
+    assert policy.cpu_sets == (frozenset({0, 1}), frozenset({2}))
+    assert hash(policy) == hash(ResourcePolicy(cpu_sets=({0, 1}, {2})))
+
+
+def test_no_preexec_without_limits():
+    assert ResourcePolicy(omp_thread_limit=1).preexec() is None
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"omp_thread_limit": 0}, {"nice": -1}, {"memory_limit": 0}]
+)
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        ResourcePolicy(**kwargs)
+
+
+def test_resource_policy_context():
+    policy = ResourcePolicy(nice=1)
+    assert current_resource_policy() is None
+    with resource_policy(policy):
+        assert current_resource_policy() is policy
+    assert current_resource_policy() is None
+
+
+def test_pool_context():
+    context = pool_context(2)
+    assert context.run(current_resource_policy).omp_thread_limit >= 1
+    assert current_resource_policy() is None
+    policy = ResourcePolicy()
+    with resource_policy(policy):
+        assert pool_context(2).run(current_resource_policy) is policy
+
+
+async def test_spawn_without_policy(python_as_tesseract):
+    proc = await base_command.spawn(["-c", "import sys; sys.stdin.read()"], 10)
+    await base_command.communicate(proc, b"", 10)
+    assert proc.returncode == 0
+
+
+@linux_only
+async def test_spawn_applies_policy(python_as_tesseract):
+    cpu = min(os.sched_getaffinity(0))
+    policy = ResourcePolicy(
+        omp_thread_limit=1,
+        cpu_sets=(frozenset({cpu}),),
+        nice=3,
+        memory_limit=2**34,
+    )
+    niceness = os.getpriority(os.PRIO_PROCESS, 0)
+    with resource_policy(policy):
+        proc = await base_command.spawn(["-c", CHILD], 10)
+    stdout, _ = await base_command.communicate(proc, b"", 10)
+    assert stdout.decode().split() == ["1", f"[{cpu}]", str(niceness + 3), str(2**34)]
+    await asyncio.sleep(0)
+    assert policy._in_use == [0]
+
+
+@linux_only
+async def test_policy_applies_before_exec(python_as_tesseract):
+    # the limits are already in place when the program starts
+    cpu = min(os.sched_getaffinity(0))
+    policy = ResourcePolicy(cpu_sets=[{cpu}], memory_limit=2**34)
+    with resource_policy(policy), accounting_collector():
+        proc = await base_command.spawn(["-c", CHILD], 10)
+    stdout, _ = await base_command.communicate(proc, b"", 10)
+    assert stdout.decode().split()[1:4:2] == [f"[{cpu}]", str(2**34)]
+
+
+@linux_only
+async def test_spawn_pins_least_used_cpu_set(python_as_tesseract):
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 2:
+        pytest.skip("needs two CPUs")
+    policy = ResourcePolicy(cpu_sets=(frozenset(cpus[:1]), frozenset(cpus[1:2])))
+    with resource_policy(policy):
+        procs = [await base_command.spawn(["-c", CHILD], 10) for _ in range(2)]
+    assert policy._in_use == [1, 1]
+    outputs = [await base_command.communicate(proc, b"", 10) for proc in procs]
+    assert [stdout.split()[1] for stdout, _ in outputs] == [
+        f"[{cpus[0]}]".encode(),
+        f"[{cpus[1]}]".encode(),
+    ]
+
+
+async def test_cancel_kills_process(python_as_tesseract):
+    proc = await base_command.spawn(["-c", "import time; time.sleep(30)"], 10)
+    task = asyncio.create_task(base_command.communicate(proc, b"", 30))
+    await asyncio.sleep(0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert await asyncio.wait_for(proc.wait(), 5) != 0
@@ -0,0 +1,167 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aiopytesseract.exceptions import InvalidImageError
+from aiopytesseract.scheduler import Scheduler, ThroughputModel
+
+
+def _pnm(width, height):
+    return f"P5\n{width} {height}\n255\n".encode() + b"\x00" * (width * height)
+
+
+def test_throughput_model_prior():
+    model = ThroughputModel(prior=1000, overhead=0, safety_factor=2, min_timeout=1)
+    key = ("eng", 3, 3)
+    assert model.estimate(key, 10_000) == 10
+    assert model.timeout_for(key, 10_000) == 20
+    assert model.timeout_for(key, 10) == 1
+
+
+def test_throughput_model_ewma_per_key():
+    model = ThroughputModel(prior=1000, alpha=0.5, overhead=0)
+    model.observe(("eng", 3, 3), 4000, 1)
+    assert model.throughput(("eng", 3, 3)) == 4000
+    model.observe(("eng", 3, 3), 2000, 1)
+    assert model.throughput(("eng", 3, 3)) == 3000
+    assert model.throughput(("por", 3, 3)) == 1000
+
+
+def test_throughput_model_max_timeout():
+    model = ThroughputModel(prior=1, max_timeout=60)
+    assert model.timeout_for(("eng", 3, 3), 10**9) == 60
+
+
+@pytest.mark.parametrize("kwargs", [{"prior": 0}, {"alpha": 0}, {"alpha": 1.5}])
+def test_throughput_model_invalid(kwargs):
+    with pytest.raises(ValueError):
+        ThroughputModel(**kwargs)
+
+
+def test_scheduler_invalid_concurrency():
+    with pytest.raises(ValueError):
+        Scheduler(concurrency=-1)
+
+
+async def test_scheduler_derives_timeout_and_learns():
+    model = ThroughputModel(prior=1000, overhead=0, safety_factor=1, min_timeout=0)
+    scheduler = Scheduler(concurrency=1, model=model)
+    calls = []
+
+    async def command(image, **options):
+        calls.append(options)
+        return len(image)
+
+    await scheduler.run(command, _pnm(100, 100), lang="por", psm=6)
+    assert calls[0] == {"lang": "por", "psm": 6, "timeout": 10}
+    assert model.throughput(("por", 6, 3)) > 1000
+
+    await scheduler.run(command, _pnm(10, 10), timeout=1)
+    assert calls[1] == {"timeout": 1}
+
+
+async def test_scheduler_binds_positional_options():
+    model = ThroughputModel(prior=1000, overhead=0)
+    scheduler = Scheduler(concurrency=1, model=model)
+
+    async def command(image, dpi=300, lang="eng", timeout=30, psm=3):
+        return lang
+
+    assert await scheduler.run(command, _pnm(10, 10), 300, "por") == "por"
+    assert model.throughput(("por", 3, 3)) > 1000
+    assert model.throughput(("eng", 3, 3)) == 1000
+
+
+async def test_scheduler_reads_paths():
+    scheduler = Scheduler()
+
+    async def command(image, **options):
+        return image
+
+    image = await scheduler.run(command, "tests/samples/file-sample_150kB.png")
+    assert image == Path("tests/samples/file-sample_150kB.png").read_bytes()
+
+
+async def test_scheduler_rejects_invalid_image_before_queueing():
+    scheduler = Scheduler()
+
+    async def command(image, **options):
+        raise AssertionError("command should not run")
+
+    with pytest.raises(InvalidImageError):
+        await scheduler.run(command, b"junk")
+
+
+@pytest.mark.parametrize(
+    "shortest_first, expected",
+    [(True, ["blocker", 10, 100, 1000]), (False, ["blocker", 1000, 10, 100])],
+)
+async def test_scheduler_order(shortest_first, expected):
+    scheduler = Scheduler(concurrency=1, shortest_first=shortest_first, aging=0)
+    started = []
+    release = asyncio.Event()
+
+    async def command(image, name, **options):
+        started.append(name)
+        if name == "blocker":
+            await release.wait()
+
+    blocker = asyncio.create_task(scheduler.run(command, _pnm(1, 1), name="blocker"))
+    await asyncio.sleep(0)
+    jobs = [
+        asyncio.create_task(scheduler.run(command, _pnm(side, side), name=side))
+        for side in (1000, 10, 100)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 3
+    release.set()
+    await asyncio.gather(blocker, *jobs)
+    assert started == expected
+    assert scheduler.running == 0
+
+
+async def test_scheduler_aging_prevents_starvation():
+    model = ThroughputModel(prior=1000, overhead=0)
+    scheduler = Scheduler(concurrency=1, model=model, aging=1000)
+    started = []
+    release = asyncio.Event()
+
+    async def command(image, name, **options):
+        started.append(name)
+        if name == "blocker":
+            await release.wait()
+
+    blocker = asyncio.create_task(scheduler.run(command, _pnm(1, 1), name="blocker"))
+    await asyncio.sleep(0)
+    large = asyncio.create_task(scheduler.run(command, _pnm(100, 100), name="large"))
+    await asyncio.sleep(0.05)
+    small = asyncio.create_task(scheduler.run(command, _pnm(1, 1), name="small"))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocker, large, small)
+    assert started == ["blocker", "large", "small"]
+
+
+async def test_scheduler_cancel_queued_job():
+    scheduler = Scheduler(concurrency=1)
+    release = asyncio.Event()
+
+    async def command(image, **options):
+        await release.wait()
+        return "done"
+
+    first = asyncio.create_task(scheduler.run(command, _pnm(1, 1)))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(scheduler.run(command, _pnm(1, 1)))
+    await asyncio.sleep(0)
+    assert scheduler.queued == 1
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert scheduler.queued == 0
+    release.set()
+    assert await first == "done"
+    assert await scheduler.run(command, _pnm(1, 1)) == "done"
+    assert scheduler.running == 0
+    assert scheduler.queued == 0
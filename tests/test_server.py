@@ -0,0 +1,288 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aiopytesseract import commands, server
+from aiopytesseract.exceptions import (
+    InvalidImageError,
+    OCRServerError,
+    TesseractTimeoutError,
+)
+from aiopytesseract.models import Data
+from aiopytesseract.server import OCRClient, OCRServer
+
+
+class FakeTesseract:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def image_to_string(
+        self,
+        image: bytes,
+        lang: str = "eng",
+        psm: int = 3,
+        config=None,
+        preprocess=None,
+        tessdata_dir=None,
+        profile=None,
+    ) -> str:
+        self.calls.append((image, lang, psm, config))
+        await asyncio.sleep(self.delay)
+        if image == b"invalid":
+            raise InvalidImageError("unknown image format")
+        if image == b"slow":
+            raise TesseractTimeoutError(1)
+        return f"{image.decode()} {lang} {psm} {config}"
+
+    async def image_to_data(self, image: bytes, dpi: int = 300) -> list[Data]:
+        return [Data(5, 1, 1, 1, 1, 1, 10, 20, 30, 40, 96.5, image.decode())]
+
+    async def confidence(self, image: str, dpi: int = 300) -> float:
+        return float(len(Path(image).read_bytes()))
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    tesseract = FakeTesseract()
+    monkeypatch.setitem(
+        server._ROUTES, "image_to_string", server._route(tesseract.image_to_string)
+    )
+    monkeypatch.setitem(
+        server._ROUTES, "image_to_data", server._route(tesseract.image_to_data)
+    )
+    monkeypatch.setitem(
+        server._ROUTES, "confidence", server._file_route(tesseract.confidence)
+    )
+    return tesseract
+
+
+@pytest.fixture
+async def ocr_server(tmp_path, fake):
+    async with OCRServer(concurrency=2, cache_size=2) as ocr_server:
+        await ocr_server.start(str(tmp_path / "ocr.sock"))
+        yield ocr_server
+
+
+@pytest.fixture
+async def client(ocr_server):
+    async with OCRClient(ocr_server.address, pool_size=4) as client:
+        yield client
+
+
+def test_invalid_server_options():
+    with pytest.raises(ValueError):
+        OCRServer(concurrency=-1)
+    with pytest.raises(ValueError):
+        OCRServer(cache_size=-1)
+    with pytest.raises(ValueError):
+        OCRClient(pool_size=0)
+
+
+async def test_image_to_string(client, fake):
+    text = await client.image_to_string(
+        b"image", lang="por", psm=6, config=[("tessedit_char_whitelist", "0-9")]
+    )
+    assert text == "image por 6 [('tessedit_char_whitelist', '0-9')]"
+    assert fake.calls == [(b"image", "por", 6, [("tessedit_char_whitelist", "0-9")])]
+
+
+async def test_image_to_data(client):
+    assert await client.image_to_data(b"word") == [
+        Data(5, 1, 1, 1, 1, 1, 10, 20, 30, 40, 96.5, "word")
+    ]
+
+
+async def test_path_command_receives_temporary_file(client, tmp_path):
+    image = tmp_path / "image.png"
+    image.write_bytes(b"12345")
+    assert await client.confidence(str(image)) == 5.0
+
+
+async def test_cache(client, ocr_server, fake):
+    for _ in range(3):
+        assert await client.image_to_string(b"image") == "image eng 3 None"
+    await client.image_to_string(b"image", psm=6)
+    assert len(fake.calls) == 2
+    stats = await client.stats()
+    assert stats["cache_hits"] == 2
+    assert stats["cache_misses"] == 2
+    assert stats["cached"] == 2
+    await client.image_to_string(b"other")
+    assert ocr_server.stats["cached"] == 2
+
+
+async def test_identical_inflight_requests_run_once(client, fake):
+    fake.delay = 0.1
+    results = await asyncio.gather(
+        *(client.image_to_string(b"image") for _ in range(4))
+    )
+    assert results == ["image eng 3 None"] * 4
+    assert len(fake.calls) == 1
+
+
+async def test_concurrency_limit(client, ocr_server, fake):
+    fake.delay = 0.2
+    tasks = [
+        asyncio.create_task(client.image_to_string(str(index).encode()))
+        for index in range(4)
+    ]
+    await asyncio.sleep(0.1)
+    assert ocr_server.stats["running"] == 2
+    assert ocr_server.stats["queued"] == 2
+    await asyncio.gather(*tasks)
+    assert ocr_server.stats["running"] == 0
+
+
+async def test_cache_is_bounded_by_bytes(tmp_path, fake):
+    async with OCRServer(cache_bytes=64, max_cached_payload=32) as ocr_server:
+        await ocr_server.start(str(tmp_path / "ocr.sock"))
+        async with OCRClient(ocr_server.address) as client:
+            for index in range(4):
+                await client.image_to_string(f"image-{index}".encode())
+            # never cached, larger than max_cached_payload
+            await client.image_to_string(b"x" * 40)
+    stats = ocr_server.stats
+    assert stats["cached_bytes"] <= 64
+    assert stats["cached_bytes"] == sum(
+        len(body) for _, body in ocr_server._cache.values()
+    )
+    assert stats["cached"] == 3  # 18 bytes each
+
+
+async def test_socket_mode(tmp_path, fake):
+    path = tmp_path / "ocr.sock"
+    async with OCRServer() as ocr_server:
+        await ocr_server.start(str(path), socket_mode=0o660)
+        assert ocr_server.address == str(path)
+        assert path.stat().st_mode & 0o777 == 0o660
+        assert list(tmp_path.iterdir()) == [path]
+        async with OCRClient(ocr_server.address) as client:
+            assert await client.image_to_string(b"image") == "image eng 3 None"
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"config": [("debug_file", "owned.log")]},
+        {"tessdata_dir": "/etc"},
+        {"tessdata_dir": "tessdata/../../etc"},
+        {"profile": "anything"},
+        {"lang": "eng -c debug_file=owned.log --tessdata-dir /etc"},
+        {"lang": "eng+xyz"},
+    ],
+)
+async def test_rejected_options(client, fake, options):
+    with pytest.raises(OCRServerError) as excinfo:
+        await client.image_to_string(b"image", **options)
+    assert excinfo.value.status in (400, 403)
+    assert fake.calls == []
+
+
+async def test_injected_lang_never_reaches_tesseract(tmp_path, monkeypatch):
+    spawned = []
+
+    async def spawn(cmd_args, timeout):
+        spawned.append(cmd_args)
+        raise TimeoutError
+
+    monkeypatch.setattr(commands, "spawn", spawn)
+    async with OCRServer() as ocr_server:
+        await ocr_server.start(str(tmp_path / "ocr.sock"))
+        async with OCRClient(ocr_server.address) as client:
+            with pytest.raises(OCRServerError) as excinfo:
+                await client.image_to_data(
+                    Path("tests/samples/file-sample_150kB.png").read_bytes(),
+                    lang="eng -c debug_file=owned.log --tessdata-dir /etc",
+                )
+    assert excinfo.value.status == 400
+    assert spawned == []
+
+
+async def test_path_roots(tmp_path, fake):
+    tessdata = tmp_path / "tessdata"
+    tessdata.mkdir()
+    async with OCRServer(path_roots=[str(tessdata)]) as ocr_server:
+        await ocr_server.start(str(tmp_path / "ocr.sock"))
+        async with OCRClient(ocr_server.address) as client:
+            await client.image_to_string(b"image", tessdata_dir=str(tessdata))
+            with pytest.raises(OCRServerError) as excinfo:
+                await client.image_to_string(
+                    b"image", tessdata_dir=str(tessdata / "..")
+                )
+    assert excinfo.value.status == 403
+    assert len(fake.calls) == 1
+
+
+async def test_connection_reuse(client, ocr_server):
+    for index in range(5):
+        await client.image_to_string(str(index).encode())
+    assert len(client._idle) == 1
+
+
+async def test_reconnect_after_server_closed_connection(client):
+    await client.image_to_string(b"first")
+    _, writer = client._idle[0]
+    writer.transport.abort()
+    await asyncio.sleep(0)
+    assert await client.image_to_string(b"second") == "second eng 3 None"
+
+
+@pytest.mark.parametrize(
+    "image, options, exception, status",
+    [
+        (b"invalid", {}, OCRServerError, 400),
+        (b"image", {"psm": "six"}, OCRServerError, 400),
+        (b"image", {"oem": 1}, OCRServerError, 400),
+        (b"slow", {}, TesseractTimeoutError, None),
+    ],
+)
+async def test_errors(client, image, options, exception, status):
+    with pytest.raises(exception) as excinfo:
+        await client.image_to_string(image, **options)
+    if status is not None:
+        assert excinfo.value.status == status
+
+
+async def test_unknown_command(client):
+    with pytest.raises(OCRServerError) as excinfo:
+        await client._post("image_to_nothing", b"image", {})
+    assert excinfo.value.status == 404
+    assert excinfo.value.error == "UnknownCommand"
+
+
+async def test_request_too_large(tmp_path, fake):
+    async with OCRServer(max_request_size=4) as ocr_server:
+        await ocr_server.start(str(tmp_path / "ocr.sock"))
+        async with OCRClient(ocr_server.address) as client:
+            with pytest.raises(OCRServerError) as excinfo:
+                await client.image_to_string(b"too large")
+            assert excinfo.value.status == 413
+            # the connection was closed, the next request opens another one
+            assert await client.image_to_string(b"tiny") == "tiny eng 3 None"
+
+
+async def test_languages(client, monkeypatch):
+    async def get_languages():
+        return ["eng", "osd"]
+
+    monkeypatch.setattr(server, "get_languages", get_languages)
+    assert await client.languages() == ["eng", "osd"]
+
+
+async def test_tcp(fake):
+    async with OCRServer() as ocr_server:
+        await ocr_server.start(host="127.0.0.1", port=0)
+        host, port = ocr_server.address
+        async with OCRClient(host=host, port=port) as client:
+            assert await client.image_to_string(b"tcp") == "tcp eng 3 None"
+
+
+def test_parser():
+    options = server.parser().parse_args(
+        ["--unix", "/run/ocr.sock", "-j", "2", "--socket-mode", "660"]
+    )
+    assert options.unix == "/run/ocr.sock"
+    assert options.concurrency == 2
+    assert options.socket_mode == 0o660
@@ -0,0 +1,134 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from aiopytesseract import commands
+from aiopytesseract.exceptions import (
+    LanguageInvalidException,
+    NoSuchFileException,
+    TesseractRuntimeError,
+)
+from aiopytesseract.models import Data, LanguageRun, SpeculativeResult
+from aiopytesseract.speculative import mean_confidence, speculate
+
+IMAGE = b"P5\n4 4\n255\n" + b"\x00" * 16
+
+
+def words(*confs):
+    return [Data(1, 1, 0, 0, 0, 0, 0, 0, 10, 10, -1, "")] + [
+        Data(5, 1, 1, 1, 1, number, 0, 0, 10, 10, conf, "word")
+        for number, conf in enumerate(confs, 1)
+    ]
+
+
+@pytest.fixture
+def fake_runs(monkeypatch):
+    cancelled = []
+
+    def install(outcomes):
+        async def image_to_data(image, lang, **kwargs):
+            delay, result = outcomes[lang]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(lang)
+                raise
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        monkeypatch.setattr(commands, "image_to_data", image_to_data)
+        return cancelled
+
+    return install
+
+
+def test_mean_confidence():
+    assert mean_confidence(words(90, 80)) == (85, 2)
+    assert mean_confidence(words()) == (0, 0)
+
+
+async def test_best_confidence_wins(fake_runs):
+    fake_runs({"eng": (0.01, words(60, 70)), "deu": (0.02, words(80, 80))})
+    result = await speculate(IMAGE, ["eng", "deu"])
+    assert isinstance(result, SpeculativeResult)
+    assert result.lang == "deu"
+    assert result.conf == 80
+    assert [run.status for run in result.runs] == ["done", "done"]
+    assert result.runs[0].conf == 65
+    assert result.runs[0].words == 2
+
+
+async def test_confident_run_cancels_others(fake_runs):
+    cancelled = fake_runs({"eng": (0.01, words(95)), "deu": (10, words(99))})
+    result = await speculate(IMAGE, ["eng", "deu"])
+    assert result.lang == "eng"
+    assert cancelled == ["deu"]
+    assert result.runs[1] == LanguageRun("deu", "cancelled", result.runs[1].seconds)
+
+
+async def test_patience(fake_runs):
+    cancelled = fake_runs({"eng": (0.05, words(50)), "deu": (10, words(99))})
+    result = await speculate(IMAGE, ["eng", "deu"], patience=2)
+    assert result.lang == "eng"
+    assert cancelled == ["deu"]
+    assert result.runs[1].seconds < 1
+
+
+async def test_tie_prefers_first_language(fake_runs):
+    fake_runs({"eng": (0.02, words(70)), "deu": (0.01, words(70))})
+    assert (await speculate(IMAGE, ["eng", "deu"])).lang == "eng"
+
+
+async def test_failed_runs(fake_runs):
+    fake_runs(
+        {
+            "eng": (0.01, TesseractRuntimeError("no eng")),
+            "deu": (0.02, words(40)),
+        }
+    )
+    result = await speculate(IMAGE, ["eng", "deu"])
+    assert result.lang == "deu"
+    assert result.runs[0].status == "failed"
+    fake_runs({"eng": (0.01, TesseractRuntimeError("no eng"))})
+    with pytest.raises(TesseractRuntimeError, match="no eng"):
+        await speculate(IMAGE, ["eng"])
+
+
+async def test_cancellation_cancels_runs(fake_runs):
+    cancelled = fake_runs({"eng": (10, words(90)), "deu": (10, words(90))})
+    task = asyncio.create_task(speculate(IMAGE, ["eng", "deu"]))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert sorted(cancelled) == ["deu", "eng"]
+
+
+@pytest.mark.parametrize(
+    "languages, kwargs, exception",
+    [
+        ([], {}, ValueError),
+        (["eng", "eng"], {}, ValueError),
+        (["eng", "xxx"], {}, LanguageInvalidException),
+        (["eng"], {"patience": 0.5}, ValueError),
+    ],
+)
+async def test_invalid(languages, kwargs, exception):
+    with pytest.raises(exception):
+        await speculate(IMAGE, languages, **kwargs)
+
+
+async def test_missing_file():
+    with pytest.raises(NoSuchFileException):
+        await speculate("missing.png", ["eng"])
+
+
+async def test_speculate_with_tesseract():
+    result = await speculate(
+        Path("tests/samples/file-sample_150kB.png").read_bytes(), ["eng", "por"]
+    )
+    assert result.lang in ("eng", "por")
+    assert all(run.status in ("done", "cancelled") for run in result.runs)
+    assert any(row.text for row in result.data)
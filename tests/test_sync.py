@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from aiopytesseract import sync
+from aiopytesseract.resources import current_resource_policy
+from aiopytesseract.sync import SyncClient
+
+
+async def echo(image, delay=0.0):
+    await asyncio.sleep(delay)
+    return image
+
+
+async def fail(image):
+    raise ValueError(image)
+
+
+@pytest.fixture
+def client():
+    with SyncClient(concurrency=4) as client:
+        yield client
+
+
+def test_invalid_concurrency():
+    with pytest.raises(ValueError):
+        SyncClient(concurrency=-1)
+
+
+def test_submit_returns_concurrent_future(client):
+    future = client.submit(echo, "image")
+    assert future.result(timeout=5) == "image"
+
+
+def test_submit_runs_concurrently(client):
+    started = time.perf_counter()
+    futures = [client.submit(echo, index, delay=0.2) for index in range(4)]
+    assert [future.result(timeout=5) for future in futures] == [0, 1, 2, 3]
+    assert time.perf_counter() - started < 0.6
+
+
+def test_concurrency_limit():
+    running = peak = 0
+
+    async def track(image):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return image
+
+    with SyncClient(concurrency=2) as client:
+        assert list(client.map(track, range(8))) == list(range(8))
+    assert peak == 2
+
+
+def test_map_ordered_with_options(client):
+    results = client.map(partial(echo, delay=0.01), ["a", "b", "c"])
+    assert list(results) == ["a", "b", "c"]
+
+
+def test_map_raises_first_error(client):
+    with pytest.raises(ValueError, match="bad"):
+        list(client.map(fail, ["bad"]))
+
+
+def test_map_timeout(client):
+    with pytest.raises(TimeoutError):
+        list(client.map(partial(echo, delay=1), ["slow"], timeout=0.05))
+
+
+def test_runs_in_background_thread_with_pool_policy(client):
+    async def where(image):
+        return threading.current_thread().name, current_resource_policy()
+
+    name, policy = client.submit(where, None).result(timeout=5)
+    assert name == "aiopytesseract"
+    assert policy is client.policy
+
+
+def test_image_to_string(client, monkeypatch):
+    calls = []
+
+    async def image_to_string(image, **options):
+        calls.append(options)
+        return "text"
+
+    monkeypatch.setattr(sync, "image_to_string", image_to_string)
+    assert client.image_to_string(b"image", lang="por") == "text"
+    assert calls == [{"lang": "por"}]
+
+
+def test_image_to_data(client, monkeypatch):
+    async def image_to_data(image, **options):
+        return []
+
+    monkeypatch.setattr(sync, "image_to_data", image_to_data)
+    assert client.image_to_data(b"image") == []
+
+
+def test_close_waits_for_pending_calls():
+    client = SyncClient()
+    future = client.submit(echo, "image", delay=0.05)
+    client.close()
+    assert future.result(timeout=0) == "image"
+    with pytest.raises(RuntimeError):
+        client.submit(echo, "image")
+    client.close()
+
+
+def test_close_without_wait_cancels():
+    client = SyncClient()
+    future = client.submit(echo, "image", delay=10)
+    client.close(wait=False)
+    assert future.cancelled()
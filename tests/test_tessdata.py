@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import tessdata
+from aiopytesseract.base_command import _build_cmd_args
+from aiopytesseract.exceptions import NoSuchFileException, TessdataStagingError
+from aiopytesseract.models import WarmupReport
+
+
+@pytest.fixture
+def source(tmp_path):
+    directory = tmp_path / "tessdata"
+    (directory / "configs").mkdir(parents=True)
+    (directory / "configs" / "hocr").write_text("tessedit_create_hocr 1\n")
+    (directory / "eng.traineddata").write_bytes(b"eng" * 1000)
+    (directory / "por.traineddata").write_bytes(b"por" * 1000)
+    (directory / "osd.traineddata").write_bytes(b"osd" * 1000)
+    (directory / "pdf.ttf").write_bytes(b"font")
+    yield str(directory)
+    tessdata.unstage_tessdata(str(directory))
+    tessdata.unstage_tessdata()
+
+
+async def test_warm_tessdata(source, tmp_path):
+    staging = tmp_path / "staging"
+    report = await aiopytesseract.warm_tessdata("eng+por", source, str(staging))
+    assert isinstance(report, WarmupReport)
+    assert report.languages == ("eng", "por")
+    assert report.linked + report.copied == 3
+    assert report.reused == 0
+    assert report.size == 6004
+    assert report.seconds > 0
+    assert str(report).startswith(f"eng+por staged in {staging}")
+    assert (staging / "eng.traineddata").read_bytes() == b"eng" * 1000
+    assert (staging / "configs" / "hocr").exists()
+    assert (staging / "pdf.ttf").exists()
+    assert not (staging / "osd.traineddata").exists()
+
+
+async def test_warm_tessdata_reuses_staged_files(source, tmp_path):
+    staging = str(tmp_path / "staging")
+    await tessdata.warm_tessdata("eng", source, staging)
+    report = await tessdata.warm_tessdata(["por"], source, staging)
+    assert report.languages == ("eng", "por")
+    assert report.reused == 2
+    assert report.linked + report.copied == 1
+
+
+async def test_warm_tessdata_restages_changed_files(source, tmp_path):
+    staging = tmp_path / "staging"
+    await tessdata.warm_tessdata("eng", source, str(staging))
+    (staging / "eng.traineddata").unlink()
+    (staging / "eng.traineddata").write_bytes(b"stale")
+    report = await tessdata.warm_tessdata("eng", source, str(staging))
+    assert report.reused == 1  # pdf.ttf
+    assert (staging / "eng.traineddata").read_bytes() == b"eng" * 1000
+
+
+async def test_warm_tessdata_missing_language(source, tmp_path):
+    with pytest.raises(NoSuchFileException):
+        await tessdata.warm_tessdata("fra", source, str(tmp_path / "staging"))
+    assert tessdata.staged_tessdata_dir(source, "fra") == source
+
+
+async def test_warm_tessdata_default_dir(source, tmp_path, monkeypatch):
+    monkeypatch.setenv("TESSDATA_PREFIX", source)
+    monkeypatch.setattr(tessdata, "AIOPYTESSERACT_TESSDATA_STAGING_ROOT", str(tmp_path))
+    report = await tessdata.warm_tessdata("eng")
+    assert report.tessdata_dir == source
+    assert report.staging_dir.startswith(f"{tmp_path}/aiopytesseract-tessdata-")
+    assert tessdata.staged_tessdata_dir(None, "eng") == report.staging_dir
+
+
+async def test_staged_tessdata_dir(source, tmp_path):
+    staging = str(tmp_path / "staging")
+    assert tessdata.staged_tessdata_dir(source, "eng") == source
+    await tessdata.warm_tessdata("eng+por", source, staging)
+    assert tessdata.staged_tessdata_dir(source, "eng+por") == staging
+    assert tessdata.staged_tessdata_dir(f"{source}/", "por") == staging
+    assert tessdata.staged_tessdata_dir(source, None) == staging
+    assert tessdata.staged_tessdata_dir(source, "eng+fra") == source
+    assert tessdata.staged_tessdata_dir(source, "eng", psm=0) == source
+    assert tessdata.staged_tessdata_dir(source, "eng", psm=12) == source
+    assert tessdata.staged_tessdata_dir(None, "eng") is None
+    tessdata.unstage_tessdata(source)
+    assert tessdata.staged_tessdata_dir(source, "eng") == source
+
+
+async def test_commands_use_staged_dir(source, tmp_path):
+    staging = str(tmp_path / "staging")
+    await tessdata.warm_tessdata("eng+osd", source, staging)
+    args = await _build_cmd_args("txt", 300, 0, 3, tessdata_dir=source, lang="eng")
+    assert args[:2] == ["--tessdata-dir", staging]
+    args = await _build_cmd_args("txt", 300, 3, 3, tessdata_dir=source, lang="por")
+    assert args[:2] == ["--tessdata-dir", source]
+    assert tessdata.staged_tessdata_dir(source, "eng", psm=12) == staging
+
+
+async def test_copies_are_verified_against_the_source(source, tmp_path, monkeypatch):
+    def link(src, dst):
+        raise OSError("cross-device link")
+
+    copyfile = tessdata.shutil.copyfile
+
+    def corrupt(src, dst, **kwargs):
+        if Path(src).suffix != ".traineddata":
+            return copyfile(src, dst, **kwargs)
+        Path(dst).write_bytes(b"corrupt")
+        return dst
+
+    monkeypatch.setattr(tessdata.os, "link", link)
+    monkeypatch.setattr(tessdata.shutil, "copyfile", corrupt)
+    staging = tmp_path / "staging"
+    with pytest.raises(TessdataStagingError):
+        await tessdata.warm_tessdata("eng", source, str(staging))
+    assert not (staging / "eng.traineddata").exists()
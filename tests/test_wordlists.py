@@ -0,0 +1,115 @@
+import gc
+from pathlib import Path
+
+import pytest
+
+import aiopytesseract
+from aiopytesseract import base_command, wordlists
+from aiopytesseract.profile import OCRProfile
+from aiopytesseract.wordlists import (
+    acquire,
+    release,
+    wordlist_content,
+    wordlist_files,
+)
+
+IMAGE = Path("tests/samples/file-sample_150kB.png").read_bytes()
+
+
+@pytest.fixture
+def spawned(monkeypatch):
+    # user words and patterns files as tesseract sees them at spawn time
+    files = []
+    spawn = base_command.spawn
+
+    async def recording_spawn(cmd_args, timeout):
+        for option in ("--user-words", "--user-patterns"):
+            if option in cmd_args:
+                path = Path(cmd_args[cmd_args.index(option) + 1])
+                files.append((option, path, path.read_bytes()))
+        return await spawn(cmd_args, timeout)
+
+    monkeypatch.setattr(base_command, "spawn", recording_spawn)
+    return files
+
+
+def test_wordlist_content():
+    assert wordlist_content(["invoice", "iban"]) == b"invoice\niban\n"
+    assert wordlist_content(word for word in ("ação",)) == "ação\n".encode()
+    assert wordlist_content(b"raw\n") == b"raw\n"
+    assert wordlist_content([]) == b""
+    with pytest.raises(ValueError, match="single lines"):
+        wordlist_content(["two\nlines"])
+
+
+def test_acquire_is_content_hashed_and_refcounted():
+    first = acquire(b"refcounted\n")
+    second = acquire(b"refcounted\n")
+    assert first == second
+    assert Path(first).read_bytes() == b"refcounted\n"
+    other = acquire(b"other\n")
+    assert other != first
+    release(other)
+    release(first)
+    release(second)
+    # idle files are kept for reuse
+    assert Path(first).exists()
+    assert acquire(b"refcounted\n") == first
+    release(first)
+
+
+def test_idle_files_are_evicted(monkeypatch):
+    monkeypatch.setattr(wordlists, "AIOPYTESSERACT_MAX_IDLE_WORDLISTS", 2)
+    paths = [acquire(f"evict {n}\n".encode()) for n in range(4)]
+    for path in paths:
+        release(path)
+    assert [Path(path).exists() for path in paths] == [False, False, True, True]
+
+
+def test_wordlist_files():
+    with wordlist_files("words.txt", None) as paths:
+        assert paths == ("words.txt", None)
+    with wordlist_files(["alpha"], b"\\d\\d\n") as (words, patterns):
+        assert Path(words).read_bytes() == b"alpha\n"
+        assert Path(patterns).read_bytes() == b"\\d\\d\n"
+    assert wordlists._references == {}
+
+
+async def test_in_memory_lists(spawned):
+    await aiopytesseract.image_to_string(
+        IMAGE, user_words=["customer", "acme"], user_patterns=b"\\d\\d-\\d\\d\n"
+    )
+    await aiopytesseract.image_to_string(IMAGE, user_words=["customer", "acme"])
+    words = [entry for entry in spawned if entry[0] == "--user-words"]
+    assert [content for _, _, content in words] == [b"customer\nacme\n"] * 2
+    assert words[0][1] == words[1][1]
+    assert ("--user-patterns", spawned[1][1], b"\\d\\d-\\d\\d\n") in spawned
+    assert wordlists._references == {}
+
+
+async def test_in_memory_lists_stream(spawned):
+    async with aiopytesseract.run(IMAGE, "output", "txt", user_words=["streamed"]):
+        pass
+    lines = [
+        line
+        async for line in aiopytesseract.image_to_alto_lines(
+            IMAGE, user_words=("alto",)
+        )
+    ]
+    assert lines
+    assert [content for _, _, content in spawned] == [b"streamed\n", b"alto\n"]
+    assert wordlists._references == {}
+
+
+async def test_profile(spawned):
+    profile = OCRProfile(user_words=["profiled"])
+    assert profile.user_words == b"profiled\n"
+    assert profile == OCRProfile(user_words=b"profiled\n")
+    assert profile.key == OCRProfile(user_words=("profiled",)).key
+    assert profile.key != OCRProfile(user_patterns=["profiled"]).key
+    await aiopytesseract.image_to_string(IMAGE, profile=profile)
+    assert spawned[0][2] == b"profiled\n"
+    path = str(spawned[0][1])
+    del profile
+    gc.collect()
+    assert Path(path).stem not in wordlists._references